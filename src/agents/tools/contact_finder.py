@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from src.signal_engine.enrichment.apollo_client import ApolloClient
@@ -21,7 +22,7 @@ async def find_contacts_via_apollo(
             titles=titles,
             limit=limit,
         )
-        return [p.__dict__ for p in people]
+        return [asdict(p) for p in people]
     finally:
         await client.aclose()
 
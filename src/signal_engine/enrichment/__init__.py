@@ -1,14 +1,26 @@
 """Lead enrichment (company + decision maker discovery)."""
 
-from src.signal_engine.enrichment.apollo_client import ApolloClient, ApolloCompany, ApolloPerson
+from src.signal_engine.enrichment.apollo_client import (
+    ApolloClient,
+    ApolloCompany,
+    ApolloPerson,
+    lookup_company,
+)
 from src.signal_engine.enrichment.company_enricher import (
     EnrichmentInputs,
     enrich_permit_to_lead,
+    enrich_permits_to_leads,
+)
+from src.signal_engine.enrichment.geocoder import (
+    GeocodeResult,
+    Geocoder,
+    geocode_address,
+    geocode_addresses,
 )
-from src.signal_engine.enrichment.geocoder import GeocodeResult, Geocoder, geocode_address
 from src.signal_engine.enrichment.hunter_client import (
     HunterClient,
     HunterEmailResult,
+    HunterError,
     MockHunterClient,
 )
 from src.signal_engine.enrichment.provider_manager import (
@@ -25,13 +37,17 @@ __all__ = [
     "ApolloClient",
     "ApolloCompany",
     "ApolloPerson",
+    "lookup_company",
     "EnrichmentInputs",
     "enrich_permit_to_lead",
+    "enrich_permits_to_leads",
     "GeocodeResult",
     "Geocoder",
     "geocode_address",
+    "geocode_addresses",
     "HunterClient",
     "HunterEmailResult",
+    "HunterError",
     "MockHunterClient",
     "CreditGuard",
     "EnrichmentProvider",
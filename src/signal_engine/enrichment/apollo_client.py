@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 
 import httpx
 
+from src.signal_engine.enrichment.clearbit_client import ClearbitClient, ClearbitCompany
+from src.signal_engine.enrichment.client_pool import send_capped
+from src.signal_engine.enrichment.provider_limits import provider_slot
+
 logger = logging.getLogger(__name__)
 
+# Stop reading (and reject) responses larger than this many bytes.
+_MAX_RESPONSE_BYTES = 2_000_000
+
 
 class ApolloError(RuntimeError):
     pass
@@ -22,7 +31,65 @@ class ApolloAuthError(ApolloError):
     """Apollo auth/plan error (401/402/403)."""
 
 
-@dataclass(frozen=True)
+# Default decision-maker titles used by find_decision_maker().
+_DECISION_MAKER_TITLES: tuple[str, ...] = (
+    "Facility Director",
+    "Facilities Director",
+    "Facilities Manager",
+    "Director of Facilities",
+    "Building Engineer",
+    "Chief Engineer",
+)
+
+# Broader title set used by find_decision_makers_enhanced().
+_ENHANCED_DECISION_MAKER_TITLES: tuple[str, ...] = (
+    "Facility Director",
+    "Facilities Director",
+    "Facilities Manager",
+    "Director of Facilities",
+    "Building Manager",
+    "Building Engineer",
+    "Chief Engineer",
+    "Property Manager",
+)
+
+# Lowercased default titles, for O(1) "is this a known decision-maker title" checks.
+_DECISION_MAKER_TITLES_LC: frozenset[str] = frozenset(t.lower() for t in _DECISION_MAKER_TITLES)
+
+# Title keyword -> ranking weight, checked in order (first match wins).
+_TITLE_PRIORITY: tuple[tuple[str, int], ...] = (
+    ("facility director", 10),
+    ("facilities director", 10),
+    ("director of facilities", 10),
+    ("facilities manager", 8),
+    ("building manager", 8),
+    ("building engineer", 6),
+    ("chief engineer", 6),
+    ("property manager", 4),
+)
+
+
+def _title_matches(title: str, wanted: frozenset[str]) -> bool:
+    """Exact (set lookup) or keyword match of a lowercased title against wanted titles."""
+    return title in wanted or any(keyword in title for keyword in wanted)
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_domain(url: str | None) -> str | None:
+    """
+    Normalize a website URL to a bare domain (no scheme, "www." or path).
+
+    Memoized because the same company websites recur across leads in bulk runs.
+    """
+    if not url:
+        return None
+    host = urlsplit(url if "://" in url else f"http://{url}").hostname
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+@dataclass(frozen=True, slots=True)
 class ApolloPerson:
     full_name: str | None = None
     title: str | None = None
@@ -31,7 +98,7 @@ class ApolloPerson:
     linkedin_url: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApolloCompany:
     name: str
     website: str | None = None
@@ -64,7 +131,14 @@ class ApolloClient:
             "X-Api-Key": api_key,
             "Content-Type": "application/json",
         }
-        self._client = httpx.AsyncClient(timeout=timeout_s)
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=timeout_s, write=10.0, pool=5.0),
+            # httpx ignores the client's limits= when a transport is given.
+            transport=httpx.AsyncHTTPTransport(
+                retries=0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
 
     async def aclose(self) -> None:
         await self._client.aclose()
@@ -80,16 +154,19 @@ class ApolloClient:
         """
         POST helper with basic retry/backoff for rate limiting and transient errors.
         """
+        request = self._client.build_request("POST", url, json=payload, headers=self._headers)
         last_exc: Exception | None = None
         for attempt in range(retries + 1):
             try:
-                resp = await self._client.post(url, json=payload, headers=self._headers)
+                resp = await send_capped(self._client, request, _MAX_RESPONSE_BYTES)
             except httpx.HTTPError as exc:
                 last_exc = exc
                 if attempt >= retries:
                     raise
                 await asyncio.sleep(min(backoff_s * (2**attempt), 10))
                 continue
+            if resp is None:
+                raise ApolloError(f"Apollo response larger than {_MAX_RESPONSE_BYTES} bytes")
 
             if resp.status_code in (429, 500, 502, 503, 504):
                 if attempt >= retries:
@@ -138,14 +215,7 @@ class ApolloClient:
         - Use organizations/search to get domain or org id
         - Use mixed_people/organization_top_people to list top people
         """
-        titles = titles or [
-            "Facility Director",
-            "Facilities Director",
-            "Facilities Manager",
-            "Director of Facilities",
-            "Building Engineer",
-            "Chief Engineer",
-        ]
+        wanted = frozenset(t.lower() for t in titles) if titles else _DECISION_MAKER_TITLES_LC
 
         # Resolve domain/org id via organizations/search if we only have a name.
         resolved_domain = company_domain
@@ -163,13 +233,8 @@ class ApolloClient:
         )
 
         # Filter by title keywords if provided (Apollo top people may include all roles).
-        if titles:
-            title_lowers = [t.lower() for t in titles]
-            people = [
-                p
-                for p in people
-                if p.title and any(t in p.title.lower() for t in title_lowers)
-            ]
+        if wanted:
+            people = [p for p in people if p.title and _title_matches(p.title.lower(), wanted)]
             if not people:
                 # Fall back to unfiltered top people if nothing matched.
                 people = await self.get_organization_top_people(
@@ -221,7 +286,8 @@ class ApolloClient:
             raise ApolloRateLimitError(f"Apollo rate limited (429): {resp.text}")
         if resp.status_code >= 400:
             # If search fails (e.g., 422), return None (not an error)
-            logger.debug(f"Organization search returned {resp.status_code}: {resp.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Organization search returned %s: %s", resp.status_code, resp.text)
             return None
 
         data = resp.json()
@@ -237,17 +303,7 @@ class ApolloClient:
         website_url = org.get("website_url") or org.get("website")
         
         # Use primary_domain if available (cleanest), otherwise extract from website_url
-        domain = None
-        if primary_domain:
-            domain = primary_domain
-        elif website_url:
-            # Extract domain from URL
-            domain = (
-                website_url.replace("https://", "")
-                .replace("http://", "")
-                .replace("www.", "")
-                .split("/")[0]
-            )
+        domain = primary_domain or _extract_domain(website_url)
 
         return ApolloCompany(
             name=org.get("name") or company_name,
@@ -311,7 +367,8 @@ class ApolloClient:
             )
 
         if resp.status_code >= 400:
-            logger.debug(f"Organization top people returned {resp.status_code}: {resp.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Organization top people returned %s: %s", resp.status_code, resp.text)
             return []
 
         data = resp.json()
@@ -365,7 +422,8 @@ class ApolloClient:
         if resp.status_code == 429:
             raise ApolloRateLimitError(f"Apollo rate limited (429): {resp.text}")
         if resp.status_code >= 400:
-            logger.debug(f"People search returned {resp.status_code}: {resp.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("People search returned %s: %s", resp.status_code, resp.text)
             return []
 
         data = resp.json()
@@ -445,16 +503,7 @@ class ApolloClient:
         Returns:
             List of ApolloPerson objects, ranked by relevance
         """
-        titles = titles or [
-            "Facility Director",
-            "Facilities Director",
-            "Facilities Manager",
-            "Director of Facilities",
-            "Building Manager",
-            "Building Engineer",
-            "Chief Engineer",
-            "Property Manager",
-        ]
+        titles = titles or list(_ENHANCED_DECISION_MAKER_TITLES)
 
         all_results: list[ApolloPerson] = []
 
@@ -470,34 +519,22 @@ class ApolloClient:
                 )
                 all_results.extend(results)
             except Exception as e:
-                logger.debug(f"Strategy 1 (org top people) failed: {e}")
+                logger.debug("Strategy 1 (org top people) failed: %s", e)
 
-        # Deduplicate by email (if available) or name
-        seen = set()
-        unique_results = []
+        # Deduplicate by email (if available) or name, keeping first occurrence
+        by_key: dict[str, ApolloPerson] = {}
         for person in all_results:
             key = person.email or person.full_name
-            if key and key not in seen:
-                seen.add(key)
-                unique_results.append(person)
+            if key:
+                by_key.setdefault(key, person)
+        unique_results = list(by_key.values())
 
         # Rank results by title relevance
-        title_priority = {
-            "facility director": 10,
-            "facilities director": 10,
-            "director of facilities": 10,
-            "facilities manager": 8,
-            "building manager": 8,
-            "building engineer": 6,
-            "chief engineer": 6,
-            "property manager": 4,
-        }
-
         def rank_person(person: ApolloPerson) -> float:
             score = 0.0
             if person.title:
                 title_lower = person.title.lower()
-                for keyword, priority in title_priority.items():
+                for keyword, priority in _TITLE_PRIORITY:
                     if keyword in title_lower:
                         score += priority
                         break
@@ -519,3 +556,46 @@ class ApolloClient:
         return unique_results[:limit]
 
 
+async def lookup_company(
+    name: str,
+    location: str | None,
+    apollo: ApolloClient,
+    clearbit: ClearbitClient,
+    *,
+    raise_errors: bool = False,
+) -> tuple[ApolloCompany | None, ClearbitCompany | None]:
+    """
+    Look up a company on Apollo and Clearbit concurrently.
+
+    Both lookups are independent, so latency is max(apollo, clearbit) rather than
+    the sum. Callers should prefer the Apollo result and fall back to Clearbit's
+    domain. Apollo auth/rate-limit errors are re-raised so callers can trip their
+    circuit breaker; any other provider failure is logged and reported as None, or
+    re-raised with raise_errors=True so a caller that persists the result doesn't
+    record a failed lookup as "not found".
+    """
+
+    async def _apollo() -> ApolloCompany | None:
+        async with provider_slot("apollo"):
+            return await apollo.search_organization(company_name=name, location=location)
+
+    async def _clearbit() -> ClearbitCompany | None:
+        async with provider_slot("clearbit"):
+            return await clearbit.suggest_company(query=name)
+
+    apollo_result, clearbit_result = await asyncio.gather(
+        _apollo(), _clearbit(), return_exceptions=True
+    )
+    if isinstance(apollo_result, (ApolloRateLimitError, ApolloAuthError)):
+        raise apollo_result
+    if raise_errors:
+        for result in (apollo_result, clearbit_result):
+            if isinstance(result, BaseException):
+                raise result
+    if isinstance(apollo_result, BaseException):
+        logger.debug("Apollo organization search failed for %s: %s", name, apollo_result)
+        apollo_result = None
+    if isinstance(clearbit_result, BaseException):
+        logger.debug("Clearbit suggestion failed for %s: %s", name, clearbit_result)
+        clearbit_result = None
+    return apollo_result, clearbit_result
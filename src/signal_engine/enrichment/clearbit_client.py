@@ -5,14 +5,19 @@ from dataclasses import dataclass
 
 import httpx
 
+from src.signal_engine.enrichment.client_pool import send_capped
+
 logger = logging.getLogger(__name__)
 
+# Stop reading (and reject) responses larger than this many bytes.
+_MAX_RESPONSE_BYTES = 2_000_000
+
 
 class ClearbitError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearbitCompany:
     name: str | None = None
     domain: str | None = None
@@ -35,7 +40,14 @@ class ClearbitClient:
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=timeout_s)
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=timeout_s, write=10.0, pool=5.0),
+            # httpx ignores the client's limits= when a transport is given.
+            transport=httpx.AsyncHTTPTransport(
+                retries=0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
 
     async def aclose(self) -> None:
         await self._client.aclose()
@@ -56,7 +68,10 @@ class ClearbitClient:
         url = f"{self.base_url}/companies/suggest"
         params = {"query": query}
 
-        resp = await self._client.get(url, params=params)
+        request = self._client.build_request("GET", url, params=params)
+        resp = await send_capped(self._client, request, _MAX_RESPONSE_BYTES)
+        if resp is None:
+            raise ClearbitError(f"Clearbit response larger than {_MAX_RESPONSE_BYTES} bytes")
         if resp.status_code >= 400:
             raise ClearbitError(f"Clearbit error {resp.status_code}: {resp.text}")
 
@@ -0,0 +1,105 @@
+"""Process-wide registry of provider HTTP clients, shared so connections stay warm."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+from typing import Any, Callable
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 multiplexes concurrent requests over one TLS connection; it needs the optional
+# h2 package (httpx[http2]), so clients fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (e.g. resp.content) with orjson when installed, else stdlib json."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes with orjson when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def short_text(text: str, limit: int = 200) -> str:
+    """Truncate a response body for error messages/logs (outage pages can be many KB)."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+async def send_capped(
+    client: httpx.AsyncClient, request: httpx.Request, max_bytes: int
+) -> httpx.Response | None:
+    """
+    Send request and load the response body, or return None once it passes max_bytes.
+
+    The body is streamed, so an oversized response (declared or chunked) is dropped
+    after at most max_bytes have been read instead of being buffered in full.
+    """
+    resp = await client.send(request, stream=True)
+    chunks: list[bytes] = []
+    try:
+        if int(resp.headers.get("content-length") or 0) > max_bytes:
+            return None
+        size = 0
+        # Decoded bytes are counted, so a small compressed body can't expand past the cap.
+        async for chunk in resp.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                return None
+            chunks.append(chunk)
+    finally:
+        await resp.aclose()
+    headers = resp.headers.copy()
+    headers.pop("content-encoding", None)  # The chunks are already decoded.
+    return httpx.Response(
+        resp.status_code, headers=headers, content=b"".join(chunks), request=request
+    )
+
+
+# httpx clients are bound to the event loop that created them, so the registry is
+# reset when a new loop is detected. Close with close_shared_clients().
+_CLIENTS: dict[tuple[str, str | None], Any] = {}
+_CLIENTS_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def shared_client(kind: str, key: str | None, factory: Callable[[], Any]) -> Any:
+    """
+    Return the shared client for (kind, key), creating it with factory() on first use.
+
+    Callers must not aclose() the returned client; close_shared_clients() does that
+    once at the end of a run.
+    """
+    global _CLIENTS_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENTS_LOOP is not loop:
+        _CLIENTS.clear()
+        _CLIENTS_LOOP = loop
+    client = _CLIENTS.get((kind, key))
+    if client is None:
+        client = factory()
+        _CLIENTS[(kind, key)] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every shared provider client."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as exc:
+            logger.debug(f"Failed to close enrichment client: {exc}")
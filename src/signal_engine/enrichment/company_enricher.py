@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import heapq
 import json
 import logging
 import os
 import re
+import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from itertools import chain
 from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from urllib.parse import urlsplit
 
 from src.core.config import get_settings
 from src.signal_engine.enrichment.apollo_client import (
@@ -16,15 +24,25 @@ from src.signal_engine.enrichment.apollo_client import (
     ApolloClient,
     ApolloCompany,
     ApolloRateLimitError,
+    lookup_company,
 )
-from src.signal_engine.enrichment.clearbit_client import ClearbitClient
+from src.signal_engine.enrichment.clearbit_client import ClearbitClient, ClearbitCompany
+from src.signal_engine.enrichment.client_pool import close_shared_clients, shared_client
+from src.signal_engine.enrichment.lookup_cache import LookupCache
 from src.signal_engine.enrichment.opencorporates_client import OpenCorporatesClient
-from src.signal_engine.enrichment.search_snippet_client import SearchSnippetClient
+from src.signal_engine.enrichment.provider_limits import AIMDGate, provider_slot
+from src.signal_engine.enrichment.result_cache import ResultCache
+from src.signal_engine.enrichment.search_snippet_client import SearchSnippet, SearchSnippetClient
 from src.signal_engine.enrichment.snippet_llm_parser import (
     extract_person_from_snippets,
     pick_domain_from_snippets,
 )
-from src.signal_engine.enrichment.geocoder import GeocodeResult, geocode_address
+from src.signal_engine.enrichment.geocoder import (
+    GeocodeResult,
+    close_geocoder,
+    geocode_address,
+    geocode_addresses,
+)
 from src.signal_engine.enrichment.provider_manager import (
     EnrichmentProvider,
     ProviderManager,
@@ -41,9 +59,70 @@ from src.signal_engine.models import (
 
 logger = logging.getLogger(__name__)
 
-# Per-process circuit breaker: if Apollo starts returning auth/credit/rate-limit errors,
-# disable Apollo for the remainder of this run and fall back to Clearbit/Hunter only.
-_APOLLO_RUNTIME_DISABLED: bool = False
+
+class ApolloBreaker(AIMDGate):
+    """
+    AIMD concurrency gate for Apollo calls that can also switch Apollo off.
+
+    Limits adapt as in AIMDGate, with rate limits as the overload signal. Apollo is
+    only disabled for the rest of the run after repeated rate limits at the
+    concurrency floor, or immediately on auth/plan errors (those are not transient).
+    """
+
+    def __init__(
+        self,
+        *,
+        min_concurrency: float = 1.0,
+        max_concurrency: float = 4.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target_s: float = 2.0,
+        window: int = 10,
+        disable_after: int = 3,
+    ):
+        super().__init__(
+            initial=max_concurrency,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            alpha=alpha,
+            beta=beta,
+            latency_target_s=latency_target_s,
+            window=window,
+        )
+        self.disable_after = disable_after
+        self.disabled = False
+        self._floor_strikes = 0
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        async with self.slot():
+            start = time.monotonic()
+            try:
+                yield
+            except ApolloAuthError:
+                self.disabled = True
+                raise
+            except ApolloRateLimitError:
+                self.on_rate_limited()
+                raise
+            else:
+                self.on_success(time.monotonic() - start)
+
+    def on_success(self, latency_s: float) -> None:
+        self._floor_strikes = 0
+        super().on_success(latency_s)
+
+    def on_rate_limited(self) -> None:
+        if self.concurrency <= self.min_concurrency:
+            self._floor_strikes += 1
+            if self._floor_strikes >= self.disable_after:
+                self.disabled = True
+        self.on_overload()
+
+
+# Per-process Apollo controller: throttles on rate limits and falls back to
+# Clearbit/Hunter only once Apollo is persistently unavailable for this run.
+_APOLLO_BREAKER = ApolloBreaker()
 
 # Lightweight enrichment metrics for observability (per process/run).
 _ENRICHMENT_METRICS: dict[str, int] = {
@@ -54,6 +133,58 @@ _ENRICHMENT_METRICS: dict[str, int] = {
 }
 
 
+# Provider clients are shared across permits (see client_pool) so httpx keeps TLS
+# connections warm.
+def _get_apollo_client(api_key: str) -> ApolloClient:
+    return shared_client("apollo", api_key, lambda: ApolloClient(api_key=api_key))
+
+
+def _get_clearbit_client() -> ClearbitClient:
+    return shared_client("clearbit", None, ClearbitClient)
+
+
+def _get_opencorporates_client(api_key: str | None) -> OpenCorporatesClient:
+    return shared_client(
+        "opencorporates", api_key, lambda: OpenCorporatesClient(api_key=api_key)
+    )
+
+
+def _get_snippet_client() -> SearchSnippetClient:
+    return shared_client("snippets", None, SearchSnippetClient)
+
+
+async def close_enrichment_clients() -> None:
+    """Close the shared provider clients and geocoder (call once at the end of a run)."""
+    await ProviderManager.aflush_pending_cache()
+    await close_shared_clients()
+    await close_geocoder()
+    global _LOOKUP_CACHE
+    if _LOOKUP_CACHE is not None:
+        _LOOKUP_CACHE.close()
+        _LOOKUP_CACHE = None
+
+
+# In-flight and recently completed decision-maker lookups, keyed by
+# _decision_maker_key(). Duplicate applicants share one provider cascade; a
+# long-running process keeps only the most recently used results.
+_DECISION_MAKER_CACHE_TTL_S = 3600.0
+_DECISION_MAKER_CACHE = ResultCache(ttl_s=_DECISION_MAKER_CACHE_TTL_S, max_entries=4096)
+
+
+# Persistent name -> domain/officer lookups shared across runs (see _get_lookup_cache).
+_LOOKUP_CACHE: LookupCache | None = None
+_LOOKUP_CACHE_FAILED = False
+_NEGATIVE_LOOKUP_TTL_S = 86400.0
+_LOOKUP_TTL_S = 7 * 86400.0
+
+# In-process memo in front of the persistent cache, keyed by (namespace, key). Repeat
+# applicants within a run skip both the SQLite read and the API call, even when
+# persistence is disabled, and concurrent callers for one key share a fetch.
+_LOOKUP_MEMO = ResultCache(
+    ttl_s=_LOOKUP_TTL_S, negative_ttl_s=_NEGATIVE_LOOKUP_TTL_S, max_entries=10_000
+)
+
+
 def get_enrichment_metrics(*, reset: bool = False) -> dict[str, int]:
     metrics = dict(_ENRICHMENT_METRICS)
     if reset:
@@ -68,10 +199,14 @@ def persist_enrichment_metrics(
     permits_tested: int,
     emails_found: int,
     metrics: dict[str, int],
-    output_path: str = "data/workflow_metrics.json",
+    output_path: str = "data/workflow_metrics.jsonl",
 ) -> None:
     """
-    Append enrichment metrics to workflow_metrics.json for lightweight observability.
+    Append enrichment metrics to workflow_metrics.jsonl for lightweight observability.
+
+    Each run is a single JSON line written with one O_APPEND write, so the cost is
+    constant regardless of history size and concurrent writers never interleave or
+    clobber each other (no read-modify-write, no file lock needed).
     """
     entry = {
         "label": label,
@@ -81,28 +216,203 @@ def persist_enrichment_metrics(
     }
     path = Path(output_path)
     try:
-        if path.exists():
-            try:
-                payload = json.loads(path.read_text())
-            except Exception:
-                payload = {}
-        else:
-            payload = {}
-        runs = payload.get("enrichment_runs") or []
-        runs.append(entry)
-        payload["enrichment_runs"] = runs
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode()
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
     except Exception as exc:
         logger.warning(f"Failed to persist enrichment metrics: {exc}")
 
 
-@dataclass(frozen=True)
+# Common person name patterns, compiled once into a single alternation so each
+# name is scanned once in the hot enrichment loop.
+_PERSON_NAME_RE = re.compile(
+    r"^(?:mr|mrs|ms|dr|prof)\.?\s+"  # Titles
+    r"|\s+(?:jr|sr|ii|iii|iv)\.?$"  # Suffixes
+    r"|^[a-z]\.\s+[a-z]"  # Initials (e.g., "J. Smith")
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Applicant placeholders (normalized via _name_tokens) that never resolve to a
+# contactable business, and PO-box site addresses; both skip the paid provider path.
+_PLACEHOLDER_APPLICANTS: frozenset[str] = frozenset(
+    {
+        "homeowner",
+        "home owner",
+        "owner",
+        "property owner",
+        "owner builder",
+        "self",
+        "cash",
+        "n a",
+        "na",
+        "none",
+        "null",
+        "unknown",
+        "tbd",
+    }
+)
+_PO_BOX_RE = re.compile(r"\bp\.?\s*o\.?\s*box\b", re.IGNORECASE)
+# First word, then the rest of the name (trimmed) as the last name.
+_NAME_SPLIT_RE = re.compile(r"\s*(\S+)(?:\s+(.+?))?\s*$")
+
+# Tokens that mark a name as a company rather than a person.
+_COMPANY_WORDS: frozenset[str] = frozenset(
+    {
+        "inc",
+        "llc",
+        "corp",
+        "ltd",
+        "company",
+        "co",
+        "group",
+        "associates",
+        "services",
+        "systems",
+        "architect",
+        "architects",
+        "engineering",
+        "engineers",
+        "construction",
+        "builders",
+        "plumbing",
+        "electric",
+        "electrical",
+        "mechanical",
+        "hvac",
+        "roofing",
+        "sprinkler",
+        "alarm",
+        "fire",
+        "contractor",
+        "contractors",
+    }
+)
+
+# Legal-entity designations; the only words dropped from company-match cache keys.
+_LEGAL_ENTITY_SUFFIXES: frozenset[str] = frozenset(
+    {
+        "llc",
+        "inc",
+        "incorporated",
+        "ltd",
+        "limited",
+        "llp",
+        "pllc",
+        "corp",
+        "corporation",
+        "co",
+        "company",
+    }
+)
+
+# Legal/trade suffixes dropped when tokenizing company names.
+_COMPANY_SUFFIXES: frozenset[str] = frozenset(
+    {
+        "llc",
+        "inc",
+        "ltd",
+        "llp",
+        "pllc",
+        "corp",
+        "co",
+        "company",
+        "group",
+        "partners",
+        "associates",
+        "architects",
+        "architect",
+        "engineering",
+        "engineers",
+        "construction",
+        "builders",
+        "contractors",
+        "contractor",
+        "services",
+        "systems",
+    }
+)
+
+# Free/personal mailbox providers that never identify a company.
+_PUBLIC_EMAIL_DOMAINS: frozenset[str] = frozenset(
+    {
+        "gmail.com",
+        "yahoo.com",
+        "hotmail.com",
+        "outlook.com",
+        "aol.com",
+        "icloud.com",
+        "me.com",
+        "proton.me",
+        "protonmail.com",
+        "pm.me",
+        "gmx.com",
+        "yandex.com",
+    }
+)
+
+# Directory/social sites that are never a company's own domain.
+_BLOCKED_SNIPPET_DOMAINS: frozenset[str] = frozenset(
+    {
+        "linkedin.com",
+        "facebook.com",
+        "instagram.com",
+        "twitter.com",
+        "x.com",
+        "yelp.com",
+        "bbb.org",
+        "chamberofcommerce.com",
+        "opencorporates.com",
+        "mapquest.com",
+        "youtube.com",
+        "houzz.com",
+        "angi.com",
+        "angieslist.com",
+        "yellowpages.com",
+        "thebluebook.com",
+        "dandb.com",
+        "manta.com",
+        "buildzoom.com",
+        "homestars.com",
+        "homeadvisor.com",
+        "thumbtack.com",
+    }
+)
+# Two-label public suffixes under which registrations happen one level deeper.
+_MULTI_LABEL_SUFFIXES: frozenset[str] = frozenset(
+    {
+        "co.uk",
+        "org.uk",
+        "ac.uk",
+        "gov.uk",
+        "com.au",
+        "net.au",
+        "org.au",
+        "co.nz",
+        "co.jp",
+        "co.in",
+        "com.br",
+        "com.mx",
+        "co.za",
+        "com.cn",
+        "com.sg",
+    }
+)
+# Tuple form lets str.endswith test every blocked suffix in a single C-level call.
+_BLOCKED_SNIPPET_SUFFIXES: tuple[str, ...] = tuple(
+    sorted(_BLOCKED_SNIPPET_DOMAINS, key=len, reverse=True)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class EnrichmentInputs:
     tenant_id: str
     permit: PermitData
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_likely_person_name(name: str) -> bool:
     """
     Heuristic to determine if a name is likely a person vs company.
@@ -116,96 +426,49 @@ def _is_likely_person_name(name: str) -> bool:
     if not name:
         return False
 
-    name_lower = name.lower().strip()
+    # Every person pattern needs at least two words, so single-token names
+    # ("ACME", "PG&E") are companies without running any regex.
+    words = name.split()
+    if len(words) < 2:
+        return False
 
-    # Common person name patterns
-    person_indicators = [
-        r"^(mr|mrs|ms|dr|prof)\.?\s+",  # Titles
-        r"\s+(jr|sr|ii|iii|iv)\.?$",  # Suffixes
-        r"^[a-z]\.\s+[a-z]",  # Initials (e.g., "J. Smith")
-    ]
+    name_lower = name.lower().strip()
 
-    for pattern in person_indicators:
-        if re.search(pattern, name_lower):
-            return True
+    if _PERSON_NAME_RE.search(name_lower):
+        return True
 
-    # If it's 2-3 words and doesn't contain common company words, likely person
-    words = name.split()
+    # If it's 2-3 words and doesn't contain common company words, likely person.
+    # _name_tokens is memoized, so company names tokenized here are reused by the
+    # domain-guessing and snippet-scoring steps later in the pipeline.
     if 2 <= len(words) <= 3:
-        company_words = [
-            "inc",
-            "llc",
-            "corp",
-            "ltd",
-            "company",
-            "co",
-            "group",
-            "associates",
-            "services",
-            "systems",
-            "architect",
-            "architects",
-            "engineering",
-            "engineers",
-            "construction",
-            "builders",
-            "plumbing",
-            "electric",
-            "electrical",
-            "mechanical",
-            "hvac",
-            "roofing",
-            "sprinkler",
-            "alarm",
-            "fire",
-            "contractor",
-            "contractors",
-        ]
-        tokens = re.findall(r"[a-z0-9]+", name_lower)
-        if not any(word in tokens for word in company_words):
+        if _COMPANY_WORDS.isdisjoint(_name_tokens(name, drop_suffixes=False)):
             return True
 
     return False
 
 
+def _split_person_name(name: str) -> tuple[str | None, str | None]:
+    """Split "First Rest Of Name" into (first, last); missing parts are None."""
+    match = _NAME_SPLIT_RE.match(name)
+    if not match:
+        return None, None
+    return match.group(1), match.group(2)
+
+
 def _guess_company_domains(company_name: str) -> list[str]:
     """
     Generate simple domain guesses from company name.
     """
     if not company_name:
         return []
+    return list(_guess_company_domains_cached(company_name))
 
-    suffixes = {
-        "llc",
-        "inc",
-        "ltd",
-        "llp",
-        "pllc",
-        "corp",
-        "co",
-        "company",
-        "group",
-        "partners",
-        "associates",
-        "architects",
-        "architect",
-        "engineering",
-        "engineers",
-        "construction",
-        "builders",
-        "contractors",
-        "contractor",
-        "services",
-        "systems",
-    }
-    tokens = [
-        t.strip(".,()")
-        for t in company_name.lower().replace("&", "and").split()
-        if t.strip(".,()")
-    ]
-    tokens = [t for t in tokens if t not in suffixes]
+
+@functools.lru_cache(maxsize=4096)
+def _guess_company_domains_cached(company_name: str) -> tuple[str, ...]:
+    tokens = _name_tokens(company_name)
     if not tokens:
-        return []
+        return ()
 
     joined = "".join(tokens)
     hyphenated = "-".join(tokens)
@@ -213,24 +476,50 @@ def _guess_company_domains(company_name: str) -> list[str]:
     for base in [joined, hyphenated]:
         if base and base not in guesses:
             guesses.append(f"{base}.com")
-    return guesses[:2]
+    return tuple(guesses[:2])
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_domain_from_url(url: str) -> str | None:
     if not url:
         return None
     try:
-        # Strip scheme
-        cleaned = url.replace("https://", "").replace("http://", "")
-        cleaned = cleaned.split("/")[0].split("?")[0]
-        cleaned = cleaned.replace("www.", "")
-        if "." not in cleaned:
-            return None
-        return cleaned.lower()
-    except Exception:
+        host = urlsplit(url if "://" in url else f"http://{url}").hostname
+    except ValueError:
         return None
+    if not host or "." not in host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
 
+@functools.lru_cache(maxsize=4096)
+def _registered_domain(domain: str) -> str:
+    """
+    Reduce a hostname to its registered domain (eTLD+1), e.g. mail.acme.co.uk -> acme.co.uk.
 
+    Uses a small static table of multi-label public suffixes rather than the full
+    Public Suffix List, which is sufficient for matching contact emails to companies.
+    """
+    labels = domain.strip(".").split(".")
+    if len(labels) >= 3 and ".".join(labels[-2:]) in _MULTI_LABEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+@functools.lru_cache(maxsize=1024)
+def _token_matcher(tokens: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile company tokens into one multi-pattern matcher.
+
+    A single regex alternation scans a domain once in C instead of one substring
+    test per token. The lookahead makes finditer report every token occurrence,
+    including overlapping ones, so callers can count distinct matched tokens.
+    """
+    alternation = "|".join(re.escape(t) for t in sorted(set(tokens), key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+@functools.lru_cache(maxsize=4096)
 def _extract_email_domain(email: str | None) -> str | None:
     if not email or "@" not in email:
         return None
@@ -240,35 +529,20 @@ def _extract_email_domain(email: str | None) -> str | None:
 def _tokenize_company_name(company_name: str | None) -> list[str]:
     if not company_name:
         return []
-    suffixes = {
-        "llc",
-        "inc",
-        "ltd",
-        "llp",
-        "pllc",
-        "corp",
-        "co",
-        "company",
-        "group",
-        "partners",
-        "associates",
-        "architects",
-        "architect",
-        "engineering",
-        "engineers",
-        "construction",
-        "builders",
-        "contractors",
-        "contractor",
-        "services",
-        "systems",
-    }
-    tokens = [
-        t.strip(".,()")
-        for t in company_name.lower().replace("&", "and").split()
-        if t.strip(".,()")
-    ]
-    return [t for t in tokens if t not in suffixes]
+    return list(_name_tokens(company_name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _name_tokens(name: str, *, drop_suffixes: bool = True) -> tuple[str, ...]:
+    """
+    Lowercased alphanumeric tokens of a company name ("&" reads as "and").
+
+    Legal/trade suffixes are dropped unless drop_suffixes is False.
+    """
+    tokens = _TOKEN_RE.findall(name.lower().replace("&", " and "))
+    if drop_suffixes:
+        return tuple(t for t in tokens if t not in _COMPANY_SUFFIXES)
+    return tuple(tokens)
 
 
 def _is_email_domain_sane(
@@ -276,9 +550,9 @@ def _is_email_domain_sane(
     email: str | None,
     company_domain: str | None,
     company_name: str | None,
-    blocked_domains: set[str] | None = None,
-    blocked_tlds: set[str] | None = None,
-    allowed_tlds_no_domain: set[str] | None = None,
+    blocked_domains: set[str] | frozenset[str] | None = None,
+    blocked_tlds: set[str] | frozenset[str] | None = None,
+    allowed_tlds_no_domain: set[str] | frozenset[str] | None = None,
 ) -> bool:
     """
     Basic sanity checks to avoid mismatched domains (e.g., personal/school emails).
@@ -287,20 +561,6 @@ def _is_email_domain_sane(
     if not email_domain:
         return False
 
-    public_domains = {
-        "gmail.com",
-        "yahoo.com",
-        "hotmail.com",
-        "outlook.com",
-        "aol.com",
-        "icloud.com",
-        "me.com",
-        "proton.me",
-        "protonmail.com",
-        "pm.me",
-        "gmx.com",
-        "yandex.com",
-    }
     normalized_company_domain = (company_domain or "").strip().lower()
 
     blocked_domains = blocked_domains or set()
@@ -314,17 +574,11 @@ def _is_email_domain_sane(
         if tld in blocked_tlds:
             return False
 
-    if email_domain in public_domains and email_domain != normalized_company_domain:
+    if email_domain in _PUBLIC_EMAIL_DOMAINS and email_domain != normalized_company_domain:
         return False
 
     if normalized_company_domain:
-        if (
-            email_domain == normalized_company_domain
-            or email_domain.endswith(f".{normalized_company_domain}")
-            or normalized_company_domain.endswith(f".{email_domain}")
-        ):
-            return True
-        return False
+        return _registered_domain(email_domain) == _registered_domain(normalized_company_domain)
 
     if allowed_tlds_no_domain:
         tld = email_domain.rsplit(".", 1)[-1]
@@ -334,7 +588,27 @@ def _is_email_domain_sane(
     tokens = _tokenize_company_name(company_name)
     if not tokens:
         return True
-    return any(token in email_domain for token in tokens)
+    return _token_matcher(tuple(tokens)).search(email_domain) is not None
+
+
+def _parse_csv_setting(value: str | None) -> frozenset[str]:
+    return frozenset(v.strip().lower() for v in (value or "").split(",") if v.strip())
+
+
+@functools.lru_cache(maxsize=1)
+def _email_filter_sets() -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """
+    Parse the email domain/TLD filter settings once per process.
+
+    Returns (blocked_domains, blocked_tlds, allowed_tlds_no_domain). Call
+    _email_filter_sets.cache_clear() if settings are reloaded at runtime.
+    """
+    settings = get_settings()
+    return (
+        _parse_csv_setting(settings.enrichment_blocked_email_domains),
+        _parse_csv_setting(settings.enrichment_blocked_email_tlds),
+        _parse_csv_setting(settings.enrichment_allowed_email_tlds_no_domain),
+    )
 
 
 def _accept_decision_maker(
@@ -346,22 +620,7 @@ def _accept_decision_maker(
 ) -> DecisionMaker | None:
     if not decision_maker:
         return None
-    settings = get_settings()
-    blocked_domains = {
-        d.strip().lower()
-        for d in (settings.enrichment_blocked_email_domains or "").split(",")
-        if d.strip()
-    }
-    blocked_tlds = {
-        t.strip().lower()
-        for t in (settings.enrichment_blocked_email_tlds or "").split(",")
-        if t.strip()
-    }
-    allowed_tlds_no_domain = {
-        t.strip().lower()
-        for t in (settings.enrichment_allowed_email_tlds_no_domain or "").split(",")
-        if t.strip()
-    }
+    blocked_domains, blocked_tlds, allowed_tlds_no_domain = _email_filter_sets()
     if decision_maker.email and not _is_email_domain_sane(
         email=decision_maker.email,
         company_domain=company_domain,
@@ -382,69 +641,211 @@ def _accept_decision_maker(
 
 
 def _candidate_domains_from_snippets(
-    company_name: str, snippets: list[dict]
+    company_name: str, snippets: list[SearchSnippet]
 ) -> list[str]:
-    blocked = {
-        "linkedin.com",
-        "facebook.com",
-        "instagram.com",
-        "twitter.com",
-        "x.com",
-        "yelp.com",
-        "bbb.org",
-        "chamberofcommerce.com",
-        "opencorporates.com",
-        "mapquest.com",
-        "youtube.com",
-        "houzz.com",
-        "angi.com",
-        "angieslist.com",
-        "yellowpages.com",
-        "thebluebook.com",
-        "dandb.com",
-        "manta.com",
-        "buildzoom.com",
-        "homestars.com",
-        "homeadvisor.com",
-        "thumbtack.com",
-    }
-    tokens = [
-        t.strip(".,()")
-        for t in company_name.lower().replace("&", "and").split()
-        if t.strip(".,()")
-    ]
-    token_set = {t for t in tokens if t}
-
-    scored: list[tuple[int, str]] = []
-    seen = set()
-    for item in snippets:
-        url = item.get("url") or ""
-        domain = _extract_domain_from_url(url)
-        if not domain or domain in seen:
-            continue
-        if any(domain.endswith(b) for b in blocked):
-            continue
-
-        score = 0
-        for token in tokens:
-            if token and token in domain:
-                score += 2
-        if token_set and score == 0:
+    token_set = set(_name_tokens(company_name, drop_suffixes=False))
+
+    # Dedupe extracted domains while preserving snippet order.
+    domains = dict.fromkeys(
+        _extract_domain_from_url(item.url) for item in snippets
+    )
+    domains.pop(None, None)
+    candidates = _score_candidates(domains, token_set)
+    return [d for _, d in heapq.nlargest(3, candidates, key=lambda x: x[0])]
+
+
+def _score_candidates(
+    domains: Iterable[str], token_set: set[str]
+) -> Iterator[tuple[int, str]]:
+    tokens = tuple(sorted(token_set))
+    for domain in domains:
+        score = _score_domain(domain, tokens)
+        if score >= 0:
+            yield score, domain
+
+
+@functools.lru_cache(maxsize=8192)
+def _score_domain(domain: str, tokens: tuple[str, ...]) -> int:
+    """
+    Score one snippet domain against the company's name tokens (-1 = reject).
+
+    The same domains (the company's own site, directories, social profiles) recur
+    across queries and companies, so scores are memoized per (domain, tokens).
+    """
+    if domain.endswith(_BLOCKED_SNIPPET_SUFFIXES):
+        return -1
+
+    score = 0
+    if tokens:
+        score += 2 * len({m.group(1) for m in _token_matcher(tokens).finditer(domain)})
+        if score == 0:
             # Require at least one company token match to keep domain candidate.
-            continue
-        if domain.startswith("www."):
-            score += 1
-        if domain.count(".") == 1:
-            score += 1
+            return -1
+    if domain.count(".") == 1:
+        score += 1
+    return score
 
-        scored.append((score, domain))
-        seen.add(domain)
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [d for _, d in scored[:3]]
+def _get_lookup_cache() -> LookupCache | None:
+    """Lazily open the persistent lookup cache (None when persistence is disabled)."""
+    global _LOOKUP_CACHE, _LOOKUP_CACHE_FAILED
+    if _LOOKUP_CACHE is not None or _LOOKUP_CACHE_FAILED:
+        return _LOOKUP_CACHE
+    settings = get_settings()
+    if not settings.enrichment_persist_cache:
+        return None
+    path = Path(settings.enrichment_cache_path).with_name("enrichment_lookups.sqlite3")
+    try:
+        _LOOKUP_CACHE = LookupCache(path)
+    except Exception as exc:
+        _LOOKUP_CACHE_FAILED = True
+        logger.warning(f"Persistent lookup cache unavailable ({path}): {exc}")
+    return _LOOKUP_CACHE
 
 
-async def match_company(permit: PermitData, geocode_result: GeocodeResult | None) -> Company:
+def _lookup_key(*parts: str | None) -> str:
+    return "|".join(" ".join(_name_tokens(p, drop_suffixes=False)) if p else "" for p in parts)
+
+
+def _canonical_company_name(name: str) -> str:
+    """
+    Collapse spelling variants of one applicant name to a cache key.
+
+    Case, punctuation and trailing legal-entity suffixes are normalized, so
+    "ACME Electrical, Inc" and "Acme Electrical LLC" share "acme electrical".
+    Descriptive words and word order are kept: "ABC Construction" and
+    "ABC Engineering" are different companies and must not share a lookup.
+    """
+    tokens = list(_name_tokens(name, drop_suffixes=False))
+    while len(tokens) > 1 and tokens[-1] in _LEGAL_ENTITY_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+async def _cached(namespace: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a memoized or persisted lookup result, or fetch and persist it.
+
+    Exceptions from fetch propagate and are not cached. Empty results are kept for
+    a shorter TTL so transient misses are retried sooner. Concurrent calls for the
+    same key share one fetch (e.g. duplicate applicants in a batch).
+    """
+
+    async def _load() -> Any:
+        cache = _get_lookup_cache()
+        if cache is None:
+            return await fetch()
+        # SQLite calls run in a worker thread so a slow disk doesn't stall the loop.
+        value = await asyncio.to_thread(cache.get, namespace, key)
+        if value is LookupCache.MISSING:
+            value = await fetch()
+            await asyncio.to_thread(
+                cache.set, namespace, key, value, ttl_s=None if value else _NEGATIVE_LOOKUP_TTL_S
+            )
+        return value
+
+    return await _LOOKUP_MEMO.get_or_fetch((namespace, key), _load)
+
+
+async def _cached_clearbit_domain(company_name: str) -> str | None:
+    async def _fetch() -> str | None:
+        async with provider_slot("clearbit"):
+            suggestion = await _get_clearbit_client().suggest_company(query=company_name)
+        return suggestion.domain if suggestion else None
+
+    return await _cached("clearbit_domain", _lookup_key(company_name), _fetch)
+
+
+async def _cached_officer_names(company_name: str, api_key: str | None) -> list[str]:
+    async def _fetch() -> list[str]:
+        oc_client = _get_opencorporates_client(api_key)
+        async with provider_slot("opencorporates"):
+            return await oc_client.find_officer_names_by_company(name=company_name)
+
+    return await _cached("opencorporates_officers", _lookup_key(company_name), _fetch)
+
+
+async def _cached_lookup_company(
+    company_name: str, location: str | None, apollo_key: str
+) -> tuple[ApolloCompany | None, ClearbitCompany | None]:
+    async def _fetch() -> dict | None:
+        # A failed provider raises, so _cached() keeps it out of the persistent cache.
+        apollo_company, clearbit_company = await lookup_company(
+            company_name,
+            location,
+            _get_apollo_client(apollo_key),
+            _get_clearbit_client(),
+            raise_errors=True,
+        )
+        if not apollo_company and not clearbit_company:
+            return None
+        return {
+            "apollo": asdict(apollo_company) if apollo_company else None,
+            "clearbit": asdict(clearbit_company) if clearbit_company else None,
+        }
+
+    key = f"{_canonical_company_name(company_name)}|{_lookup_key(location)}"
+    payload = await _cached("company_match", key, _fetch)
+    if not payload:
+        return None, None
+    apollo = ApolloCompany(**payload["apollo"]) if payload.get("apollo") else None
+    clearbit = ClearbitCompany(**payload["clearbit"]) if payload.get("clearbit") else None
+    return apollo, clearbit
+
+
+def _company_name_from_permit(permit: PermitData) -> str | None:
+    """The applicant name when it looks like a company rather than a person."""
+    if permit.applicant_name and not _is_likely_person_name(permit.applicant_name):
+        return permit.applicant_name.strip()
+    return None
+
+
+def _location_from_geocode(geocode_result: GeocodeResult | None) -> str | None:
+    if not geocode_result:
+        return None
+    location_parts = [part for part in (geocode_result.city, geocode_result.state) if part]
+    return ", ".join(location_parts) if location_parts else None
+
+
+async def _guarded_lookup_company(
+    company_name: str | None, location: str | None
+) -> tuple[ApolloCompany | None, ClearbitCompany | None] | None:
+    """
+    Apollo organizations/search (free tier) + Clearbit behind the Apollo breaker.
+
+    Returns None when the lookup was not attempted (Apollo disabled, no key, no
+    company name) or failed, so callers can tell "not tried" from "no match".
+    """
+    settings = get_settings()
+    apollo_key = settings.apollo_api_key or os.environ.get("APOLLO_API_KEY")
+    if not (
+        settings.apollo_enabled
+        and not _APOLLO_BREAKER.disabled
+        and company_name
+        and apollo_key
+    ):
+        return None
+    try:
+        async with _APOLLO_BREAKER.acquire():
+            return await _cached_lookup_company(company_name, location, apollo_key)
+    except (ApolloRateLimitError, ApolloAuthError) as e:
+        if _APOLLO_BREAKER.disabled:
+            logger.warning(f"Apollo disabled for this run due to error: {e}")
+        else:
+            logger.warning(
+                f"Apollo throttled to {_APOLLO_BREAKER.concurrency:.1f} concurrent calls: {e}"
+            )
+    except Exception as e:
+        logger.warning(f"Apollo company search failed: {e}")
+    return None
+
+
+async def match_company(
+    permit: PermitData,
+    geocode_result: GeocodeResult | None,
+    *,
+    name_match: tuple[ApolloCompany | None, ClearbitCompany | None] | None = None,
+) -> Company:
     """
     Match company from permit data using enhanced logic with Apollo domain lookup.
 
@@ -456,57 +857,37 @@ async def match_company(permit: PermitData, geocode_result: GeocodeResult | None
     Args:
         permit: Permit data
         geocode_result: Geocoding result with location info
+        name_match: Result of an earlier name-only lookup (issued while geocoding);
+            the location-refined lookup only runs when it found no Apollo company
 
     Returns:
         Company object with matched or inferred information (including website/domain)
     """
-    settings = get_settings()
-    apollo_key = settings.apollo_api_key or os.environ.get("APOLLO_API_KEY")
-
     # Strategy 1: Use applicant_name if it looks like a company name
-    company_name = None
-    if permit.applicant_name and not _is_likely_person_name(permit.applicant_name):
-        company_name = permit.applicant_name.strip()
+    company_name = _company_name_from_permit(permit)
+    if company_name:
         logger.debug(f"Using applicant_name as company: {company_name}")
 
     # Strategy 2: Use Apollo's organizations/search (FREE TIER) to find domain
     # This is the "gold mine" endpoint - converts company name to website domain
     apollo_company: ApolloCompany | None = None
-    global _APOLLO_RUNTIME_DISABLED
-
-    if (
-        settings.apollo_enabled
-        and not _APOLLO_RUNTIME_DISABLED
-        and company_name
-        and apollo_key
-    ):
-        try:
-            location_str = None
-            if geocode_result:
-                location_parts = []
-                if geocode_result.city:
-                    location_parts.append(geocode_result.city)
-                if geocode_result.state:
-                    location_parts.append(geocode_result.state)
-                location_str = ", ".join(location_parts) if location_parts else None
-
-            client = ApolloClient(api_key=apollo_key)
-            try:
-                # Use the new search_organization endpoint (free tier compatible)
-                apollo_company = await client.search_organization(
-                    company_name=company_name, location=location_str
-                )
-                if apollo_company:
-                    logger.info(
-                        f"Found company domain via Apollo: {company_name} -> {apollo_company.domain or 'no domain'}"
-                    )
-            finally:
-                await client.aclose()
-        except (ApolloRateLimitError, ApolloAuthError) as e:
-            _APOLLO_RUNTIME_DISABLED = True
-            logger.warning(f"Apollo disabled for this run due to error: {e}")
-        except Exception as e:
-            logger.warning(f"Apollo company search failed: {e}")
+    clearbit_company: ClearbitCompany | None = None
+    clearbit_tried = False
+    if name_match is not None:
+        apollo_company, clearbit_company = name_match
+        clearbit_tried = True
+    location = _location_from_geocode(geocode_result)
+    # A second round trip only when the name-only lookup wasn't run or found no
+    # Apollo company; without a location it would repeat that same lookup.
+    if name_match is None or (apollo_company is None and location):
+        lookup = await _guarded_lookup_company(company_name, location)
+        if lookup is not None:
+            apollo_company, clearbit_company = lookup[0], lookup[1] or clearbit_company
+            clearbit_tried = True
+    if apollo_company:
+        logger.info(
+            f"Found company domain via Apollo: {company_name} -> {apollo_company.domain or 'no domain'}"
+        )
 
     # Build Company object
     if apollo_company:
@@ -518,18 +899,21 @@ async def match_company(permit: PermitData, geocode_result: GeocodeResult | None
             industry=apollo_company.industry,
         )
     elif company_name:
+        if clearbit_company and clearbit_company.domain:
+            return Company(
+                name=company_name,
+                website=f"https://{clearbit_company.domain}",
+            )
+        if clearbit_tried:
+            return Company(name=company_name)
         # If Apollo is disabled/unavailable, try Clearbit to get a domain anyway.
         try:
-            clearbit_client = ClearbitClient()
-            try:
-                suggestion = await clearbit_client.suggest_company(query=company_name)
-                if suggestion and suggestion.domain:
-                    return Company(
-                        name=company_name,
-                        website=f"https://{suggestion.domain}",
-                    )
-            finally:
-                await clearbit_client.aclose()
+            domain = await _cached_clearbit_domain(company_name)
+            if domain:
+                return Company(
+                    name=company_name,
+                    website=f"https://{domain}",
+                )
         except Exception as e:
             logger.debug(f"Clearbit domain lookup failed during company match: {e}")
         return Company(name=company_name)
@@ -541,10 +925,51 @@ async def match_company(permit: PermitData, geocode_result: GeocodeResult | None
         return Company(name=f"Unknown Org ({address_snippet})")
 
 
+def _is_enrichable(company: Company, permit: PermitData | None) -> bool:
+    """Cheap pre-filter run before any credit-metered provider lookup."""
+    if not company.name or company.name.startswith("Unknown"):
+        return False
+    if " ".join(_name_tokens(company.name, drop_suffixes=False)) in _PLACEHOLDER_APPLICANTS:
+        return False
+    if permit and permit.address and _PO_BOX_RE.search(permit.address):
+        return False
+    return True
+
+
+def _decision_maker_key(
+    company: Company, permit: PermitData | None
+) -> tuple[str, str | None, str | None]:
+    person = None
+    if permit and permit.applicant_name and _is_likely_person_name(permit.applicant_name):
+        person = permit.applicant_name.strip().lower()
+    return (company.name.strip().lower(), company.website, person)
+
+
 async def find_decision_maker(
     company: Company,
     geocode_result: GeocodeResult | None,
     permit: PermitData | None = None,
+) -> DecisionMaker | None:
+    """
+    Find decision maker, coalescing duplicate lookups for the same company.
+
+    Concurrent callers with the same (company, website, applicant person) key await
+    a single provider cascade, and completed results are reused for
+    _DECISION_MAKER_CACHE_TTL_S so repeated applicants don't burn extra credits.
+    """
+    if not _is_enrichable(company, permit):
+        return None
+
+    return await _DECISION_MAKER_CACHE.get_or_fetch(
+        _decision_maker_key(company, permit),
+        lambda: _find_decision_maker(company, geocode_result, permit),
+    )
+
+
+async def _find_decision_maker(
+    company: Company,
+    geocode_result: GeocodeResult | None,
+    permit: PermitData | None = None,
 ) -> DecisionMaker | None:
     """
     Find decision maker using available providers (Hunter.io or Apollo) with credit safety.
@@ -562,21 +987,31 @@ async def find_decision_maker(
     if not company.name or company.name.startswith("Unknown"):
         return None
 
-    # Initialize provider manager with safety settings
-    provider_manager = ProviderManager(
-        hunter_api_key=settings.hunter_api_key or os.environ.get("HUNTER_API_KEY"),
-        apollo_api_key=settings.apollo_api_key or os.environ.get("APOLLO_API_KEY"),
-        apollo_enabled=settings.apollo_enabled and (not _APOLLO_RUNTIME_DISABLED),
-        provider_priority=EnrichmentProvider(settings.enrichment_provider_priority),
-        dry_run=settings.enrichment_dry_run,
-        max_credits_per_run=settings.max_credits_per_run,
-        max_apollo_credits_per_run=settings.max_apollo_credits_per_run,
-        persist_cache=settings.enrichment_persist_cache,
-        cache_path=settings.enrichment_cache_path,
-    )
+    # Provider manager (with credit safety settings) is built on first use, so
+    # permits resolved by free lookups never construct it or load its cache.
+    _pm: list[ProviderManager] = []
+
+    def provider_manager() -> ProviderManager:
+        if not _pm:
+            _pm.append(
+                ProviderManager(
+                    hunter_api_key=settings.hunter_api_key or os.environ.get("HUNTER_API_KEY"),
+                    apollo_api_key=settings.apollo_api_key or os.environ.get("APOLLO_API_KEY"),
+                    apollo_enabled=settings.apollo_enabled and (not _APOLLO_BREAKER.disabled),
+                    provider_priority=EnrichmentProvider(settings.enrichment_provider_priority),
+                    dry_run=settings.enrichment_dry_run,
+                    max_credits_per_run=settings.max_credits_per_run,
+                    max_apollo_credits_per_run=settings.max_apollo_credits_per_run,
+                    persist_cache=settings.enrichment_persist_cache,
+                    cache_path=settings.enrichment_cache_path,
+                )
+            )
+        return _pm[0]
 
     def _log_credit_usage() -> None:
-        summary = provider_manager.credit_summary()
+        if not _pm:
+            return
+        summary = _pm[0].credit_summary()
         if summary["hunter"] or summary["apollo"]:
             _ENRICHMENT_METRICS["hunter_credits_used"] += summary["hunter"]
             _ENRICHMENT_METRICS["apollo_credits_used"] += summary["apollo"]
@@ -587,64 +1022,49 @@ async def find_decision_maker(
                 summary["apollo"],
             )
 
+    async def _clearbit_domain() -> str | None:
+        try:
+            domain = await _cached_clearbit_domain(company.name)
+            if domain:
+                logger.info(f"Found domain via Clearbit: {company.name} -> {domain}")
+                return domain
+        except Exception as e:
+            logger.debug(f"Clearbit domain lookup failed: {e}")
+        return None
+
+    async def _opencorporates_officers() -> list[str]:
+        try:
+            names = await _cached_officer_names(company.name, settings.opencorporates_api_key)
+            if names:
+                logger.info(f"OpenCorporates officers for {company.name}: {names[:2]}")
+            else:
+                logger.debug(f"OpenCorporates returned no officers for {company.name}")
+            return names
+        except Exception as e:
+            logger.debug(f"OpenCorporates officer lookup failed: {e}")
+        return []
+
     # Extract company domain from website
     company_domain = None
+    officer_names: list[str] = []
+    officers_fetched = False
     if company.website:
-        # Simple domain extraction
-        domain = (
-            company.website.replace("https://", "")
-            .replace("http://", "")
-            .replace("www.", "")
-            .split("/")[0]
-        )
-        company_domain = domain
+        company_domain = _extract_domain_from_url(company.website)
     else:
-        # Fallback Chain A: Clearbit domain suggestion (no Apollo)
-        if company.name and not company.name.startswith("Unknown"):
-            try:
-                clearbit_client = ClearbitClient()
-                try:
-                    suggestion = await clearbit_client.suggest_company(query=company.name)
-                    if suggestion and suggestion.domain:
-                        company_domain = suggestion.domain
-                        logger.info(
-                            f"Found domain via Clearbit: {company.name} -> {company_domain}"
-                        )
-                finally:
-                    await clearbit_client.aclose()
-            except Exception as e:
-                logger.debug(f"Clearbit domain lookup failed: {e}")
-
-        # Fallback Chain B: OpenCorporates officers (only if key configured)
-        officer_names: list[str] = []
-        if (
-            company.name
-            and not company.name.startswith("Unknown")
-            and settings.opencorporates_api_key
-        ):
-            try:
-                oc_client = OpenCorporatesClient(api_key=settings.opencorporates_api_key)
-                try:
-                    officer_names = await oc_client.find_officer_names_by_company(
-                        name=company.name
-                    )
-                    if officer_names:
-                        logger.info(
-                            f"OpenCorporates officers for {company.name}: {officer_names[:2]}"
-                        )
-                    else:
-                        logger.debug(
-                            f"OpenCorporates returned no officers for {company.name}"
-                        )
-                finally:
-                    await oc_client.aclose()
-            except Exception as e:
-                logger.debug(f"OpenCorporates officer lookup failed: {e}")
+        # Fallback Chains A + B run concurrently: Clearbit domain suggestion (no Apollo)
+        # and OpenCorporates officers (only if key configured). Both are free lookups.
+        if settings.opencorporates_api_key:
+            company_domain, officer_names = await asyncio.gather(
+                _clearbit_domain(), _opencorporates_officers()
+            )
+            officers_fetched = True
+        else:
+            company_domain = await _clearbit_domain()
 
         if officer_names and company_domain:
             for officer_name in officer_names[:2]:
                 try:
-                    decision_maker = await provider_manager.find_decision_maker_email(
+                    decision_maker = await provider_manager().find_decision_maker_email(
                         full_name=officer_name,
                         company_domain=company_domain,
                         title="Owner",
@@ -670,16 +1090,9 @@ async def find_decision_maker(
         # HYBRID STRATEGY: If we have company name but no domain, use Apollo to find it
         # This is the "bridge" that makes the free tier pipeline work
         try:
-            location_str = None
-            if geocode_result:
-                location_parts = []
-                if geocode_result.city:
-                    location_parts.append(geocode_result.city)
-                if geocode_result.state:
-                    location_parts.append(geocode_result.state)
-                location_str = ", ".join(location_parts) if location_parts else None
-
-            found_domain = await provider_manager.find_company_domain(
+            location_str = _location_from_geocode(geocode_result)
+
+            found_domain = await provider_manager().find_company_domain(
                 company_name=company.name,
                 location=location_str,
             )
@@ -696,12 +1109,10 @@ async def find_decision_maker(
     if permit and permit.applicant_name:
         if _is_likely_person_name(permit.applicant_name) and company_domain:
             # Parse name
-            name_parts = permit.applicant_name.strip().split(maxsplit=1)
-            first_name = name_parts[0] if name_parts else None
-            last_name = name_parts[1] if len(name_parts) > 1 else None
+            first_name, last_name = _split_person_name(permit.applicant_name)
 
             try:
-                decision_maker = await provider_manager.find_decision_maker_email(
+                decision_maker = await provider_manager().find_decision_maker_email(
                     first_name=first_name,
                     last_name=last_name,
                     full_name=permit.applicant_name,
@@ -725,7 +1136,7 @@ async def find_decision_maker(
     # Strategy 2: Hunter domain-search fallback (no person name required)
     if company_domain:
         try:
-            decision_maker = await provider_manager.find_any_contact_email_via_domain_search(
+            decision_maker = await provider_manager().find_any_contact_email_via_domain_search(
                 company_domain=company_domain
             )
             decision_maker = _accept_decision_maker(
@@ -744,7 +1155,7 @@ async def find_decision_maker(
     # Strategy 2.5: Use provider manager for company-based search (Apollo fallback)
     if company_domain or company.name:
         try:
-            decision_maker = await provider_manager.find_decision_maker_email(
+            decision_maker = await provider_manager().find_decision_maker_email(
                 company_name=company.name,
                 company_domain=company_domain,
                 title="Facility Director",  # Default title to search for
@@ -771,50 +1182,31 @@ async def find_decision_maker(
         and settings.opencorporates_api_key
     ):
         try:
-            oc_client = OpenCorporatesClient(
-                api_key=settings.opencorporates_api_key
-            )
-            try:
-                officer_names = await oc_client.find_officer_names_by_company(
-                    name=company.name
+            # Reuse the officers fetched during domain resolution when available.
+            if not officers_fetched:
+                officer_names = await _opencorporates_officers()
+            for officer_name in officer_names[:2]:
+                decision_maker = await provider_manager().find_decision_maker_email(
+                    full_name=officer_name,
+                    company_domain=company_domain,
+                    title="Owner",
                 )
-                if officer_names:
-                    logger.info(
-                        f"OpenCorporates officers for {company.name}: {officer_names[:2]}"
-                    )
-                else:
-                    logger.debug(f"OpenCorporates returned no officers for {company.name}")
-                for officer_name in officer_names[:2]:
-                    decision_maker = await provider_manager.find_decision_maker_email(
-                        full_name=officer_name,
-                        company_domain=company_domain,
-                        title="Owner",
-                    )
-                    decision_maker = _accept_decision_maker(
-                        decision_maker,
-                        company_domain=company_domain,
-                        company_name=company.name,
-                        source="opencorporates-officer",
-                    )
-                    if decision_maker:
-                        _log_credit_usage()
-                        return decision_maker
-            finally:
-                await oc_client.aclose()
+                decision_maker = _accept_decision_maker(
+                    decision_maker,
+                    company_domain=company_domain,
+                    company_name=company.name,
+                    source="opencorporates-officer",
+                )
+                if decision_maker:
+                    _log_credit_usage()
+                    return decision_maker
         except Exception as e:
             logger.debug(f"OpenCorporates officer lookup failed: {e}")
 
     # Strategy 4: Search snippets + LLM parsing (company name -> person) then Hunter
     if company.name and not company.name.startswith("Unknown"):
         try:
-            location_str = None
-            if geocode_result:
-                location_parts = []
-                if geocode_result.city:
-                    location_parts.append(geocode_result.city)
-                if geocode_result.state:
-                    location_parts.append(geocode_result.state)
-                location_str = ", ".join(location_parts) if location_parts else None
+            location_str = _location_from_geocode(geocode_result)
 
             queries = [
                 f'"{company.name}" owner OR president OR director',
@@ -823,19 +1215,21 @@ async def find_decision_maker(
             if location_str:
                 queries.append(f'"{company.name}" "{location_str}" owner')
 
-            snippet_client = SearchSnippetClient()
-            try:
-                snippets = []
-                for query in queries:
-                    results = await snippet_client.search(query=query, limit=5)
-                    snippets.extend(
-                        [
-                            {"title": r.title, "snippet": r.snippet, "url": r.url}
-                            for r in results
-                        ]
-                    )
-            finally:
-                await snippet_client.aclose()
+            snippet_client = _get_snippet_client()
+
+            async def _search(query: str) -> list[SearchSnippet]:
+                async with provider_slot("snippets"):
+                    return await snippet_client.search(query=query, limit=5)
+
+            batches = await asyncio.gather(
+                *(_search(query) for query in queries), return_exceptions=True
+            )
+            snippets: list[SearchSnippet] = []
+            for query, results in zip(queries, batches):
+                if isinstance(results, BaseException):
+                    logger.debug(f"Snippet search failed for {query!r}: {results}")
+                    continue
+                snippets.extend(results)
 
             if snippets:
                 # If we still don't have a domain, try to derive from snippet URLs
@@ -878,7 +1272,7 @@ async def find_decision_maker(
                         for domain in domains_to_try:
                             if not domain:
                                 continue
-                            decision_maker = await provider_manager.find_decision_maker_email(
+                            decision_maker = await provider_manager().find_decision_maker_email(
                                 full_name=extraction.person_name,
                                 company_domain=domain,
                                 title=extraction.title or "Owner",
@@ -892,7 +1286,7 @@ async def find_decision_maker(
                             if decision_maker:
                                 _log_credit_usage()
                                 return decision_maker
-                            decision_maker = await provider_manager.find_decision_maker_email_via_domain_search(
+                            decision_maker = await provider_manager().find_decision_maker_email_via_domain_search(
                                 full_name=extraction.person_name,
                                 company_domain=domain,
                             )
@@ -934,23 +1328,21 @@ def build_compliance_context(
     if geocode_result:
         jurisdiction = geocode_result.state or geocode_result.county
 
-    # Extract applicable codes from updates
-    applicable_codes = []
-    for update in regulatory_updates:
-        applicable_codes.extend(update.applicable_codes)
-
-    # Extract compliance triggers
-    triggers = []
-    for update in regulatory_updates:
-        triggers.extend(update.compliance_triggers)
-        # Also add update title as a trigger if no specific triggers
-        if not update.compliance_triggers:
-            triggers.append(update.title)
+    # Codes and triggers are streamed straight into order-preserving dedupe; an
+    # update without specific triggers contributes its title as the trigger.
+    applicable_codes = dict.fromkeys(
+        chain.from_iterable(update.applicable_codes for update in regulatory_updates)
+    )
+    triggers = dict.fromkeys(
+        chain.from_iterable(
+            update.compliance_triggers or (update.title,) for update in regulatory_updates
+        )
+    )
 
     return ComplianceContext(
         jurisdiction=jurisdiction,
-        applicable_codes=list(set(applicable_codes)),  # Deduplicate
-        triggers=list(set(triggers)),  # Deduplicate
+        applicable_codes=list(applicable_codes),
+        triggers=list(triggers),
         inspection_history=[],  # Not available from permit data alone
     )
 
@@ -965,36 +1357,103 @@ async def enrich_permit_to_lead(inputs: EnrichmentInputs) -> EnrichedLead:
     Returns:
         EnrichedLead with all enriched information
     """
-    settings = get_settings()
-
     # Step 1: Geocode address
-    geocode_result: GeocodeResult | None = None
+    async def _geocode() -> GeocodeResult | None:
+        try:
+            geocode_result = await geocode_address(inputs.permit.address)
+            logger.debug(
+                f"Geocoded address: {inputs.permit.address} -> "
+                f"{geocode_result.city}, {geocode_result.state}"
+            )
+            return geocode_result
+        except Exception as e:
+            logger.warning(f"Geocoding failed for {inputs.permit.address}: {e}")
+            # Continue without geocoding - not critical
+            return None
+
+    # The company name is known before geocoding, so a name-only company lookup
+    # runs alongside it; match_company() refines with the location only on a miss.
+    geocode_result, name_match = await asyncio.gather(
+        _geocode(), _guarded_lookup_company(_company_name_from_permit(inputs.permit), None)
+    )
+    return await _enrich_geocoded_permit(inputs, geocode_result, name_match=name_match)
+
+
+async def enrich_permits_to_leads(
+    inputs_list: list[EnrichmentInputs], *, concurrency: int = 8
+) -> list[EnrichedLead | None]:
+    """
+    Batch variant of enrich_permit_to_lead().
+
+    All addresses are geocoded up front in one concurrent batch, then the permits
+    run through the rest of the pipeline concurrently, bounded by `concurrency`
+    (provider calls are further capped per provider by provider_slot()).
+
+    Args:
+        inputs_list: Enrichment inputs (tenant_id, permit) for each permit
+        concurrency: Max permits enriched at once
+
+    Returns:
+        One EnrichedLead per input, in order (None where that permit's enrichment
+        failed; the error is logged and the rest of the batch continues)
+    """
     try:
-        geocode_result = await geocode_address(inputs.permit.address)
-        logger.debug(
-            f"Geocoded address: {inputs.permit.address} -> "
-            f"{geocode_result.city}, {geocode_result.state}"
-        )
+        geocodes = await geocode_addresses([inputs.permit.address for inputs in inputs_list])
     except Exception as e:
-        logger.warning(f"Geocoding failed for {inputs.permit.address}: {e}")
-        # Continue without geocoding - not critical
+        logger.warning(f"Batch geocoding failed: {e}")
+        geocodes = [None] * len(inputs_list)
 
-    # Step 2: Match company (enhanced logic)
-    company = await match_company(inputs.permit, geocode_result)
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-    # Step 3: Find decision maker (using ProviderManager: Hunter.io → Apollo)
-    decision_maker: DecisionMaker | None = None
-    if settings.enable_enrichment:
-        try:
-            decision_maker = await find_decision_maker(company, geocode_result, inputs.permit)
-        except RuntimeError as e:
-            # Credit limit reached - log warning but continue with enrichment
-            logger.warning(f"Decision maker search stopped: {e}")
-            decision_maker = None
+    async def _enrich_one(
+        inputs: EnrichmentInputs, geocode_result: GeocodeResult | None
+    ) -> EnrichedLead | None:
+        if geocode_result is None:
+            logger.warning(f"Geocoding failed for {inputs.permit.address}")
+        async with sem:
+            try:
+                return await _enrich_geocoded_permit(inputs, geocode_result)
+            except Exception as e:
+                logger.error(
+                    f"Error enriching permit {inputs.permit.permit_id}: {e}", exc_info=True
+                )
+                return None
+
+    return await asyncio.gather(
+        *(_enrich_one(inputs, geocode) for inputs, geocode in zip(inputs_list, geocodes))
+    )
+
+
+async def _enrich_geocoded_permit(
+    inputs: EnrichmentInputs,
+    geocode_result: GeocodeResult | None,
+    *,
+    name_match: tuple[ApolloCompany | None, ClearbitCompany | None] | None = None,
+) -> EnrichedLead:
+    """Steps 2-6 of the enrichment pipeline for an already-geocoded permit."""
+    settings = get_settings()
 
-    # Step 4: Match regulatory updates
-    regulatory_matches: list[RegulatoryUpdate] = []
-    if settings.enable_enrichment:
+    # Steps 2-3 (company -> decision maker) and step 4 (regulatory matching) are
+    # independent given the geocode, so the two branches run concurrently.
+    async def _company_branch() -> tuple[Company, DecisionMaker | None]:
+        # Step 2: Match company (enhanced logic)
+        company = await match_company(inputs.permit, geocode_result, name_match=name_match)
+
+        # Step 3: Find decision maker (using ProviderManager: Hunter.io → Apollo)
+        decision_maker: DecisionMaker | None = None
+        if settings.enable_enrichment:
+            try:
+                decision_maker = await find_decision_maker(company, geocode_result, inputs.permit)
+            except RuntimeError as e:
+                # Credit limit reached - log warning but continue with enrichment
+                logger.warning(f"Decision maker search stopped: {e}")
+                decision_maker = None
+        return company, decision_maker
+
+    async def _regulatory_branch() -> list[RegulatoryUpdate]:
+        # Step 4: Match regulatory updates
+        if not settings.enable_enrichment:
+            return []
         try:
             regulatory_matches = await match_regulatory_updates(inputs.permit, geocode_result)
             if regulatory_matches:
@@ -1002,8 +1461,14 @@ async def enrich_permit_to_lead(inputs: EnrichmentInputs) -> EnrichedLead:
                     f"Matched {len(regulatory_matches)} regulatory updates to permit "
                     f"{inputs.permit.permit_id}"
                 )
+            return regulatory_matches
         except Exception as e:
             logger.warning(f"Regulatory matching failed: {e}")
+            return []
+
+    (company, decision_maker), regulatory_matches = await asyncio.gather(
+        _company_branch(), _regulatory_branch()
+    )
 
     # Step 5: Build compliance context
     compliance_context = build_compliance_context(regulatory_matches, geocode_result)
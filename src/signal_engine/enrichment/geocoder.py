@@ -2,21 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
+import sqlite3
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 
+from src.signal_engine.enrichment.client_pool import HTTP2_AVAILABLE, json_loads
+from src.signal_engine.enrichment.provider_limits import provider_rate_limit
+
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+_ADDRESS_NOISE_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize_address(address: str) -> str:
+    """
+    Cache key for an address: lowercase alphanumerics separated by single spaces.
+
+    "123 Main St, Dallas, TX" and "123 main st. Dallas tx" share one cache entry;
+    the API is still queried with the original address text.
+    """
+    return _ADDRESS_NOISE_RE.sub(" ", address.lower()).strip()
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeocodeResult:
     """Result of geocoding an address."""
 
@@ -41,7 +59,9 @@ class Geocoder:
     Geocoding service using Nominatim (OpenStreetMap) API.
 
     Free, no API key required, but has rate limits (1 request/second recommended).
-    Implements caching to reduce API calls.
+    Implements caching to reduce API calls: results live in a SQLite (WAL) table,
+    one row per address, so lookups and inserts are point operations and several
+    enrichment processes can share the cache file.
     """
 
     def __init__(
@@ -52,6 +72,8 @@ class Geocoder:
         cache_file: Path | str | None = None,
         cache_enabled: bool = True,
         user_agent: str = "AORO-Enrichment/1.0",
+        max_concurrency: int = 10,
+        negative_ttl_s: float = 30 * 86400,
     ):
         """
         Initialize geocoder.
@@ -59,57 +81,176 @@ class Geocoder:
         Args:
             base_url: Nominatim API base URL
             timeout_s: Request timeout in seconds
-            cache_file: Path to cache file (default: data/geocoding_cache.json)
+            cache_file: Path to cache file (default: data/geocoding_cache.sqlite3).
+                A legacy .json path is migrated into a .sqlite3 file beside it.
             cache_enabled: Enable caching of results
             user_agent: User agent string (required by Nominatim)
+            max_concurrency: Max in-flight API requests for geocode_batch(); every
+                request also waits for the "nominatim" PROVIDER_RATES bucket (1 req/s)
+            negative_ttl_s: How long an address with no usable result is skipped
         """
         self.base_url = base_url.rstrip("/")
         self.timeout_s = timeout_s
         self.cache_enabled = cache_enabled
+        self.max_concurrency = max(1, max_concurrency)
+        self.negative_ttl_s = negative_ttl_s
 
         if cache_file is None:
-            cache_file = Path("data/geocoding_cache.json")
+            cache_file = Path("data/geocoding_cache.sqlite3")
         elif isinstance(cache_file, str):
             cache_file = Path(cache_file)
 
+        self._legacy_file = cache_file.with_suffix(".json")
+        if cache_file.suffix == ".json":
+            cache_file = cache_file.with_suffix(".sqlite3")
+
         self.cache_file = cache_file
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
         self._client = httpx.AsyncClient(
             timeout=timeout_s,
             headers={"User-Agent": user_agent},
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0
+            ),
         )
-        self._cache: dict[str, dict] = {}
-        self._load_cache()
+        self._db: sqlite3.Connection | None = None
+        self._cache_opening: asyncio.Future | None = None
 
-    def _load_cache(self) -> None:
-        """Load cache from file."""
-        if not self.cache_enabled or not self.cache_file.exists():
+    async def _ensure_cache(self) -> None:
+        """Open the cache on first use, off the event loop (it may import a large JSON)."""
+        if not self.cache_enabled or self._db is not None:
             return
+        if self._cache_opening is None:
+            self._cache_opening = asyncio.ensure_future(asyncio.to_thread(self._open_cache))
+        await asyncio.shield(self._cache_opening)
 
+    def _open_cache(self) -> None:
+        """Open (or create) the SQLite cache, importing a legacy JSON cache once."""
+        legacy_file = self._legacy_file
         try:
-            content = self.cache_file.read_text()
-            self._cache = json.loads(content)
-            logger.debug(f"Loaded {len(self._cache)} geocoding results from cache")
+            db = sqlite3.connect(self.cache_file, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL makes each commit a WAL append without fsync, so
+            # committing every result is cheap and survives a process crash.
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geo ("
+                "addr TEXT PRIMARY KEY, lat REAL, lon REAL, fmt TEXT, "
+                "city TEXT, county TEXT, state TEXT, country TEXT)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geo_miss (addr TEXT PRIMARY KEY, failed_at REAL)"
+            )
+            empty = db.execute("SELECT 1 FROM geo LIMIT 1").fetchone() is None
+            if empty and legacy_file.exists():
+                legacy = json_loads(legacy_file.read_bytes())
+                db.executemany(
+                    "INSERT OR REPLACE INTO geo VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (
+                            _normalize_address(addr),
+                            row["latitude"],
+                            row["longitude"],
+                            row["formatted_address"],
+                            row.get("city"),
+                            row.get("county"),
+                            row.get("state"),
+                            row.get("country"),
+                        )
+                        for addr, row in legacy.items()
+                    ),
+                )
+                logger.info(f"Imported {len(legacy)} geocoding results from {legacy_file}")
+            db.commit()
+            self._db = db
         except Exception as e:
-            logger.warning(f"Failed to load geocoding cache: {e}")
-            self._cache = {}
+            logger.warning(f"Failed to open geocoding cache: {e}")
+            self._db = None
+
+    def _cache_get(self, address: str) -> GeocodeResult | None:
+        """Return the cached result for an address, if any."""
+        address = _normalize_address(address)
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT lat, lon, fmt, city, county, state, country FROM geo WHERE addr = ?",
+            (address,),
+        ).fetchone()
+        if row is None:
+            return None
+        lat, lon, fmt, city, county, state, country = row
+        return GeocodeResult(
+            latitude=lat,
+            longitude=lon,
+            formatted_address=fmt,
+            city=city,
+            county=county,
+            state=state,
+            country=country,
+        )
 
-    def _save_cache(self) -> None:
-        """Save cache to file."""
-        if not self.cache_enabled:
+    def _cache_put(self, address: str, result: GeocodeResult) -> None:
+        """Insert and commit a result, so work survives a crash mid-run."""
+        if self._db is None:
             return
-
+        address = _normalize_address(address)
         try:
-            self.cache_file.write_text(json.dumps(self._cache, indent=2))
-            logger.debug(f"Saved {len(self._cache)} geocoding results to cache")
-        except Exception as e:
-            logger.warning(f"Failed to save geocoding cache: {e}")
+            self._db.execute(
+                "INSERT OR REPLACE INTO geo VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    address,
+                    result.latitude,
+                    result.longitude,
+                    result.formatted_address,
+                    result.city,
+                    result.county,
+                    result.state,
+                    result.country,
+                ),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save geocoding result: {e}")
+
+    def _is_known_miss(self, address: str) -> bool:
+        """True if the address recently had no usable result (negative cache)."""
+        if self._db is None:
+            return False
+        row = self._db.execute(
+            "SELECT failed_at FROM geo_miss WHERE addr = ?", (_normalize_address(address),)
+        ).fetchone()
+        return row is not None and time.time() - row[0] < self.negative_ttl_s
+
+    def _cache_miss(self, address: str) -> None:
+        """Remember an address Nominatim cannot resolve so repeats skip the API."""
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geo_miss VALUES (?, ?)",
+                (_normalize_address(address), time.time()),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save geocoding miss: {e}")
 
     async def aclose(self) -> None:
-        """Close HTTP client and save cache."""
+        """Close HTTP client and flush the cache."""
         await self._client.aclose()
-        self._save_cache()
+        if self._cache_opening is not None and not self._cache_opening.done():
+            await asyncio.shield(self._cache_opening)
+        await asyncio.to_thread(self._close_cache)
+
+    def _close_cache(self) -> None:
+        if self._db is not None:
+            try:
+                self._db.commit()
+                self._db.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to save geocoding cache: {e}")
+            self._db = None
 
     async def geocode(self, address: str) -> GeocodeResult:
         """
@@ -126,12 +267,15 @@ class Geocoder:
         """
         # Normalize address (strip whitespace, etc.)
         address = address.strip()
+        await self._ensure_cache()
 
         # Check cache first
-        if self.cache_enabled and address in self._cache:
-            cached = self._cache[address]
+        cached = self._cache_get(address)
+        if cached is not None:
             logger.debug(f"Using cached geocoding result for: {address[:50]}")
-            return GeocodeResult(**cached)
+            return cached
+        if self._is_known_miss(address):
+            raise GeocodingError(f"No results found for address (cached): {address}")
 
         try:
             # Call Nominatim API
@@ -143,14 +287,19 @@ class Geocoder:
                 "addressdetails": 1,  # Include detailed address components
             }
 
+            await provider_rate_limit("nominatim")
             resp = await self._client.get(url, params=params)
 
             if resp.status_code >= 400:
+                # 4xx (other than throttling) means this query will never resolve.
+                if resp.status_code < 500 and resp.status_code != 429:
+                    self._cache_miss(address)
                 raise GeocodingError(f"Geocoding API error {resp.status_code}: {resp.text}")
 
-            data = resp.json()
+            data = json_loads(resp.content)
 
             if not data:
+                self._cache_miss(address)
                 raise GeocodingError(f"No results found for address: {address}")
 
             # Parse first result
@@ -183,16 +332,7 @@ class Geocoder:
             )
 
             # Cache result
-            if self.cache_enabled:
-                self._cache[address] = {
-                    "latitude": lat,
-                    "longitude": lon,
-                    "formatted_address": formatted,
-                    "city": city,
-                    "county": county,
-                    "state": state,
-                    "country": country,
-                }
+            self._cache_put(address, geocode_result)
 
             return geocode_result
 
@@ -203,9 +343,74 @@ class Geocoder:
         except Exception as e:
             raise GeocodingError(f"Unexpected error during geocoding: {e}") from e
 
+    async def geocode_batch(self, addresses: list[str]) -> list[GeocodeResult | None]:
+        """
+        Geocode many addresses concurrently.
+
+        Addresses are deduplicated, cache hits are answered without touching the
+        network, and misses are fetched concurrently (bounded by max_concurrency)
+        over the shared HTTP client.
+
+        Args:
+            addresses: Address strings to geocode
+
+        Returns:
+            One result per input address, in order (None where geocoding failed)
+        """
+        await self._ensure_cache()
+        keys = [_normalize_address(address) for address in addresses]
+        # First spelling of each distinct address is the one sent to the API.
+        queries = dict(zip(reversed(keys), reversed(addresses)))
+        results: dict[str, GeocodeResult | None] = {}
+        misses: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self._cache_get(key) if key else None
+            if key and cached is None:
+                misses.append(key)
+            else:
+                results[key] = cached
+
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _geocode_one(address: str) -> GeocodeResult | None:
+            async with sem:
+                try:
+                    return await self.geocode(address)
+                except GeocodingError as e:
+                    logger.debug(f"Batch geocoding failed for {address[:50]}: {e}")
+                    return None
+
+        fetched = await asyncio.gather(*(_geocode_one(queries[key]) for key in misses))
+        results.update(zip(misses, fetched))
+        return [results[key] for key in keys]
+
 
 # Global geocoder instance (lazy initialization)
 _geocoder: Geocoder | None = None
+# Event loop the global geocoder's HTTP client is bound to. Creation never awaits,
+# so coroutines cannot race on it; a geocoder left over from a finished loop (e.g. a
+# second asyncio.run()) is replaced instead of reusing its dead client.
+_geocoder_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_geocoder() -> Geocoder:
+    global _geocoder, _geocoder_loop
+
+    loop = asyncio.get_running_loop()
+    if _geocoder is not None and _geocoder_loop not in (None, loop):
+        _geocoder._close_cache()
+        _geocoder = None
+    _geocoder_loop = loop
+
+    if _geocoder is None:
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        _geocoder = Geocoder(
+            cache_enabled=settings.enrichment_cache_enabled,
+        )
+
+    return _geocoder
 
 
 async def geocode_address(address: str) -> GeocodeResult:
@@ -218,17 +423,20 @@ async def geocode_address(address: str) -> GeocodeResult:
     Returns:
         GeocodeResult with coordinates and jurisdiction info
     """
-    global _geocoder
+    return await _get_geocoder().geocode(address)
 
-    if _geocoder is None:
-        from src.core.config import get_settings
 
-        settings = get_settings()
-        _geocoder = Geocoder(
-            cache_enabled=settings.enrichment_cache_enabled,
-        )
+async def geocode_addresses(addresses: list[str]) -> list[GeocodeResult | None]:
+    """
+    Convenience function to batch-geocode addresses using the global geocoder.
+
+    Args:
+        addresses: Address strings to geocode
 
-    return await _geocoder.geocode(address)
+    Returns:
+        One result per input address, in order (None where geocoding failed)
+    """
+    return await _get_geocoder().geocode_batch(addresses)
 
 
 async def close_geocoder() -> None:
@@ -3,20 +3,120 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass
+import random
+import re
+import time
+import unicodedata
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 import httpx
 
+from src.signal_engine.enrichment.client_pool import HTTP2_AVAILABLE, json_loads, short_text
+from src.signal_engine.enrichment.lookup_cache import LookupCache
+from src.signal_engine.enrichment.provider_limits import (
+    AIMDGate,
+    CircuitBreaker,
+    provider_rate_limit,
+)
+from src.signal_engine.enrichment.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Emails below this Hunter confidence score are treated as not found.
+_MIN_CONFIDENCE = 80
+
+# Cheap sanity checks that reject dirty permit data before it costs a request/credit.
+_DOMAIN_RE = re.compile(r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)(?:\.[A-Za-z0-9-]{1,63})+")
+_NAME_RE = re.compile(r"[\w'.\- ]{1,64}")
+
+
+@functools.lru_cache(maxsize=8192)
+def _split_full_name(full_name: str) -> tuple[str, ...]:
+    return tuple(unicodedata.normalize("NFKC", full_name).strip().split(maxsplit=1))
+
+
+def _resolve_name(
+    first_name: str | None, last_name: str | None, full_name: str | None
+) -> tuple[str | None, str | None]:
+    """Fill first/last name from full_name ("Jane van Doe" -> "Jane", "van Doe") when missing."""
+    if full_name and not (first_name and last_name):
+        parts = _split_full_name(full_name)
+        if len(parts) == 2:
+            return parts[0], parts[1]
+        if parts:
+            return parts[0], last_name
+    return first_name, last_name
+
+
+def _valid_lookup(first_name: str, last_name: str | None, domain: str) -> bool:
+    return bool(
+        _DOMAIN_RE.fullmatch(domain)
+        and _NAME_RE.fullmatch(first_name)
+        and (not last_name or _NAME_RE.fullmatch(last_name))
+    )
+
+# Shared by every HunterClient (ProviderManager creates one per call): in-flight
+# requests adapt to observed latency and back off on 429/5xx. Email-finder calls
+# routinely take several seconds, so only latency well past that counts as overload.
+_HUNTER_GATE = AIMDGate(latency_target_s=6.0)
+# Opens after repeated 5xx/transport failures so an outage fails calls immediately.
+_HUNTER_BREAKER = CircuitBreaker()
+
+# Pause everyone once the rate-limit window is nearly exhausted (at most 2 requests
+# and under 10% of the limit left). Pauses are capped because a far-off reset means
+# a spent quota, which waiting cannot fix.
+_LOW_REMAINING = 2
+_LOW_REMAINING_FRACTION = 0.1
+_MAX_PROACTIVE_PAUSE_S = 60.0
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date form)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _domain_key(domain: str) -> str:
+    """Cache/single-flight key for a domain ("WWW.Acme.com " and "acme.com" coincide)."""
+    return domain.strip().lower().removeprefix("www.")
+
+
+def _header_float(headers: httpx.Headers, name: str) -> float | None:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
 
 class HunterError(RuntimeError):
     """Error during Hunter.io API call."""
     pass
 
 
-@dataclass(frozen=True)
+class HunterCircuitOpenError(HunterError):
+    """Request refused without being sent because the Hunter circuit is open."""
+
+
+@dataclass(frozen=True, slots=True)
 class HunterEmailResult:
     """Result from Hunter.io email finder."""
 
@@ -28,7 +128,7 @@ class HunterEmailResult:
     domain: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HunterEmailRecord:
     email: str | None = None
     first_name: str | None = None
@@ -37,12 +137,17 @@ class HunterEmailRecord:
     confidence: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HunterDomainSearchResult:
     pattern: str | None = None
     emails: list[HunterEmailRecord] | None = None
 
 
+def _domain_search_from_dict(data: dict) -> HunterDomainSearchResult:
+    emails = [HunterEmailRecord(**entry) for entry in data.get("emails") or []]
+    return HunterDomainSearchResult(pattern=data.get("pattern"), emails=emails)
+
+
 class MockHunterClient:
     """
     Mock Hunter.io client for zero-cost testing.
@@ -88,21 +193,15 @@ class MockHunterClient:
         if not domain:
             return None
 
-        # Parse full_name if provided
-        if full_name and not (first_name and last_name):
-            parts = full_name.strip().split(maxsplit=1)
-            if len(parts) == 2:
-                first_name = parts[0]
-                last_name = parts[1]
-            elif len(parts) == 1:
-                first_name = parts[0]
+        first_name, last_name = _resolve_name(first_name, last_name, full_name)
 
-        if not first_name:
+        domain = domain.strip()
+        if not first_name or not _valid_lookup(first_name, last_name, domain):
             return None
 
         # Return mock response
         email = f"{first_name.lower()}.{last_name.lower() if last_name else 'test'}@{domain}"
-        logger.debug(f"[MOCK] Would return email: {email}")
+        logger.debug("[MOCK] Would return email: %s", email)
 
         return HunterEmailResult(
             email=email,
@@ -129,8 +228,12 @@ class HunterClient:
         *,
         api_key: str,
         base_url: str = "https://api.hunter.io/v2",
-        timeout_s: float = 30.0,
+        timeout_s: float = 10.0,
+        connect_timeout_s: float = 3.0,
+        http_client: httpx.AsyncClient | None = None,
         dry_run: bool = False,
+        cache_ttl_s: float = 86400.0,
+        cache_path: Path | str | None = None,
     ):
         """
         Initialize Hunter client.
@@ -138,57 +241,162 @@ class HunterClient:
         Args:
             api_key: Hunter.io API key
             base_url: API base URL
-            timeout_s: Request timeout
+            timeout_s: Read timeout; a stuck response fails (and counts toward the
+                circuit breaker) instead of stalling the batch
+            connect_timeout_s: Connect/write timeout
+            http_client: Optional shared AsyncClient (not closed by aclose())
             dry_run: If True, only log what would be sent (no real API calls)
+            cache_ttl_s: How long found/not-found results are reused (0 disables)
+            cache_path: Optional SQLite file that keeps results across runs (same TTL)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._email_finder_url = f"{self.base_url}/email-finder"
+        self._domain_search_url = f"{self.base_url}/domain-search"
         self.dry_run = dry_run
-        self._client = httpx.AsyncClient(timeout=timeout_s)
+        # An injected client is shared with other callers, so aclose() leaves it open.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=connect_timeout_s, read=timeout_s, write=connect_timeout_s, pool=10.0
+            ),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0
+            ),
+        )
+        self._cache = ResultCache(ttl_s=cache_ttl_s)
+        self._disk = LookupCache(cache_path, ttl_s=cache_ttl_s) if cache_path else None
+        # Last X-RateLimit-* values seen, so callers can back off whole batches.
+        self.rate_limit_remaining: int | None = None
+        self.rate_limit_reset_s: float | None = None
 
         # Detect test key
         if api_key == "test-api-key":
             logger.info("Test API key detected - using mock mode")
             self.dry_run = True
 
+    @property
+    def circuit_open(self) -> bool:
+        """True while the shared Hunter circuit breaker is refusing requests."""
+        return _HUNTER_BREAKER.refusing()
+
     async def aclose(self) -> None:
         """Close HTTP client."""
-        await self._client.aclose()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _cached(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[Any]],
+        decode: Callable[[dict], Any],
+    ) -> Any:
+        """Memory cache -> persistent cache (when cache_path is set) -> network."""
+
+        async def _load() -> Any:
+            if self._disk is None:
+                return await fetch()
+            namespace, disk_key = f"hunter_{key[0]}", "|".join(str(part) for part in key[1:])
+            # SQLite calls run in a worker thread so a slow disk doesn't stall the loop.
+            disk = self._disk
+            payload = await asyncio.to_thread(disk.get, namespace, disk_key)
+            if payload is not LookupCache.MISSING:
+                return decode(payload) if payload is not None else None
+            value = await fetch()
+            await asyncio.to_thread(
+                disk.set, namespace, disk_key, asdict(value) if value is not None else None
+            )
+            return value
+
+        return await self._cache.get_or_fetch(key, _load)
+
+    def _observe_rate_limit(self, headers: httpx.Headers) -> None:
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if reset is not None and reset > 1e9:  # Epoch timestamp rather than seconds
+            reset -= time.time()
+        self.rate_limit_remaining = int(remaining)
+        self.rate_limit_reset_s = max(0.0, reset) if reset is not None else None
+
+        low = remaining <= _LOW_REMAINING and (
+            limit is None or remaining < limit * _LOW_REMAINING_FRACTION
+        )
+        if low and self.rate_limit_reset_s:
+            pause_s = min(self.rate_limit_reset_s, _MAX_PROACTIVE_PAUSE_S)
+            logger.info(
+                "Hunter rate limit nearly exhausted (%d left); pausing %.0fs", remaining, pause_s
+            )
+            _HUNTER_GATE.pause(pause_s)
 
     async def _get_json(
         self,
         *,
         url: str,
-        params: dict,
+        params: list[tuple[str, str | int]],
         retries: int = 2,
         backoff_s: float = 1.0,
+        max_backoff_s: float = 10.0,
+        jitter: bool = True,
     ) -> httpx.Response:
         """
         GET helper with basic retry/backoff for rate limiting and transient errors.
+
+        Without a Retry-After header, retries wait a "full jitter" delay drawn from
+        [0, min(backoff_s * 2**attempt, max_backoff_s)] so coroutines that failed
+        together don't retry in lockstep.
         """
+
+        def _backoff(attempt: int) -> float:
+            ceiling = min(backoff_s * (2**attempt), max_backoff_s)
+            return random.uniform(0, ceiling) if jitter else ceiling
+
         last_exc: Exception | None = None
         for attempt in range(retries + 1):
-            try:
-                resp = await self._client.get(url, params=params)
-            except httpx.HTTPError as exc:
-                last_exc = exc
+            if not _HUNTER_BREAKER.allow():
+                raise HunterCircuitOpenError("Hunter circuit open; skipping request")
+            await provider_rate_limit("hunter")
+            async with _HUNTER_GATE.slot():
+                start = time.monotonic()
+                try:
+                    resp = await self._client.get(url, params=params)
+                except httpx.HTTPError as exc:
+                    _HUNTER_GATE.on_overload()
+                    _HUNTER_BREAKER.record_failure()
+                    last_exc = exc
+                    resp = None
+                else:
+                    if resp.status_code in _RETRY_STATUSES:
+                        _HUNTER_GATE.on_overload()
+                    else:
+                        _HUNTER_GATE.on_success(time.monotonic() - start)
+                    if resp.status_code >= 500:
+                        _HUNTER_BREAKER.record_failure()
+                    else:
+                        _HUNTER_BREAKER.record_success()
+                    self._observe_rate_limit(resp.headers)
+
+            if resp is None:
                 if attempt >= retries:
-                    raise
-                await asyncio.sleep(min(backoff_s * (2**attempt), 10))
+                    raise last_exc
+                await asyncio.sleep(_backoff(attempt))
                 continue
 
-            if resp.status_code in (429, 500, 502, 503, 504):
+            if resp.status_code in _RETRY_STATUSES:
                 if attempt >= retries:
                     return resp
-                retry_after = resp.headers.get("Retry-After")
-                sleep_s = None
-                if retry_after:
-                    try:
-                        sleep_s = float(retry_after)
-                    except ValueError:
-                        sleep_s = None
+                sleep_s = _parse_retry_after(resp.headers.get("Retry-After"))
                 if sleep_s is None:
-                    sleep_s = min(backoff_s * (2**attempt), 10)
+                    sleep_s = _backoff(attempt)
+                elif resp.status_code == 429:
+                    # The whole account is throttled, not just this request.
+                    _HUNTER_GATE.pause(sleep_s)
                 await asyncio.sleep(sleep_s)
                 continue
 
@@ -223,73 +431,82 @@ class HunterClient:
         if not domain:
             return None
 
-        # Parse full_name if provided
-        if full_name and not (first_name and last_name):
-            parts = full_name.strip().split(maxsplit=1)
-            if len(parts) == 2:
-                first_name = parts[0]
-                last_name = parts[1]
-            elif len(parts) == 1:
-                first_name = parts[0]
+        first_name, last_name = _resolve_name(first_name, last_name, full_name)
 
-        if not first_name:
+        domain = domain.strip()
+        if not first_name or not _valid_lookup(first_name, last_name, domain):
             return None
 
-        url = f"{self.base_url}/email-finder"
-        params = {
-            "api_key": self.api_key,
-            "domain": domain,
-            "first_name": first_name,
-            "last_name": last_name,
-        }
-
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
+        url = self._email_finder_url
+        params: list[tuple[str, str | int]] = [
+            ("api_key", self.api_key),
+            ("domain", domain),
+            ("first_name", first_name),
+        ]
+        if last_name:
+            params.append(("last_name", last_name))
 
         # Dry-run mode: just log what would be sent
         if self.dry_run:
             logger.info(
-                f"[DRY RUN] Would call Hunter.io email-finder: "
-                f"{first_name} {last_name or ''} @ {domain}"
+                "[DRY RUN] Would call Hunter.io email-finder: %s %s @ %s",
+                first_name,
+                last_name or "",
+                domain,
             )
-            logger.debug(f"[DRY RUN] URL: {url}, Params: {params}")
+            logger.debug("[DRY RUN] URL: %s, Params: %s", url, params)
             return None
 
-        try:
-            resp = await self._get_json(url=url, params=params)
+        async def _fetch() -> HunterEmailResult | None:
+            try:
+                resp = await self._get_json(url=url, params=params)
 
-            # 404 = no email found, doesn't cost a credit
-            if resp.status_code == 404:
-                logger.debug(f"No email found for {first_name} @ {domain} (no credit charged)")
-                return None
+                # 404 = no email found, doesn't cost a credit
+                if resp.status_code == 404:
+                    logger.debug(
+                        "No email found for %s @ %s (no credit charged)", first_name, domain
+                    )
+                    return None
 
-            if resp.status_code >= 400:
-                raise HunterError(f"Hunter.io error {resp.status_code}: {resp.text}")
+                if resp.status_code >= 400:
+                    raise HunterError(
+                        f"Hunter.io error {resp.status_code}: {short_text(resp.text)}"
+                    )
 
-            data = resp.json().get("data", {})
+                data = json_loads(resp.content).get("data", {})
 
-            if not data.get("email"):
-                return None
+                if not data.get("email"):
+                    return None
 
-            # Extract confidence score
-            score = data.get("score")
-            if score and score < 80:
-                logger.debug(
-                    f"Email found but low confidence ({score}%): {data.get('email')} - skipping"
+                # Extract confidence score
+                score = data.get("score")
+                if score and score < _MIN_CONFIDENCE:
+                    logger.debug(
+                        "Email found but low confidence (%s%%): %s - skipping",
+                        score,
+                        data.get("email"),
+                    )
+                    return None
+
+                return HunterEmailResult(
+                    email=data.get("email"),
+                    score=score,
+                    sources=data.get("sources", []),
+                    first_name=data.get("first_name") or first_name,
+                    last_name=data.get("last_name") or last_name,
+                    domain=domain,
                 )
-                return None
-
-            return HunterEmailResult(
-                email=data.get("email"),
-                score=score,
-                sources=data.get("sources", []),
-                first_name=data.get("first_name") or first_name,
-                last_name=data.get("last_name") or last_name,
-                domain=domain,
-            )
 
-        except httpx.HTTPError as e:
-            raise HunterError(f"HTTP error during Hunter.io call: {e}") from e
+            except httpx.HTTPError as e:
+                raise HunterError(f"HTTP error during Hunter.io call: {e}") from e
+
+        key = (
+            "email",
+            first_name.strip().lower(),
+            (last_name or "").strip().lower(),
+            _domain_key(domain),
+        )
+        return await self._cached(key, _fetch, lambda d: HunterEmailResult(**d))
 
     async def domain_search(
         self,
@@ -300,43 +517,52 @@ class HunterClient:
         """
         Fetch email pattern and known emails for a domain.
         """
-        if not domain:
+        domain = domain.strip() if domain else domain
+        if not domain or not _DOMAIN_RE.fullmatch(domain):
             return None
 
-        url = f"{self.base_url}/domain-search"
-        params = {
-            "api_key": self.api_key,
-            "domain": domain,
-            "limit": max(1, min(limit, 50)),
-        }
+        url = self._domain_search_url
+        limit = max(1, min(limit, 50))
+        params: list[tuple[str, str | int]] = [
+            ("api_key", self.api_key),
+            ("domain", domain),
+            ("limit", limit),
+        ]
 
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would call Hunter.io domain-search: {domain}")
+            logger.info("[DRY RUN] Would call Hunter.io domain-search: %s", domain)
             return None
-        try:
-            resp = await self._get_json(url=url, params=params)
-
-            if resp.status_code == 404:
-                return None
-            if resp.status_code >= 400:
-                raise HunterError(f"Hunter.io error {resp.status_code}: {resp.text}")
-
-            data = resp.json().get("data", {})
-            pattern = data.get("pattern")
-            emails_raw = data.get("emails", []) or []
-            emails: list[HunterEmailRecord] = []
-            for entry in emails_raw:
-                emails.append(
-                    HunterEmailRecord(
-                        email=entry.get("value"),
-                        first_name=entry.get("first_name"),
-                        last_name=entry.get("last_name"),
-                        position=entry.get("position"),
-                        confidence=entry.get("confidence"),
+
+        async def _fetch() -> HunterDomainSearchResult | None:
+            try:
+                resp = await self._get_json(url=url, params=params)
+
+                if resp.status_code == 404:
+                    return None
+                if resp.status_code >= 400:
+                    raise HunterError(
+                        f"Hunter.io error {resp.status_code}: {short_text(resp.text)}"
                     )
-                )
 
-            return HunterDomainSearchResult(pattern=pattern, emails=emails)
+                data = json_loads(resp.content).get("data", {})
+                pattern = data.get("pattern")
+                emails_raw = data.get("emails", []) or []
+                emails: list[HunterEmailRecord] = []
+                for entry in emails_raw:
+                    emails.append(
+                        HunterEmailRecord(
+                            email=entry.get("value"),
+                            first_name=entry.get("first_name"),
+                            last_name=entry.get("last_name"),
+                            position=entry.get("position"),
+                            confidence=entry.get("confidence"),
+                        )
+                    )
+
+                return HunterDomainSearchResult(pattern=pattern, emails=emails)
+
+            except httpx.HTTPError as e:
+                raise HunterError(f"HTTP error during Hunter.io call: {e}") from e
 
-        except httpx.HTTPError as e:
-            raise HunterError(f"HTTP error during Hunter.io call: {e}") from e
\ No newline at end of file
+        key = ("domain", _domain_key(domain), limit)
+        return await self._cached(key, _fetch, _domain_search_from_dict)
@@ -0,0 +1,76 @@
+"""Persistent TTL cache for provider lookups (company name -> domain, officers, ...)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class LookupCache:
+    """
+    Small SQLite-backed key/value cache with per-entry expiry.
+
+    Values are stored as JSON, so callers cache plain data (strings, lists, dicts)
+    rather than client objects. Entries are grouped by namespace (e.g. "clearbit")
+    so different providers never collide. WAL mode keeps reads cheap and lets
+    several enrichment processes share one cache file.
+    """
+
+    MISSING: Any = object()
+
+    def __init__(self, path: Path | str, *, ttl_s: float = 7 * 86400):
+        self.path = Path(path)
+        self.ttl_s = ttl_s
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lookups ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT, expires_at REAL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value, or LookupCache.MISSING if absent/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM lookups WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return self.MISSING
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return self.MISSING
+        try:
+            return json.loads(value)
+        except (TypeError, ValueError):
+            return self.MISSING
+
+    def set(self, namespace: str, key: str, value: Any, *, ttl_s: float | None = None) -> None:
+        ttl = self.ttl_s if ttl_s is None else ttl_s
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as exc:
+            logger.debug(f"Skipping non-serializable cache value for {namespace}:{key}: {exc}")
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lookups (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,14 +5,21 @@ from dataclasses import dataclass
 
 import httpx
 
+from src.signal_engine.enrichment.client_pool import HTTP2_AVAILABLE, json_loads, short_text
+from src.signal_engine.enrichment.provider_limits import CircuitBreaker, provider_rate_limit
+from src.signal_engine.enrichment.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
+# Shared by every client: repeated 5xx/transport failures fail later calls immediately.
+_BREAKER = CircuitBreaker()
+
 
 class OpenCorporatesError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenCorporatesCompany:
     name: str
     jurisdiction_code: str
@@ -31,29 +38,70 @@ class OpenCorporatesClient:
         *,
         api_key: str | None = None,
         base_url: str = "https://api.opencorporates.com/v0.4",
-        timeout_s: float = 20.0,
+        timeout_s: float = 10.0,
+        connect_timeout_s: float = 3.0,
+        http_client: httpx.AsyncClient | None = None,
+        cache_ttl_s: float = 86400.0,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=timeout_s)
+        self._company_search_url = f"{self.base_url}/companies/search"
+        self._officers_url = self.base_url + "/companies/{}/{}/officers"
+        # An injected client is shared with other callers, so aclose() leaves it open.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=connect_timeout_s, read=timeout_s, write=connect_timeout_s, pool=10.0
+            ),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0
+            ),
+        )
+        # Found and not-found results are reused for cache_ttl_s (0 disables).
+        self._cache = ResultCache(ttl_s=cache_ttl_s, max_entries=4096)
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        self._cache.clear()
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _get(self, url: str, params: list[tuple[str, str | int]]) -> httpx.Response:
+        if not _BREAKER.allow():
+            raise OpenCorporatesError("OpenCorporates circuit open; skipping request")
+        await provider_rate_limit("opencorporates_token" if self.api_key else "opencorporates")
+        try:
+            resp = await self._client.get(url, params=params)
+        except httpx.HTTPError:
+            _BREAKER.record_failure()
+            raise
+        if resp.status_code >= 500:
+            _BREAKER.record_failure()
+        else:
+            _BREAKER.record_success()
+        return resp
 
     async def search_company(self, *, name: str) -> OpenCorporatesCompany | None:
         if not name:
             return None
 
-        url = f"{self.base_url}/companies/search"
-        params = {"q": name, "per_page": 1}
+        return await self._cache.get_or_fetch(
+            ("company", " ".join(name.lower().split())), lambda: self._search_company(name)
+        )
+
+    async def _search_company(self, name: str) -> OpenCorporatesCompany | None:
+        url = self._company_search_url
+        params: list[tuple[str, str | int]] = [("q", name), ("per_page", 1)]
         if self.api_key:
-            params["api_token"] = self.api_key
+            params.append(("api_token", self.api_key))
 
-        resp = await self._client.get(url, params=params)
+        resp = await self._get(url, params)
         if resp.status_code >= 400:
-            raise OpenCorporatesError(f"OpenCorporates error {resp.status_code}: {resp.text}")
+            raise OpenCorporatesError(
+                f"OpenCorporates error {resp.status_code}: {short_text(resp.text)}"
+            )
 
-        data = resp.json() or {}
+        data = json_loads(resp.content) or {}
         companies = data.get("results", {}).get("companies", [])
         if not companies:
             return None
@@ -82,17 +130,32 @@ class OpenCorporatesClient:
         if not jurisdiction_code or not company_number:
             return []
 
-        url = f"{self.base_url}/companies/{jurisdiction_code}/{company_number}/officers"
-        params = {"per_page": max(1, min(limit, 10))}
+        return await self._cache.get_or_fetch(
+            ("officers", jurisdiction_code, company_number, limit),
+            lambda: self._get_officer_names(jurisdiction_code, company_number, limit),
+        )
+
+    async def _get_officer_names(
+        self, jurisdiction_code: str, company_number: str, limit: int
+    ) -> list[str]:
+        url = self._officers_url.format(jurisdiction_code, company_number)
+        params: list[tuple[str, str | int]] = [("per_page", max(1, min(limit, 10)))]
         if self.api_key:
-            params["api_token"] = self.api_key
+            params.append(("api_token", self.api_key))
 
-        resp = await self._client.get(url, params=params)
-        if resp.status_code >= 400:
-            logger.debug(f"OpenCorporates officers returned {resp.status_code}: {resp.text}")
+        resp = await self._get(url, params)
+        if resp.status_code == 404:
+            logger.debug(
+                "OpenCorporates has no officers for %s/%s", jurisdiction_code, company_number
+            )
             return []
+        if resp.status_code >= 400:
+            # Raised rather than returned empty, so throttling and outages aren't memoized.
+            raise OpenCorporatesError(
+                f"OpenCorporates officers error {resp.status_code}: {short_text(resp.text)}"
+            )
 
-        data = resp.json() or {}
+        data = json_loads(resp.content) or {}
         officers = data.get("results", {}).get("officers", [])
         names: list[str] = []
         for entry in officers:
@@ -104,6 +167,15 @@ class OpenCorporatesClient:
         return names[:limit]
 
     async def find_officer_names_by_company(self, *, name: str) -> list[str]:
+        if not name:
+            return []
+        # Memoized as a whole so a repeat lead skips both round trips.
+        return await self._cache.get_or_fetch(
+            ("officers_by_name", " ".join(name.lower().split())),
+            lambda: self._find_officer_names_by_company(name),
+        )
+
+    async def _find_officer_names_by_company(self, name: str) -> list[str]:
         company = await self.search_company(name=name)
         if not company:
             return []
@@ -0,0 +1,228 @@
+"""Per-provider concurrency caps and request rates shared by every enrichment call site."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import AsyncIterator
+
+# Maximum in-flight requests per provider (Clearbit documents 5 concurrent requests;
+# the rest are conservative ceilings below each plan's rate limit).
+PROVIDER_CONCURRENCY: dict[str, int] = {
+    "clearbit": 5,
+    "apollo": 3,
+    "hunter": 8,
+    "opencorporates": 2,
+    "snippets": 4,
+}
+
+# Sustained request rate (per second) and burst size per rate-limited endpoint, kept
+# under the documented caps (Hunter: 15 req/s; OpenCorporates is far stricter for
+# anonymous callers than with an API token; public Nominatim allows 1 req/s) so
+# bursts queue instead of drawing 429s.
+PROVIDER_RATES: dict[str, tuple[float, float]] = {
+    "hunter": (15.0, 15.0),
+    "nominatim": (1.0, 1.0),
+    "opencorporates": (0.5, 1.0),
+    "opencorporates_token": (5.0, 5.0),
+}
+
+# asyncio.Semaphore/Lock are bound to the loop that first waits on them, so the gates
+# and buckets are recreated whenever a new event loop is detected.
+_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+_SEMAPHORES_LOOP: asyncio.AbstractEventLoop | None = None
+_BUCKETS: dict[str, TokenBucket] = {}
+
+
+class TokenBucket:
+    """Client-side rate limiter: acquire() waits until a request may be sent."""
+
+    def __init__(self, rate_per_s: float, capacity: float):
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters sleep while holding the lock, so tokens are handed out in FIFO order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_s)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_s)
+
+
+class AIMDGate:
+    """
+    Latency-adaptive concurrency limit for one provider.
+
+    The limit grows additively while the rolling mean latency stays under target
+    and shrinks multiplicatively on overload signals (429/5xx, transport errors),
+    so a batch settles near the provider's safe concurrency without manual tuning.
+    Slow latency shrinks it at most once per full window of samples, so one slow
+    stretch costs one halving rather than one per response.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = 2.0,
+        min_concurrency: float = 1.0,
+        max_concurrency: float = 32.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target_s: float = 2.0,
+        window: int = 20,
+    ):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target_s = latency_target_s
+        self.concurrency = initial
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._cond: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+        return self._cond
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new requests for `seconds` (e.g. Retry-After, exhausted quota window)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < int(self.concurrency))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with cond:
+                self._in_flight -= 1
+                cond.notify_all()
+
+    def on_success(self, latency_s: float) -> None:
+        self._latencies.append(latency_s)
+        avg = sum(self._latencies) / len(self._latencies)
+        if avg <= self.latency_target_s:
+            self.concurrency = min(self.max_concurrency, self.concurrency + self.alpha)
+        elif len(self._latencies) == self._latencies.maxlen:
+            self.concurrency = max(self.min_concurrency, self.concurrency * self.beta)
+            self._latencies.clear()  # The next decrease needs a fresh window.
+
+    def on_overload(self) -> None:
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.beta)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a provider is down.
+
+    After failure_threshold consecutive failures (5xx, timeouts, transport errors)
+    the circuit opens and allow() refuses requests for open_s seconds. Then one
+    probe is let through (half-open): success closes the circuit, failure re-opens
+    it. A probe that never reports back just lets another probe through after
+    open_s.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, open_s: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.open_s = open_s
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._half_open = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._half_open else "open"
+
+    def refusing(self) -> bool:
+        """Whether allow() would refuse now; unlike allow(), never claims the probe."""
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.open_s
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.open_s:
+            return False
+        self._opened_at = now
+        self._half_open = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._half_open or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._half_open = False
+
+
+def _check_loop() -> None:
+    global _SEMAPHORES_LOOP
+    loop = asyncio.get_running_loop()
+    if _SEMAPHORES_LOOP is not loop:
+        _SEMAPHORES.clear()
+        _BUCKETS.clear()
+        _SEMAPHORES_LOOP = loop
+
+
+def _semaphore(provider: str) -> asyncio.Semaphore:
+    _check_loop()
+    sem = _SEMAPHORES.get(provider)
+    if sem is None:
+        sem = asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, 4))
+        _SEMAPHORES[provider] = sem
+    return sem
+
+
+@contextlib.asynccontextmanager
+async def provider_slot(provider: str) -> AsyncIterator[None]:
+    """
+    Hold one of the provider's concurrency slots for the duration of a request.
+
+    Usage:
+        async with provider_slot("clearbit"):
+            suggestion = await clearbit.suggest_company(query=name)
+    """
+    async with _semaphore(provider):
+        yield
+
+
+async def provider_rate_limit(bucket: str) -> None:
+    """Wait for a request token from the bucket's PROVIDER_RATES entry (no-op if unlisted)."""
+    rate = PROVIDER_RATES.get(bucket)
+    if rate is None:
+        return
+    _check_loop()
+    limiter = _BUCKETS.get(bucket)
+    if limiter is None:
+        limiter = TokenBucket(*rate)
+        _BUCKETS[bucket] = limiter
+    await limiter.acquire()
@@ -2,15 +2,61 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-
+from typing import IO, Any, Hashable
+
+from src.signal_engine.enrichment.apollo_client import ApolloClient
+from src.signal_engine.enrichment.clearbit_client import ClearbitClient
+from src.signal_engine.enrichment.client_pool import json_dumps, json_loads, shared_client
+from src.signal_engine.enrichment.hunter_client import (
+    HunterCircuitOpenError,
+    HunterClient,
+    HunterDomainSearchResult,
+    HunterEmailRecord,
+    HunterError,
+)
+from src.signal_engine.enrichment.provider_limits import provider_slot
 from src.signal_engine.models import DecisionMaker
 
 logger = logging.getLogger(__name__)
 
+# Public hostname: two or more labels, the last starting with a letter (so no
+# "localhost", bare words or IP addresses). Applied to lowercased domains.
+_VALID_DOMAIN_RE = re.compile(
+    r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z](?:[a-z0-9-]{0,61}[a-z0-9])?"
+)
+
+# Hunter email-pattern tokens, e.g. "{first}.{l}".
+_PATTERN_TOKEN_RE = re.compile(r"\{?(first|last|f|l)\}?")
+
+# Title words that make a domain-search contact more (or less) likely to be the buyer.
+_DECISION_MAKER_TITLE_TOKENS = frozenset(
+    {"owner", "founder", "cofounder", "chief", "ceo", "president", "director", "manager"}
+)
+_GENERIC_CONTACT_TITLE_TOKENS = frozenset({"admin", "info", "support", "sales", "contact"})
+_TITLE_SPLIT_RE = re.compile(r"[^a-z]+")
+
+# First line of the cache log. Bump the version whenever the record layout or the
+# DecisionMaker fields change: cached entries are rebuilt without validation.
+_CACHE_HEADER = {"schema": 1}
+
+# New cache entries are appended to the log in batches of this many (and on flush).
+_CACHE_FLUSH_EVERY = 25
+# The log is rewritten once it holds this many lines per live entry.
+_CACHE_COMPACT_RATIO = 4
+# Remembered misses expire after this long (wall clock, so it holds across runs).
+_CACHE_MISS_TTL_S = 7 * 24 * 3600.0
+
 
 class EnrichmentProvider(str, Enum):
     """Available enrichment providers."""
@@ -28,6 +74,8 @@ class CreditGuard:
     Supports separate tracking for different providers.
     """
 
+    __slots__ = ("max_credits", "credits_used", "provider_name")
+
     def __init__(self, max_credits: int = 3, provider_name: str = "API"):
         """
         Initialize credit guard.
@@ -48,20 +96,148 @@ class CreditGuard:
         Raises:
             RuntimeError: If credit limit exceeded
         """
-        if self.credits_used >= self.max_credits:
+        credits = self.credits_used + 1
+        if credits > self.max_credits:
             raise RuntimeError(
                 f"{self.provider_name} credit safety brake triggered! "
                 f"Used {self.credits_used}/{self.max_credits} credits. "
                 f"Stopping enrichment to protect your account."
             )
-        self.credits_used += 1
-        logger.debug(f"{self.provider_name} credit used: {self.credits_used}/{self.max_credits}")
+        self.credits_used = credits
+        logger.debug("%s credit used: %d/%d", self.provider_name, credits, self.max_credits)
+
+    def refund(self) -> None:
+        """Give back one credit for a call that was abandoned before it finished."""
+        self.credits_used = max(0, self.credits_used - 1)
 
     def reset(self) -> None:
         """Reset credit counter (for testing)."""
         self.credits_used = 0
 
 
+class _ProviderCache:
+    """
+    Lookup results shared by every ProviderManager in the process.
+
+    Found results and remembered misses are kept apart, so a lookup is one
+    membership test on each. Every table keeps its max_entries most recently used
+    keys, so a long-running process doesn't pin every DecisionMaker it has seen.
+    """
+
+    __slots__ = (
+        "max_entries",
+        "emails",
+        "email_misses",
+        "domains",
+        "domain_misses",
+        "loaded",
+        "pending",
+        "flush_owner",
+        "log_path",
+        "log_file",
+        "log_lines",
+        "log_lock",
+        "flush_task",
+    )
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        # (decision, decision.model_dump()): the log is written from the stored dict.
+        self.emails: OrderedDict[tuple[str, str], tuple[DecisionMaker, dict]] = OrderedDict()
+        self.domains: OrderedDict[str, HunterDomainSearchResult] = OrderedDict()
+        # Miss -> expiry (epoch seconds); ordered so misses are bounded and evicted LRU too.
+        self.email_misses: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self.domain_misses: OrderedDict[str, float] = OrderedDict()
+        self.loaded = False  # Persistent cache replayed (once per process).
+        # Persistence of the tables above: keys not yet in the log, and the open log.
+        self.pending: dict[tuple[str, object], None] = {}
+        self.flush_owner: ProviderManager | None = None
+        self.log_path: Path | None = None
+        self.log_file: IO[bytes] | None = None
+        self.log_lines = 0
+        # Log writes may run in worker threads (see ProviderManager._flush_in_background).
+        self.log_lock = threading.RLock()
+        self.flush_task: asyncio.Task | None = None
+
+    def _get(self, entries: OrderedDict, key: Hashable) -> Any:
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+        return value
+
+    def _missed(self, misses: OrderedDict, key: Hashable) -> bool:
+        expires_at = misses.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del misses[key]  # Expired: the lookup is tried again.
+            return False
+        misses.move_to_end(key)
+        return True
+
+    def _put(self, entries: OrderedDict, key: Hashable, value: Any) -> None:
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_email(self, key: tuple[str, str]) -> DecisionMaker | None:
+        entry = self._get(self.emails, key)
+        return entry[0] if entry is not None else None
+
+    def email_payload(self, key: tuple[str, str]) -> dict | None:
+        entry = self.emails.get(key)
+        return entry[1] if entry is not None else None
+
+    def email_missed(self, key: tuple[str, str]) -> bool:
+        return self._missed(self.email_misses, key)
+
+    def set_email(
+        self, key: tuple[str, str], decision: DecisionMaker, payload: dict | None = None
+    ) -> None:
+        """Cache a decision; payload is its model_dump() when the caller already has it."""
+        self.email_misses.pop(key, None)
+        self._put(self.emails, key, (decision, payload or decision.model_dump()))
+
+    def add_email_miss(self, key: tuple[str, str], expires_at: float | None = None) -> None:
+        self.emails.pop(key, None)
+        self._put(self.email_misses, key, expires_at or time.time() + _CACHE_MISS_TTL_S)
+
+    def get_domain(self, domain: str) -> HunterDomainSearchResult | None:
+        return self._get(self.domains, domain)
+
+    def domain_missed(self, domain: str) -> bool:
+        return self._missed(self.domain_misses, domain)
+
+    def set_domain(self, domain: str, result: HunterDomainSearchResult) -> None:
+        self.domain_misses.pop(domain, None)
+        self._put(self.domains, domain, result)
+
+    def add_domain_miss(self, domain: str, expires_at: float | None = None) -> None:
+        self.domains.pop(domain, None)
+        self._put(self.domain_misses, domain, expires_at or time.time() + _CACHE_MISS_TTL_S)
+
+    def holds(self, kind: str, key: Hashable) -> bool:
+        """Whether a ("email" or "domain") result or miss is cached for key."""
+        if kind == "email":
+            return key in self.emails or key in self.email_misses
+        return key in self.domains or key in self.domain_misses
+
+    def close_log(self) -> None:
+        with self.log_lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
+
+    def __len__(self) -> int:
+        return (
+            len(self.emails) + len(self.email_misses) + len(self.domains) + len(self.domain_misses)
+        )
+
+
+_CACHE = _ProviderCache()
+
+
 class ProviderManager:
     """
     Manages multiple enrichment providers with fallback logic and credit safety.
@@ -104,6 +280,9 @@ class ProviderManager:
         self.apollo_api_key = apollo_api_key
         self.apollo_enabled = apollo_enabled
         self.provider_priority = provider_priority
+        auto = EnrichmentProvider.AUTO
+        self._uses_hunter = provider_priority in (EnrichmentProvider.HUNTER, auto)
+        self._uses_apollo = provider_priority in (EnrichmentProvider.APOLLO, auto)
         self.dry_run = dry_run
         self.hunter_credit_guard = CreditGuard(
             max_credits=max_credits_per_run, provider_name="Hunter.io"
@@ -114,6 +293,12 @@ class ProviderManager:
         self._credit_usage = {"hunter": 0, "apollo": 0}
         self.persist_cache = persist_cache
         self.cache_path = Path(cache_path) if cache_path else None
+        self._legacy_cache_path: Path | None = None
+        if self.cache_path is not None and self.cache_path.suffix == ".json":
+            # Entries are appended to a JSONL log; an old single-document cache is
+            # imported once.
+            self._legacy_cache_path = self.cache_path
+            self.cache_path = self.cache_path.with_suffix(".jsonl")
         self._load_persistent_cache()
 
         # Auto-detect test key
@@ -121,19 +306,31 @@ class ProviderManager:
             logger.info("Test API key detected - enabling dry-run mode")
             self.dry_run = True
 
-    # Per-process caches to avoid repeat lookups for the same person/domain.
-    _email_lookup_cache: dict[tuple[str, str], DecisionMaker | None] = {}
-    _domain_search_cache: dict[str, object | None] = {}
-    _persistent_cache_loaded: bool = False
-
     def _increment_hunter_credit(self) -> None:
-        self.hunter_credit_guard.check_and_increment()
+        try:
+            self.hunter_credit_guard.check_and_increment()
+        except RuntimeError:
+            # The brake ends the run; keep what was paid for so far.
+            self.flush_cache()
+            raise
         self._credit_usage["hunter"] += 1
 
+    def _refund_hunter_credit(self) -> None:
+        self.hunter_credit_guard.refund()
+        self._credit_usage["hunter"] -= 1
+
     def _increment_apollo_credit(self) -> None:
-        self.apollo_credit_guard.check_and_increment()
+        try:
+            self.apollo_credit_guard.check_and_increment()
+        except RuntimeError:
+            self.flush_cache()
+            raise
         self._credit_usage["apollo"] += 1
 
+    def _refund_apollo_credit(self) -> None:
+        self.apollo_credit_guard.refund()
+        self._credit_usage["apollo"] -= 1
+
     def credit_summary(self) -> dict[str, int]:
         return {
             "hunter": self.hunter_credit_guard.credits_used,
@@ -143,69 +340,249 @@ class ProviderManager:
     def _load_persistent_cache(self) -> None:
         if not self.persist_cache or not self.cache_path:
             return
-        if ProviderManager._persistent_cache_loaded:
+        if _CACHE.loaded:
             return
+        _CACHE.loaded = True
         if not self.cache_path.exists():
-            ProviderManager._persistent_cache_loaded = True
+            if self._legacy_cache_path and self._legacy_cache_path.exists():
+                self._import_legacy_cache(self._legacy_cache_path)
+            return
+
+        lines = 0
+        stale = False
+        try:
+            with self.cache_path.open("rb") as log:
+                if _read_cache_line(log.readline()) != _CACHE_HEADER:
+                    stale = True
+                else:
+                    for line in log:
+                        lines += 1
+                        record = _read_cache_line(line)
+                        if record is not None:
+                            self._apply_cache_record(record)
+        except OSError as exc:
+            logger.warning(f"Failed to load enrichment cache: {exc}")
+        _CACHE.log_lines = lines
+        if stale:
+            # Entries are rebuilt without validation, so another layout is dropped, not read.
+            logger.info(f"Discarding enrichment cache with an unknown schema: {self.cache_path}")
+            self.compact_cache()
+
+    def _apply_cache_record(self, record: object) -> None:
+        """
+        Replay one log line; later lines for the same key win.
+
+        Misses without a future expiry ("x") are skipped: older runs wrote them
+        without one, including from dry runs that never asked Hunter.
+        """
+        if not isinstance(record, dict):
             return
+        kind, key, payload = record.get("t"), record.get("k"), record.get("v")
+        expires_at = record.get("x")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            expires_at = None
+        if kind == "email" and isinstance(key, list) and len(key) == 2 and all(
+            isinstance(part, str) for part in key
+        ):
+            if isinstance(payload, dict):
+                _CACHE.set_email(
+                    (key[0], key[1]), DecisionMaker.model_construct(**payload), payload
+                )
+            elif expires_at is not None:
+                _CACHE.add_email_miss((key[0], key[1]), expires_at)
+        elif kind == "domain" and isinstance(key, str):
+            result = self._deserialize_domain_search_result(payload)
+            if result is not None:
+                _CACHE.set_domain(key, result)
+            elif expires_at is not None:
+                _CACHE.add_domain_miss(key, expires_at)
+
+    def _import_legacy_cache(self, path: Path) -> None:
+        """Load a cache written by older runs as one JSON document, then rewrite it as a log."""
         try:
-            data = json.loads(self.cache_path.read_text())
+            data = json_loads(path.read_bytes())
         except Exception as exc:
             logger.warning(f"Failed to load enrichment cache: {exc}")
-            ProviderManager._persistent_cache_loaded = True
             return
 
         email_cache = data.get("email_lookup", {}) if isinstance(data, dict) else {}
         for key, payload in email_cache.items():
-            if not isinstance(key, str) or "|" not in key:
-                continue
-            name_key, domain_key = key.split("|", 1)
-            if payload is None:
-                ProviderManager._email_lookup_cache[(name_key, domain_key)] = None
-            elif isinstance(payload, dict):
-                ProviderManager._email_lookup_cache[(name_key, domain_key)] = DecisionMaker(
-                    **payload
-                )
+            if isinstance(key, str) and "|" in key:
+                self._apply_cache_record({"t": "email", "k": key.split("|", 1), "v": payload})
 
         domain_cache = data.get("domain_search", {}) if isinstance(data, dict) else {}
         for domain_key, payload in domain_cache.items():
-            if not isinstance(domain_key, str):
-                continue
-            ProviderManager._domain_search_cache[domain_key] = self._deserialize_domain_search_result(
-                payload
+            self._apply_cache_record({"t": "domain", "k": domain_key, "v": payload})
+
+        self.compact_cache()
+        logger.info(f"Imported enrichment cache from {path} into {self.cache_path}")
+
+    def _cache_record(self, kind: str, key: object) -> bytes:
+        if kind == "email":
+            payload = _CACHE.email_payload(key)
+            expires_at = _CACHE.email_misses.get(key)
+            key = list(key)
+        else:
+            payload = self._serialize_domain_search_result(_CACHE.domains.get(key))
+            expires_at = _CACHE.domain_misses.get(key)
+        record = {"t": kind, "k": key, "v": payload}
+        if expires_at is not None:
+            record["x"] = expires_at
+        return json_dumps(record) + b"\n"
+
+    def _cache_log(self) -> IO[bytes]:
+        log = _CACHE.log_file
+        if log is not None and _CACHE.log_path != self.cache_path:
+            # Another manager's cache_path: entries go to the log this manager reads.
+            _CACHE.close_log()
+            log = None
+        if log is None or log.closed:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            log = self.cache_path.open("ab", buffering=8192)
+            if log.tell() == 0:
+                log.write(json_dumps(_CACHE_HEADER) + b"\n")
+            _CACHE.log_file = log
+            _CACHE.log_path = self.cache_path
+        return log
+
+    def _mark_cache_dirty(self, kind: str, key: object) -> None:
+        if not self.persist_cache or not self.cache_path:
+            return
+        if _CACHE.flush_owner is None:
+            _CACHE.flush_owner = self
+            atexit.register(ProviderManager.flush_pending_cache)
+        _CACHE.pending[(kind, key)] = None
+        if len(_CACHE.pending) >= _CACHE_FLUSH_EVERY:
+            self._flush_in_background()
+
+    def _take_pending_records(self) -> list[bytes]:
+        """Serialize and clear pending entries (on the caller's thread, where _CACHE lives)."""
+        pending = _CACHE.pending
+        _CACHE.pending = {}
+        # Entries evicted from _CACHE since they were marked are not written.
+        return [self._cache_record(kind, key) for kind, key in pending if _CACHE.holds(kind, key)]
+
+    def _compaction_records(self) -> list[bytes]:
+        _CACHE.pending = {}
+        return [
+            self._cache_record(kind, key)
+            for kind, keys in (
+                ("email", _CACHE.emails),
+                ("email", _CACHE.email_misses),
+                ("domain", _CACHE.domains),
+                ("domain", _CACHE.domain_misses),
             )
+            for key in keys
+        ]
+
+    def _append_records(self, records: list[bytes]) -> bool:
+        """Append serialized entries to the log (blocking; safe in a worker thread)."""
+        with _CACHE.log_lock:
+            try:
+                log = self._cache_log()
+                log.writelines(records)
+                log.flush()
+            except Exception as exc:
+                logger.warning(f"Failed to persist enrichment cache: {exc}")
+                return False
+            _CACHE.log_lines += len(records)
+        return True
+
+    def _rewrite_log(self, records: list[bytes]) -> None:
+        """Replace the log with exactly these entries (blocking; safe in a worker thread)."""
+        with _CACHE.log_lock:
+            _CACHE.close_log()
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with tmp_path.open("wb") as tmp:
+                    tmp.write(json_dumps(_CACHE_HEADER) + b"\n")
+                    tmp.writelines(records)
+                    tmp.flush()
+                    # Without this a crash just after the rename can leave an empty
+                    # log on some filesystems, and every cached lookup is paid again.
+                    os.fsync(tmp.fileno())
+                os.replace(tmp_path, self.cache_path)
+            except Exception as exc:
+                logger.warning(f"Failed to compact enrichment cache: {exc}")
+                tmp_path.unlink(missing_ok=True)
+                return
+            _CACHE.log_lines = len(records)
+
+    def _needs_compaction(self) -> bool:
+        return _CACHE.log_lines > _CACHE_COMPACT_RATIO * len(_CACHE)
+
+    def flush_cache(self) -> None:
+        """
+        Append pending cache entries to cache_path (no-op when nothing changed).
 
-        ProviderManager._persistent_cache_loaded = True
+        Blocks on file I/O; async code paths use _flush_in_background() and aclose().
+        """
+        if not self.persist_cache or not self.cache_path:
+            return
+        if not _CACHE.pending:
+            return
+        if self._append_records(self._take_pending_records()) and self._needs_compaction():
+            self.compact_cache()
 
-    def _save_persistent_cache(self) -> None:
+    def _flush_in_background(self) -> None:
+        """Write pending entries from a worker thread so the event loop keeps running."""
         if not self.persist_cache or not self.cache_path:
             return
-        data = {
-            "email_lookup": {
-                f"{name}|{domain}": (decision.model_dump() if decision else None)
-                for (name, domain), decision in self._email_lookup_cache.items()
-            },
-            "domain_search": {
-                domain: self._serialize_domain_search_result(result)
-                for domain, result in self._domain_search_cache.items()
-            },
-        }
         try:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(json.dumps(data, indent=2, sort_keys=True))
-        except Exception as exc:
-            logger.warning(f"Failed to persist enrichment cache: {exc}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_cache()
+            return
+        previous = _CACHE.flush_task
+        if previous is not None and previous.get_loop() is not loop:
+            previous = None
+        _CACHE.flush_task = loop.create_task(
+            self._write_after(previous, self._take_pending_records())
+        )
 
-    def _serialize_domain_search_result(self, result: object | None) -> object | None:
-        if result is None:
-            return None
-        try:
-            from src.signal_engine.enrichment.hunter_client import (
-                HunterDomainSearchResult,
-                HunterEmailRecord,
-            )
-        except Exception:
-            return None
+    async def _write_after(self, previous: asyncio.Task | None, records: list[bytes]) -> None:
+        # Chained on the previous write so batches reach the log in order.
+        if previous is not None:
+            await previous
+        if await asyncio.to_thread(self._append_records, records) and self._needs_compaction():
+            await asyncio.to_thread(self._rewrite_log, self._compaction_records())
+
+    def compact_cache(self) -> None:
+        """Rewrite the log with one line per cached entry, dropping superseded lines."""
+        if not self.persist_cache or not self.cache_path:
+            return
+        self._rewrite_log(self._compaction_records())
+
+    @staticmethod
+    def flush_pending_cache() -> None:
+        """Flush entries added by any manager (blocking); registered to run at exit."""
+        if _CACHE.flush_owner is not None:
+            _CACHE.flush_owner.flush_cache()
+        _CACHE.close_log()
+
+    @staticmethod
+    async def aflush_pending_cache() -> None:
+        """Flush entries added by any manager off the event loop; see close_enrichment_clients()."""
+        if _CACHE.flush_owner is not None:
+            await _CACHE.flush_owner.aclose()
+        _CACHE.close_log()
+
+    async def __aenter__(self) -> ProviderManager:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Flush the persistent cache (shared clients are closed by close_shared_clients())."""
+        if _CACHE.pending:
+            self._flush_in_background()
+        task = _CACHE.flush_task
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            await task
+
+    def _serialize_domain_search_result(self, result: object | None) -> dict | None:
         if not isinstance(result, HunterDomainSearchResult):
             return None
         emails_payload = []
@@ -223,16 +600,11 @@ class ProviderManager:
             )
         return {"pattern": result.pattern, "emails": emails_payload}
 
-    def _deserialize_domain_search_result(self, payload: object | None) -> object | None:
+    def _deserialize_domain_search_result(
+        self, payload: object | None
+    ) -> HunterDomainSearchResult | None:
         if payload is None or not isinstance(payload, dict):
             return None
-        try:
-            from src.signal_engine.enrichment.hunter_client import (
-                HunterDomainSearchResult,
-                HunterEmailRecord,
-            )
-        except Exception:
-            return None
         emails_payload = payload.get("emails") or []
         emails: list[HunterEmailRecord] = []
         for entry in emails_payload:
@@ -249,56 +621,72 @@ class ProviderManager:
             )
         return HunterDomainSearchResult(pattern=payload.get("pattern"), emails=emails)
 
-    @staticmethod
-    def _normalize_domain(domain: str | None) -> str | None:
-        if not domain:
-            return None
-        return domain.strip().lower()
+    def _apollo_client(self) -> ApolloClient:
+        """Shared ApolloClient for this API key (closed by close_shared_clients())."""
+        api_key = self.apollo_api_key
+        return shared_client("apollo", api_key, lambda: ApolloClient(api_key=api_key))
 
-    @staticmethod
-    def _normalize_name_key(
-        *,
-        first_name: str | None = None,
-        last_name: str | None = None,
-        full_name: str | None = None,
-    ) -> str | None:
-        if full_name and full_name.strip():
-            return full_name.strip().lower()
-        parts = [p for p in [first_name, last_name] if p]
-        if not parts:
-            return None
-        return " ".join(parts).strip().lower()
+    def _clearbit_client(self) -> ClearbitClient:
+        """Shared ClearbitClient (keyless; closed by close_shared_clients())."""
+        return shared_client("clearbit", None, ClearbitClient)
+
+    def _hunter_client(self) -> HunterClient:
+        """
+        Shared HunterClient for this API key (closed by close_shared_clients()).
+
+        Reusing one client keeps its connection pool, response cache and rate-limit
+        counters warm; don't build ad-hoc HunterClients per lookup.
+        """
+        api_key, dry_run = self.hunter_api_key, self.dry_run
+        kind = "hunter_dry_run" if dry_run else "hunter"
+        return shared_client(kind, api_key, lambda: HunterClient(api_key=api_key, dry_run=dry_run))
 
     async def _get_domain_search_result(self, domain: str) -> object | None:
-        domain_key = self._normalize_domain(domain)
-        if not domain_key:
+        domain_key = _normalize_domain(domain)
+        if not domain_key or not _VALID_DOMAIN_RE.fullmatch(domain_key):
             return None
 
-        if domain_key in self._domain_search_cache:
-            return self._domain_search_cache[domain_key]
+        if _CACHE.domain_missed(domain_key):
+            return None
+        cached = _CACHE.get_domain(domain_key)
+        if cached is not None:
+            return cached
 
+        client = self._hunter_client()
+        if client.circuit_open:
+            # Hunter is failing fast; no request goes out, so nothing is charged.
+            return None
         try:
             if not self.dry_run:
                 self._increment_hunter_credit()
 
-            from src.signal_engine.enrichment.hunter_client import HunterClient
-
-            client = HunterClient(api_key=self.hunter_api_key, dry_run=self.dry_run)
-            try:
+            async with provider_slot("hunter"):
                 result = await client.domain_search(domain=domain_key, limit=10)
-                self._domain_search_cache[domain_key] = result
-                self._save_persistent_cache()
-                return result
-            finally:
-                await client.aclose()
+        except HunterCircuitOpenError:
+            # The circuit opened while this search was queued; it was never sent.
+            if not self.dry_run:
+                self._refund_hunter_credit()
+            return None
+        except HunterError as e:
+            # Timeouts and 5xx say nothing about the domain, so they aren't remembered.
+            logger.debug(f"Hunter domain search failed: {e}")
+            return None
         except RuntimeError:
+            # Credit limit reached - re-raise to stop processing
             raise
         except Exception as e:
             logger.debug(f"Hunter domain search failed: {e}")
-            self._domain_search_cache[domain_key] = None
-            self._save_persistent_cache()
             return None
 
+        if result is not None:
+            _CACHE.set_domain(domain_key, result)
+        elif self.dry_run:
+            return None  # Hunter wasn't asked, so this isn't a miss.
+        else:
+            _CACHE.add_domain_miss(domain_key)
+        self._mark_cache_dirty("domain", domain_key)
+        return result
+
     async def find_decision_maker_email(
         self,
         *,
@@ -317,6 +705,8 @@ class ProviderManager:
         - If we have company + title → Use Apollo (person search)
         - Falls back through providers based on priority
         - Respects credit limits and dry-run mode
+        - With AUTO priority and both usable, Apollo runs alongside Hunter and is
+          cancelled if Hunter finds the email
         
         Args:
             first_name: Person's first name
@@ -329,99 +719,176 @@ class ProviderManager:
         Returns:
             DecisionMaker or None if not found
         """
-        # Strategy 1: Hunter email finder (if we have name + domain)
-        if (first_name or full_name) and company_domain and self.hunter_api_key:
-            if self.provider_priority in [EnrichmentProvider.HUNTER, EnrichmentProvider.AUTO]:
-                name_key = self._normalize_name_key(
-                    first_name=first_name, last_name=last_name, full_name=full_name
+        use_hunter = bool(
+            self._uses_hunter
+            and (first_name or full_name)
+            and company_domain
+            and self.hunter_api_key
+        )
+        use_apollo = bool(
+            self._uses_apollo
+            and self.apollo_enabled
+            and company_name
+            and title
+            and self.apollo_api_key
+        )
+
+        if use_hunter and use_apollo:
+            apollo_task = asyncio.ensure_future(
+                self._try_apollo(
+                    company_name=company_name, company_domain=company_domain, title=title
                 )
-                domain_key = self._normalize_domain(company_domain)
-                if name_key and domain_key:
-                    cache_key = (name_key, domain_key)
-                    if cache_key in self._email_lookup_cache:
-                        cached = self._email_lookup_cache[cache_key]
-                        if cached is not None:
-                            return cached
-                        # Previously attempted; skip Hunter to avoid repeat spend.
-                        name_key = None
-                try:
-                    # Check credit limit before making call
-                    if not self.dry_run:
-                        self._increment_hunter_credit()
+            )
+            try:
+                decision = await self._try_hunter(
+                    first_name=first_name,
+                    last_name=last_name,
+                    full_name=full_name,
+                    company_domain=company_domain,
+                    title=title,
+                )
+            except BaseException:
+                _discard_task(apollo_task)
+                raise
+            if decision is not None:
+                _discard_task(apollo_task)
+                return decision
+            return await apollo_task
 
-                    from src.signal_engine.enrichment.hunter_client import HunterClient
+        # Strategy 1: Hunter email finder (if we have name + domain)
+        if use_hunter:
+            decision = await self._try_hunter(
+                first_name=first_name,
+                last_name=last_name,
+                full_name=full_name,
+                company_domain=company_domain,
+                title=title,
+            )
+            if decision is not None:
+                return decision
 
-                    client = HunterClient(api_key=self.hunter_api_key, dry_run=self.dry_run)
-                    try:
-                        email_result = await client.find_email(
-                            first_name=first_name,
-                            last_name=last_name,
-                            full_name=full_name,
-                            domain=company_domain,
-                        )
+        # Strategy 2: Apollo person search (if we have company + title)
+        if use_apollo:
+            return await self._try_apollo(
+                company_name=company_name, company_domain=company_domain, title=title
+            )
 
-                        if email_result and email_result.email:
-                            logger.info(
-                                f"Found email via Hunter: {email_result.email} "
-                                f"(confidence: {email_result.score}%)"
-                            )
-                            decision = DecisionMaker(
-                                full_name=full_name or f"{first_name} {last_name}".strip(),
-                                email=email_result.email,
-                                title=title,
-                            )
-                            if name_key and domain_key:
-                                self._email_lookup_cache[(name_key, domain_key)] = decision
-                                self._save_persistent_cache()
-                            return decision
-                        if name_key and domain_key:
-                            self._email_lookup_cache[(name_key, domain_key)] = None
-                            self._save_persistent_cache()
-                    finally:
-                        await client.aclose()
-                except RuntimeError:
-                    # Credit limit reached - re-raise to stop processing
-                    raise
-                except Exception as e:
-                    logger.debug(f"Hunter email finder failed: {e}")
+        return None
 
-        # Strategy 2: Apollo person search (if we have company + title)
-        if self.apollo_enabled and company_name and title and self.apollo_api_key:
-            if self.provider_priority in [EnrichmentProvider.APOLLO, EnrichmentProvider.AUTO]:
-                try:
-                    # Check credit limit (Apollo also uses credits)
-                    if not self.dry_run:
-                        self._increment_apollo_credit()
+    async def _try_hunter(
+        self,
+        *,
+        first_name: str | None,
+        last_name: str | None,
+        full_name: str | None,
+        company_domain: str,
+        title: str | None,
+    ) -> DecisionMaker | None:
+        name_key = _normalize_name_key(first_name, last_name, full_name)
+        domain_key = _normalize_domain(company_domain)
+        if not domain_key or not _VALID_DOMAIN_RE.fullmatch(domain_key):
+            # Hunter can't resolve it; don't spend a credit finding that out.
+            return None
+        if name_key:
+            cache_key = (name_key, domain_key)
+            if _CACHE.email_missed(cache_key):
+                # Previously attempted; skip Hunter to avoid repeat spend.
+                return None
+            cached = _CACHE.get_email(cache_key)
+            if cached is not None:
+                return cached
+        client = self._hunter_client()
+        if client.circuit_open:
+            # Hunter is failing fast; no request goes out, so nothing is charged.
+            return None
+        try:
+            # Check credit limit before making call
+            if not self.dry_run:
+                self._increment_hunter_credit()
 
-                    from src.signal_engine.enrichment.apollo_client import ApolloClient
+            async with provider_slot("hunter"):
+                email_result = await client.find_email(
+                    first_name=first_name,
+                    last_name=last_name,
+                    full_name=full_name,
+                    domain=company_domain,
+                )
 
-                    client = ApolloClient(api_key=self.apollo_api_key)
-                    try:
-                        people = await client.find_decision_makers_enhanced(
-                            company_name=company_name,
-                            company_domain=company_domain,
-                            titles=[title] if title else None,
-                            limit=1,
-                        )
+            if email_result and email_result.email:
+                logger.info(
+                    f"Found email via Hunter: {email_result.email} "
+                    f"(confidence: {email_result.score}%)"
+                )
+                decision = DecisionMaker(
+                    full_name=full_name or f"{first_name} {last_name}".strip(),
+                    email=email_result.email,
+                    title=title,
+                )
+                if name_key:
+                    _CACHE.set_email((name_key, domain_key), decision)
+                    self._mark_cache_dirty("email", (name_key, domain_key))
+                return decision
+            if name_key and not self.dry_run:
+                # A dry run never asked Hunter, so its empty answer isn't a miss.
+                _CACHE.add_email_miss((name_key, domain_key))
+                self._mark_cache_dirty("email", (name_key, domain_key))
+        except HunterCircuitOpenError:
+            # The circuit opened while this lookup was queued; it was never sent.
+            if not self.dry_run:
+                self._refund_hunter_credit()
+        except HunterError as e:
+            # A Hunter failure, not the credit brake: let the caller fall back to Apollo.
+            logger.debug(f"Hunter email finder failed: {e}")
+        except RuntimeError:
+            # Credit limit reached - re-raise to stop processing
+            raise
+        except Exception as e:
+            logger.debug(f"Hunter email finder failed: {e}")
+        return None
 
-                        if people:
-                            person = people[0]
-                            logger.info(f"Found decision maker via Apollo: {person.full_name}")
-                            return DecisionMaker(
-                                full_name=person.full_name,
-                                title=person.title,
-                                email=person.email,
-                                phone=person.phone,
-                                linkedin_url=person.linkedin_url,
-                            )
-                    finally:
-                        await client.aclose()
-                except RuntimeError:
-                    # Credit limit reached - re-raise to stop processing
+    async def _try_apollo(
+        self,
+        *,
+        company_name: str,
+        company_domain: str | None,
+        title: str,
+    ) -> DecisionMaker | None:
+        try:
+            client = self._apollo_client()
+            async with provider_slot("apollo"):
+                # Charged once a slot is held, so a search cancelled while queued
+                # (Hunter already answered) costs no Apollo credit.
+                if not self.dry_run:
+                    self._increment_apollo_credit()
+                try:
+                    people = await client.find_decision_makers_enhanced(
+                        company_name=company_name,
+                        company_domain=company_domain,
+                        titles=[title] if title else None,
+                        limit=1,
+                    )
+                except asyncio.CancelledError:
+                    # Cancelled mid-request because Hunter answered; that search
+                    # isn't used, so it doesn't count against this run.
+                    if not self.dry_run:
+                        self._refund_apollo_credit()
                     raise
-                except Exception as e:
-                    logger.debug(f"Apollo person search failed: {e}")
 
+            if people:
+                person = people[0]
+                logger.info(f"Found decision maker via Apollo: {person.full_name}")
+                return DecisionMaker(
+                    full_name=person.full_name,
+                    title=person.title,
+                    email=person.email,
+                    phone=person.phone,
+                    linkedin_url=person.linkedin_url,
+                )
+        except RuntimeError:
+            # Credit limit reached - re-raise to stop processing
+            raise
+        except Exception as e:
+            logger.debug(f"Apollo person search failed: {e}")
         return None
 
     def get_credits_used(self) -> int:
@@ -465,24 +932,20 @@ class ProviderManager:
             if not self.dry_run:
                 self._increment_apollo_credit()
 
-            from src.signal_engine.enrichment.apollo_client import ApolloClient
-
-            client = ApolloClient(api_key=self.apollo_api_key)
-            try:
+            client = self._apollo_client()
+            async with provider_slot("apollo"):
                 company = await client.search_organization(
                     company_name=company_name,
                     location=location,
                 )
 
-                if company and company.domain:
-                    logger.info(
-                        f"Found domain via Apollo: {company_name} -> {company.domain}"
-                    )
-                    return company.domain
-                else:
-                    logger.debug(f"Apollo found company but no domain: {company_name}")
-            finally:
-                await client.aclose()
+            if company and company.domain:
+                logger.info(
+                    f"Found domain via Apollo: {company_name} -> {company.domain}"
+                )
+                return company.domain
+            else:
+                logger.debug(f"Apollo found company but no domain: {company_name}")
 
         except RuntimeError:
             # Credit limit reached - re-raise to stop processing
@@ -492,19 +955,12 @@ class ProviderManager:
 
         # Strategy 2: Clearbit autocomplete (fallback, no API key required)
         try:
-            from src.signal_engine.enrichment.clearbit_client import ClearbitClient
-
-            clearbit_client = ClearbitClient()
-            try:
-                suggestion = await clearbit_client.suggest_company(query=company_name)
-                if suggestion and suggestion.domain:
-                    logger.info(
-                        f"Found domain via Clearbit: {company_name} -> {suggestion.domain}"
-                    )
-                    return suggestion.domain
-                logger.debug(f"Clearbit returned no domain for: {company_name}")
-            finally:
-                await clearbit_client.aclose()
+            async with provider_slot("clearbit"):
+                suggestion = await self._clearbit_client().suggest_company(query=company_name)
+            if suggestion and suggestion.domain:
+                logger.info(f"Found domain via Clearbit: {company_name} -> {suggestion.domain}")
+                return suggestion.domain
+            logger.debug(f"Clearbit returned no domain for: {company_name}")
         except Exception as e:
             logger.debug(f"Clearbit domain search failed: {e}")
 
@@ -578,36 +1034,11 @@ class ProviderManager:
             if not result or not result.emails:
                 return None
 
-            candidates = [r for r in result.emails if r.email]
-            if not candidates:
+            top = max(
+                (r for r in result.emails if r.email), key=_contact_score, default=None
+            )
+            if top is None:
                 return None
-
-            def score(rec: object) -> int:
-                confidence = getattr(rec, "confidence", None) or 0
-                position = (getattr(rec, "position", None) or "").lower()
-                position_bonus = 0
-                if any(
-                    k in position
-                    for k in [
-                        "owner",
-                        "founder",
-                        "chief",
-                        "ceo",
-                        "president",
-                        "director",
-                        "manager",
-                    ]
-                ):
-                    position_bonus = 10
-                elif any(
-                    k in position
-                    for k in ["admin", "info", "support", "sales", "contact"]
-                ):
-                    position_bonus = -5
-                return confidence + position_bonus
-
-            candidates.sort(key=score, reverse=True)
-            top = candidates[0]
             first = getattr(top, "first_name", None)
             last = getattr(top, "last_name", None)
             full_name = " ".join(p for p in [first, last] if p) or None
@@ -623,6 +1054,51 @@ class ProviderManager:
         return None
 
 
+def _read_cache_line(line: bytes) -> object | None:
+    try:
+        return json_loads(line)
+    except ValueError:
+        return None  # Torn last line from an interrupted run.
+
+
+def _contact_score(rec: object) -> int:
+    """Rank a domain-search contact: confidence, nudged toward decision-maker titles."""
+    confidence = getattr(rec, "confidence", None) or 0
+    position = (getattr(rec, "position", None) or "").lower()
+    tokens = set(_TITLE_SPLIT_RE.split(position))
+    if tokens & _DECISION_MAKER_TITLE_TOKENS:
+        return confidence + 10
+    if tokens & _GENERIC_CONTACT_TITLE_TOKENS:
+        return confidence - 5
+    return confidence
+
+
+def _discard_task(task: asyncio.Future) -> None:
+    """Cancel a lookup whose result is no longer needed without leaking its exception."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
+# Memoized: a batch keeps asking about the same handful of companies and people.
+@functools.lru_cache(maxsize=2048)
+def _normalize_domain(domain: str | None) -> str | None:
+    if not domain:
+        return None
+    return domain.strip().lower()
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_name_key(
+    first_name: str | None, last_name: str | None, full_name: str | None
+) -> str | None:
+    if full_name and full_name.strip():
+        return full_name.strip().lower()
+    parts = [p for p in [first_name, last_name] if p]
+    if not parts:
+        return None
+    return " ".join(parts).strip().lower()
+
+
 def _split_name(full_name: str) -> tuple[str, str]:
     parts = full_name.strip().split(maxsplit=1)
     first = parts[0] if parts else ""
@@ -642,20 +1118,11 @@ def _apply_email_pattern(
 
     first = first_name.lower()
     last = last_name.lower()
-    f = first[0] if first else ""
-    l = last[0] if last else ""
-
-    p = pattern.lower().replace("{", "").replace("}", "")
-    replacements = {
-        "first": first,
-        "last": last,
-        "f": f,
-        "l": l,
-    }
-    # Replace longer tokens first to avoid collisions
-    for token in ["first", "last", "f", "l"]:
-        p = p.replace(token, replacements[token])
-
+    replacements = {"first": first, "last": last, "f": first[:1], "l": last[:1]}
+    # One pass over the local part, so letters inside substituted names (or a
+    # domain in the pattern) are never re-substituted.
+    local, at, pattern_domain = pattern.lower().partition("@")
+    p = _PATTERN_TOKEN_RE.sub(lambda m: replacements[m.group(1)], local) + at + pattern_domain
     p = p.replace("..", ".").strip(".-_")
     if "@" in p:
         email = p
@@ -0,0 +1,67 @@
+"""In-process TTL memo for provider client responses."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class ResultCache:
+    """
+    Memoize async lookups per key for ttl_s seconds, including negative (None) results.
+
+    Concurrent misses for the same key share a single fetch (single-flight), so a
+    batch that asks for the same person/company twice pays for one request.
+    Exceptions are not cached. ttl_s <= 0 disables caching (fetches still coalesce).
+    Empty (falsy) results use negative_ttl_s instead when it is given. Beyond
+    max_entries the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 86400.0,
+        max_entries: int = 10_000,
+        negative_ttl_s: float | None = None,
+    ):
+        self.ttl_s = ttl_s
+        self.negative_ttl_s = ttl_s if negative_ttl_s is None else negative_ttl_s
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries[key] = entry  # Re-insert as most recently used.
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as exc:
+            fut.set_exception(exc)
+            fut.exception()  # Mark retrieved; waiters (if any) still receive it.
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        ttl_s = self.ttl_s if value else self.negative_ttl_s
+        if ttl_s > 0:
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + ttl_s, value)
+        fut.set_result(value)
+        return value
@@ -10,7 +10,7 @@ from src.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchSnippet:
     title: str
     snippet: str
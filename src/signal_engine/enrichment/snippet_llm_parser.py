@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from src.core.config import get_settings
 from src.core.observability import get_openai_client
+from src.signal_engine.enrichment.search_snippet_client import SearchSnippet
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class SnippetPersonResult:
 async def extract_person_from_snippets(
     *,
     company_name: str,
-    snippets: list[dict],
+    snippets: list[SearchSnippet],
 ) -> SnippetPersonResult | None:
     settings = get_settings()
     if not settings.openai_api_key:
@@ -32,7 +33,7 @@ async def extract_person_from_snippets(
 
     prompt = {
         "company_name": company_name,
-        "snippets": snippets,
+        "snippets": [asdict(s) for s in snippets],
         "task": "Identify the primary decision-maker (owner, president, director, or manager).",
         "output_schema": {
             "person_name": "string | null",
@@ -84,7 +85,7 @@ class SnippetDomainResult:
 async def pick_domain_from_snippets(
     *,
     company_name: str,
-    snippets: list[dict],
+    snippets: list[SearchSnippet],
     candidate_domains: list[str],
 ) -> SnippetDomainResult | None:
     settings = get_settings()
@@ -97,7 +98,7 @@ async def pick_domain_from_snippets(
     prompt = {
         "company_name": company_name,
         "candidate_domains": candidate_domains,
-        "snippets": snippets,
+        "snippets": [asdict(s) for s in snippets],
         "task": "Select the most likely official company domain from the candidates.",
         "output_schema": {"domain": "string | null", "confidence": "float 0-1"},
     }
@@ -14,7 +14,11 @@ from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from src.core.config import get_settings
-from src.signal_engine.enrichment.company_enricher import EnrichmentInputs, enrich_permit_to_lead
+from src.signal_engine.enrichment.company_enricher import (
+    EnrichmentInputs,
+    close_enrichment_clients,
+    enrich_permits_to_leads,
+)
 from src.signal_engine.api.unified_ingestion import PermitSource, PermitSourceType, UnifiedPermitIngestion
 from src.signal_engine.listeners.base_listener import BaseRegulatoryListener
 from src.signal_engine.scrapers.base_scraper import BaseScraper
@@ -294,25 +298,20 @@ class ScraperScheduler:
         """
         from src.signal_engine.models import PermitData
 
-        enriched_leads = []
+        inputs_list = []
         for permit in permits:
-            try:
-                if not isinstance(permit, PermitData):
-                    logger.warning(f"Skipping invalid permit: {type(permit)}")
-                    continue
+            if not isinstance(permit, PermitData):
+                logger.warning(f"Skipping invalid permit: {type(permit)}")
+                continue
+            inputs_list.append(EnrichmentInputs(tenant_id=tenant_id, permit=permit))
 
-                lead = await enrich_permit_to_lead(
-                    EnrichmentInputs(tenant_id=tenant_id, permit=permit)
-                )
-                enriched_leads.append(lead)
-            except Exception as e:
-                logger.error(
-                    f"Error enriching permit {permit.permit_id if hasattr(permit, 'permit_id') else 'unknown'}: {e}",
-                    exc_info=True,
-                )
-                # Continue with other permits even if one fails
+        try:
+            # Failed permits come back as None (already logged); keep the rest.
+            leads = await enrich_permits_to_leads(inputs_list)
+        finally:
+            await close_enrichment_clients()
 
-        return enriched_leads
+        return [lead for lead in leads if lead is not None]
 
     def _get_last_run(self, scraper_name: str, tenant_id: str) -> datetime | None:
         """Get the last run timestamp for a scraper."""
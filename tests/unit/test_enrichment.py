@@ -1,17 +1,84 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
 import pytest
 
 from scripts.e2e.test_ckan_enrichment import should_stop_for_email_target
+from src.signal_engine.enrichment import apollo_client as apollo_client_module
+from src.signal_engine.enrichment import clearbit_client as clearbit_client_module
+from src.signal_engine.enrichment import company_enricher
+from src.signal_engine.enrichment import geocoder as geocoder_module
+from src.signal_engine.enrichment import hunter_client as hunter_client_module
+from src.signal_engine.enrichment import provider_manager as provider_manager_module
+from src.signal_engine.enrichment.apollo_client import (
+    ApolloCompany,
+    ApolloRateLimitError,
+    lookup_company,
+)
+from src.signal_engine.enrichment.clearbit_client import (
+    ClearbitClient,
+    ClearbitCompany,
+    ClearbitError,
+)
+from src.signal_engine.enrichment.client_pool import close_shared_clients
 from src.signal_engine.enrichment.company_enricher import (
+    ApolloBreaker,
     EnrichmentInputs,
     _is_email_domain_sane,
+    build_compliance_context,
     enrich_permit_to_lead,
+    find_decision_maker,
 )
+from src.signal_engine.enrichment.geocoder import Geocoder, GeocodeResult
 from src.signal_engine.enrichment.hunter_client import (
+    HunterCircuitOpenError,
+    HunterClient,
     HunterDomainSearchResult,
     HunterEmailRecord,
+    HunterError,
+    MockHunterClient,
+    _parse_retry_after,
+    _resolve_name,
+)
+from src.signal_engine.enrichment.lookup_cache import LookupCache
+from src.signal_engine.enrichment.opencorporates_client import (
+    OpenCorporatesClient,
+    OpenCorporatesError,
+)
+from src.signal_engine.enrichment.provider_limits import (
+    PROVIDER_CONCURRENCY,
+    AIMDGate,
+    CircuitBreaker,
+    TokenBucket,
+    provider_slot,
+)
+from src.signal_engine.enrichment.provider_manager import (
+    CreditGuard,
+    ProviderManager,
+    _apply_email_pattern,
+    _contact_score,
 )
-from src.signal_engine.enrichment.provider_manager import ProviderManager
-from src.signal_engine.models import PermitData
+from src.signal_engine.enrichment.result_cache import ResultCache
+from src.signal_engine.models import Company, DecisionMaker, PermitData, RegulatoryUpdate
+
+
+@pytest.fixture(autouse=True)
+def _no_persistent_lookup_cache(monkeypatch):
+    monkeypatch.setattr(company_enricher, "_get_lookup_cache", lambda: None)
+    monkeypatch.setattr(company_enricher, "_LOOKUP_MEMO", ResultCache(ttl_s=3600))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_geocoder(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        geocoder_module, "_geocoder", Geocoder(cache_file=tmp_path / "geocoding_cache.sqlite3")
+    )
+    monkeypatch.setattr(geocoder_module, "_geocoder_loop", None)
 
 
 @pytest.mark.asyncio
@@ -37,6 +104,16 @@ def test_email_domain_sanity_filter():
         company_domain="acmefire.com",
         company_name="Acme Fire Systems",
     )
+    assert _is_email_domain_sane(
+        email="owner@mail.acmefire.co.uk",
+        company_domain="www.acmefire.co.uk",
+        company_name="Acme Fire Systems",
+    )
+    assert not _is_email_domain_sane(
+        email="owner@acmefire.com.evil.io",
+        company_domain="acmefire.com",
+        company_name="Acme Fire Systems",
+    )
     assert not _is_email_domain_sane(
         email="owner@gmail.com",
         company_domain="acmefire.com",
@@ -110,6 +187,437 @@ async def test_hunter_domain_search_fallback_selects_best_contact(monkeypatch):
     assert decision_maker.email == "ceo@example.com"
 
 
+@pytest.mark.asyncio
+async def test_provider_manager_reuses_one_hunter_client():
+    manager = ProviderManager(hunter_api_key="real-key", dry_run=False)
+    other = ProviderManager(hunter_api_key="real-key", dry_run=False)
+    client = manager._hunter_client()
+    try:
+        assert other._hunter_client() is client
+        dry_run = ProviderManager(hunter_api_key="real-key", dry_run=True)
+        assert dry_run._hunter_client() is not client
+        clearbit = manager._clearbit_client()
+        assert other._clearbit_client() is clearbit
+        assert company_enricher._get_clearbit_client() is clearbit
+    finally:
+        await close_shared_clients()
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_auto_runs_apollo_alongside_hunter(monkeypatch):
+    manager = ProviderManager(hunter_api_key="hunter-key", apollo_api_key="apollo-key")
+    apollo_started = asyncio.Event()
+    apollo_cancelled = []
+
+    async def fake_hunter(**kwargs):
+        await apollo_started.wait()  # Would deadlock if the providers ran one after another.
+        return hunter_result
+
+    async def fake_apollo(**kwargs):
+        apollo_started.set()
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            apollo_cancelled.append(True)
+            raise
+        return DecisionMaker(full_name="Apollo Person", email="apollo@acme.com")
+
+    monkeypatch.setattr(manager, "_try_hunter", fake_hunter)
+    monkeypatch.setattr(manager, "_try_apollo", fake_apollo)
+    lookup = dict(full_name="Jane Doe", company_domain="acme.com", company_name="Acme", title="CEO")
+
+    hunter_result = None
+    decision = await asyncio.wait_for(manager.find_decision_maker_email(**lookup), 1)
+    assert decision.email == "apollo@acme.com"
+
+    apollo_started.clear()
+    hunter_result = DecisionMaker(full_name="Jane Doe", email="jane@acme.com")
+    decision = await asyncio.wait_for(manager.find_decision_maker_email(**lookup), 1)
+    await asyncio.sleep(0)
+    assert decision.email == "jane@acme.com"
+    assert apollo_cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_refunds_apollo_credit_when_hunter_wins(monkeypatch):
+    manager = ProviderManager(
+        hunter_api_key="hunter-key", apollo_api_key="apollo-key", dry_run=False
+    )
+    apollo_started = asyncio.Event()
+
+    class SlowApollo:
+        async def find_decision_makers_enhanced(self, **kwargs):
+            apollo_started.set()
+            await asyncio.sleep(1)
+
+    async def fake_hunter(**kwargs):
+        await apollo_started.wait()
+        return DecisionMaker(full_name="Jane Doe", email="jane@acme.com")
+
+    monkeypatch.setattr(manager, "_apollo_client", lambda: SlowApollo())
+    monkeypatch.setattr(manager, "_try_hunter", fake_hunter)
+    decision = await asyncio.wait_for(
+        manager.find_decision_maker_email(
+            full_name="Jane Doe", company_domain="acme.com", company_name="Acme", title="CEO"
+        ),
+        1,
+    )
+    await asyncio.sleep(0)
+    assert decision.email == "jane@acme.com"
+    assert manager.credit_summary()["apollo"] == 0
+
+
+def test_provider_cache_evicts_least_recently_used():
+    cache = provider_manager_module._ProviderCache(max_entries=2)
+    for name in "abc":
+        cache.set_email((name, "x.com"), DecisionMaker(full_name=name))
+        if name == "b":
+            assert cache.get_email(("a", "x.com")).full_name == "a"
+    assert cache.get_email(("b", "x.com")) is None
+    assert list(cache.emails) == [("a", "x.com"), ("c", "x.com")]
+
+    cache.add_email_miss(("a", "x.com"))
+    assert cache.email_missed(("a", "x.com"))
+    assert cache.get_email(("a", "x.com")) is None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_skips_hunter_for_a_remembered_miss(monkeypatch):
+    monkeypatch.setattr(provider_manager_module, "_CACHE", provider_manager_module._ProviderCache())
+    calls = []
+
+    class FakeHunter:
+        circuit_open = False
+
+        async def find_email(self, **kwargs):
+            calls.append(kwargs)
+            return None
+
+    manager = ProviderManager(hunter_api_key="real-key", dry_run=False)
+    monkeypatch.setattr(manager, "_hunter_client", lambda: FakeHunter())
+    for _ in range(2):
+        decision = await manager.find_decision_maker_email(
+            full_name="Jane Doe", company_domain="Acme.com"
+        )
+        assert decision is None
+    assert len(calls) == 1
+    assert provider_manager_module._CACHE.email_missed(("jane doe", "acme.com"))
+
+    provider_manager_module._CACHE.email_misses[("jane doe", "acme.com")] = time.time() - 1
+    await manager.find_decision_maker_email(full_name="Jane Doe", company_domain="acme.com")
+    assert len(calls) == 2  # An expired miss is retried.
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_dry_run_misses_do_not_block_a_live_run(
+    isolated_provider_cache, tmp_path, monkeypatch
+):
+    cache_path = tmp_path / "cache.jsonl"
+    calls = []
+
+    class FakeHunter:
+        circuit_open = False
+
+        def __init__(self, dry_run):
+            self.dry_run = dry_run
+
+        async def find_email(self, **kwargs):
+            calls.append(self.dry_run)
+            return None
+
+    for dry_run in (True, False):
+        manager = ProviderManager(
+            hunter_api_key="real-key",
+            dry_run=dry_run,
+            persist_cache=True,
+            cache_path=str(cache_path),
+        )
+        monkeypatch.setattr(manager, "_hunter_client", lambda d=dry_run: FakeHunter(d))
+        await manager.find_decision_maker_email(full_name="Jane Doe", company_domain="acme.com")
+        await manager.aclose()
+    assert calls == [True, False]
+    assert manager.get_credits_used() == 1
+
+    provider_manager_module._CACHE.close_log()
+    record = json.loads(cache_path.read_text().splitlines()[-1])
+    assert record["k"] == ["jane doe", "acme.com"] and record["x"] > time.time()
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_hunter_outage_falls_back_to_apollo(monkeypatch):
+    monkeypatch.setattr(provider_manager_module, "_CACHE", provider_manager_module._ProviderCache())
+
+    class OpenCircuitHunter:
+        circuit_open = False
+
+        async def find_email(self, **kwargs):
+            raise HunterCircuitOpenError("Hunter circuit open; skipping request")
+
+    class FakeApollo:
+        async def find_decision_makers_enhanced(self, **kwargs):
+            return [DecisionMaker(full_name="Alex Leader", email="alex@acme.com")]
+
+    manager = ProviderManager(
+        hunter_api_key="real-key",
+        apollo_api_key="apollo-key",
+        provider_priority=provider_manager_module.EnrichmentProvider.HUNTER,
+        dry_run=False,
+    )
+    hunter = OpenCircuitHunter()
+    monkeypatch.setattr(manager, "_hunter_client", lambda: hunter)
+    monkeypatch.setattr(manager, "_apollo_client", lambda: FakeApollo())
+    lookup = dict(full_name="Jane Doe", company_domain="acme.com")
+    assert await manager.find_decision_maker_email(**lookup) is None
+    assert manager.get_credits_used() == 0  # Refused by the circuit: refunded.
+
+    hunter.circuit_open = True
+    assert await manager.find_decision_maker_email(**lookup) is None
+    assert manager.get_credits_used() == 0
+
+    manager = ProviderManager(hunter_api_key="real-key", apollo_api_key="apollo-key", dry_run=False)
+    monkeypatch.setattr(manager, "_hunter_client", lambda: hunter)
+    monkeypatch.setattr(manager, "_apollo_client", lambda: FakeApollo())
+    decision = await manager.find_decision_maker_email(
+        **lookup, company_name="Acme", title="Facilities Manager"
+    )
+    assert decision.email == "alex@acme.com"
+    assert manager.get_credits_used() == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_only_remembers_definitive_domain_misses(monkeypatch):
+    monkeypatch.setattr(provider_manager_module, "_CACHE", provider_manager_module._ProviderCache())
+    outcomes = [HunterCircuitOpenError("open"), HunterError("Hunter.io error 503"), None]
+
+    class FakeHunter:
+        circuit_open = False
+
+        async def domain_search(self, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    manager = ProviderManager(hunter_api_key="real-key", dry_run=False)
+    hunter = FakeHunter()
+    monkeypatch.setattr(manager, "_hunter_client", lambda: hunter)
+
+    assert await manager._get_domain_search_result("acme.com") is None
+    assert manager.get_credits_used() == 0  # Refused by the breaker: refunded.
+    assert await manager._get_domain_search_result("acme.com") is None
+    assert manager.get_credits_used() == 1
+    assert not provider_manager_module._CACHE.domain_missed("acme.com")
+    assert await manager._get_domain_search_result("acme.com") is None
+    assert provider_manager_module._CACHE.domain_missed("acme.com")
+
+    hunter.circuit_open = True
+    assert await manager._get_domain_search_result("other.com") is None
+    assert manager.get_credits_used() == 2
+    assert not outcomes
+
+
+def test_circuit_breaker_refusing_does_not_claim_the_probe(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "src.signal_engine.enrichment.provider_limits.time.monotonic", lambda: now[0]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, open_s=10.0)
+    breaker.record_failure()
+    assert breaker.refusing() and not breaker.allow()
+    now[0] = 11.0
+    assert not breaker.refusing()
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_skips_malformed_domains_without_spending_credits(monkeypatch):
+    monkeypatch.setattr(provider_manager_module, "_CACHE", provider_manager_module._ProviderCache())
+
+    class FailingHunter:
+        async def find_email(self, **kwargs):
+            raise AssertionError("Hunter should not be called")
+
+        async def domain_search(self, **kwargs):
+            raise AssertionError("Hunter should not be called")
+
+    manager = ProviderManager(hunter_api_key="real-key", dry_run=False)
+    monkeypatch.setattr(manager, "_hunter_client", lambda: FailingHunter())
+    for domain in ["localhost", "acme", "10.0.0.1", "-acme.com", "acme..com"]:
+        assert (
+            await manager.find_decision_maker_email(full_name="Jane Doe", company_domain=domain)
+            is None
+        )
+        assert (
+            await manager.find_any_contact_email_via_domain_search(company_domain=domain)
+            is None
+        )
+    assert manager.get_credits_used() == 0
+
+
+@pytest.fixture
+def isolated_provider_cache(monkeypatch):
+    registered = []
+    monkeypatch.setattr(provider_manager_module.atexit, "register", registered.append)
+    monkeypatch.setattr(provider_manager_module, "_CACHE", provider_manager_module._ProviderCache())
+    yield registered
+    provider_manager_module._CACHE.close_log()
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_batches_persistent_cache_writes(
+    isolated_provider_cache, tmp_path
+):
+    cache_path = tmp_path / "cache.jsonl"
+    manager = ProviderManager(
+        hunter_api_key="test", dry_run=True, persist_cache=True, cache_path=str(cache_path)
+    )
+
+    for i in range(provider_manager_module._CACHE_FLUSH_EVERY - 1):
+        provider_manager_module._CACHE.add_domain_miss(f"d{i}.com")
+        manager._mark_cache_dirty("domain", f"d{i}.com")
+    assert not cache_path.exists()
+    assert isolated_provider_cache == [ProviderManager.flush_pending_cache]
+
+    provider_manager_module._CACHE.add_domain_miss("last.com")
+    manager._mark_cache_dirty("domain", "last.com")
+    assert provider_manager_module._CACHE.flush_task is not None  # Written from a worker thread.
+    await provider_manager_module._CACHE.flush_task
+    header, *records = cache_path.read_text().splitlines()
+    assert json.loads(header) == provider_manager_module._CACHE_HEADER
+    assert len(records) == provider_manager_module._CACHE_FLUSH_EVERY
+
+    provider_manager_module._CACHE.add_domain_miss("late.com")
+    manager._mark_cache_dirty("domain", "late.com")
+    await manager.aclose()
+    last = json.loads(cache_path.read_text().splitlines()[-1])
+    assert last["x"] > time.time()
+    assert last == {"t": "domain", "k": "late.com", "v": None, "x": last["x"]}
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_context_flushes_cache(isolated_provider_cache, tmp_path):
+    cache_path = tmp_path / "cache.jsonl"
+    async with ProviderManager(
+        hunter_api_key="test", dry_run=True, persist_cache=True, cache_path=str(cache_path)
+    ) as manager:
+        provider_manager_module._CACHE.add_domain_miss("acme.com")
+        manager._mark_cache_dirty("domain", "acme.com")
+        assert not cache_path.exists()
+    assert json.loads(cache_path.read_text().splitlines()[-1])["k"] == "acme.com"
+
+
+def test_provider_manager_cache_log_follows_each_cache_path(isolated_provider_cache, tmp_path):
+    first_path, second_path = tmp_path / "first.jsonl", tmp_path / "second.jsonl"
+    for path, domain in ((first_path, "first.com"), (second_path, "second.com")):
+        manager = ProviderManager(
+            hunter_api_key="test", dry_run=True, persist_cache=True, cache_path=str(path)
+        )
+        provider_manager_module._CACHE.add_domain_miss(domain)
+        manager._mark_cache_dirty("domain", domain)
+        manager.flush_cache()
+    assert json.loads(first_path.read_text().splitlines()[-1])["k"] == "first.com"
+    assert json.loads(second_path.read_text().splitlines()[-1])["k"] == "second.com"
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_cache_log_keeps_names_with_separators(
+    isolated_provider_cache, tmp_path
+):
+    cache_path = tmp_path / "cache.jsonl"
+    manager = ProviderManager(
+        hunter_api_key="test", dry_run=True, persist_cache=True, cache_path=str(cache_path)
+    )
+    key = ("smith | jones", "acme.com")
+    provider_manager_module._CACHE.set_email(key, DecisionMaker(full_name="Smith | Jones"))
+    manager._mark_cache_dirty("email", key)
+    await manager.aclose()
+    provider_manager_module._CACHE.close_log()
+
+    provider_manager_module._CACHE = provider_manager_module._ProviderCache()
+    ProviderManager(hunter_api_key="test", persist_cache=True, cache_path=str(cache_path))
+    assert provider_manager_module._CACHE.get_email(key).full_name == "Smith | Jones"
+
+
+@pytest.mark.asyncio
+async def test_provider_manager_cache_log_replays_and_imports_legacy_json(
+    isolated_provider_cache, tmp_path
+):
+    legacy_path = tmp_path / "cache.json"
+    legacy_path.write_text(
+        json.dumps(
+            {
+                "email_lookup": {"jane doe|acme.com": {"full_name": "Jane Doe"}},
+                "domain_search": {"acme.com": None},
+            }
+        )
+    )
+    manager = ProviderManager(
+        hunter_api_key="test", dry_run=True, persist_cache=True, cache_path=str(legacy_path)
+    )
+    log_path = tmp_path / "cache.jsonl"
+    assert manager.cache_path == log_path
+    # Schema header + the found email; the legacy miss has no expiry and is retried.
+    assert len(log_path.read_text().splitlines()) == 2
+
+    decision = DecisionMaker(full_name="Jane Doe", email="jane@acme.com")
+    provider_manager_module._CACHE.set_email(("jane doe", "acme.com"), decision)
+    manager._mark_cache_dirty("email", ("jane doe", "acme.com"))
+    await manager.aclose()
+    with log_path.open("a") as log:
+        log.write(f'{{"t":"domain","k":"acme.com","v":null,"x":{time.time() + 60}}}\n')
+        log.write('{"t":"domain","k":"torn')  # Interrupted write.
+    provider_manager_module._CACHE.close_log()
+
+    cache = provider_manager_module._CACHE = provider_manager_module._ProviderCache()
+    ProviderManager(hunter_api_key="test", persist_cache=True, cache_path=str(legacy_path))
+    assert cache.get_email(("jane doe", "acme.com")).email == "jane@acme.com"
+    assert cache.email_payload(("jane doe", "acme.com")) == decision.model_dump()
+    assert list(cache.domain_misses) == ["acme.com"]
+
+    assert not (tmp_path / "cache.jsonl.tmp").exists()
+
+    log_path.write_text('{"schema":0}\n{"t":"domain","k":"old.com","v":null,"x":1e12}\n')
+    cache = provider_manager_module._CACHE = provider_manager_module._ProviderCache()
+    ProviderManager(hunter_api_key="test", persist_cache=True, cache_path=str(log_path))
+    assert not cache.domain_misses
+    assert log_path.read_text() == '{"schema":1}\n'
+
+
+def test_apply_email_pattern_substitutes_tokens_once():
+    def apply(pattern: str) -> str | None:
+        return _apply_email_pattern(
+            pattern=pattern, first_name="Lola", last_name="Fell", domain="acme.com"
+        )
+
+    assert apply("{first}.{last}") == "lola.fell@acme.com"
+    assert apply("{f}{last}") == "lfell@acme.com"
+    assert apply("{first}_{l}") == "lola_f@acme.com"
+    assert apply("{first}@flowers.com") == "lola@flowers.com"
+
+
+def test_contact_score_matches_whole_title_words():
+    def record(position: str) -> HunterEmailRecord:
+        return HunterEmailRecord(
+            email="x@acme.com", first_name=None, last_name=None, position=position, confidence=50
+        )
+
+    assert _contact_score(record("Co-Founder & CEO")) == 60
+    assert _contact_score(record("Sales Manager")) == 60
+    assert _contact_score(record("Customer Support")) == 45
+    assert _contact_score(record("Information Security Analyst")) == 50
+
+
+def test_credit_guard_stops_at_the_limit():
+    guard = CreditGuard(max_credits=2, provider_name="Hunter.io")
+    guard.check_and_increment()
+    guard.check_and_increment()
+    with pytest.raises(RuntimeError, match="Used 2/2 credits"):
+        guard.check_and_increment()
+    assert guard.credits_used == 2
+
+
 def test_should_stop_for_email_target():
     results = [
         {"email": "a@example.com"},
@@ -119,3 +627,784 @@ def test_should_stop_for_email_target():
     assert should_stop_for_email_target(results, 2)
     assert not should_stop_for_email_target(results, 3)
 
+
+
+@pytest.mark.asyncio
+async def test_lookup_company_gathers_both_providers():
+    class FakeApollo:
+        async def search_organization(self, *, company_name, location=None):
+            return ApolloCompany(name=company_name, domain="acmefire.com")
+
+    class FakeClearbit:
+        async def suggest_company(self, *, query):
+            return ClearbitCompany(name=query, domain="acme.io")
+
+    class FailingClearbit:
+        async def suggest_company(self, *, query):
+            raise ClearbitError("boom")
+
+    apollo, clearbit = await lookup_company("Acme Fire", None, FakeApollo(), FakeClearbit())
+    assert apollo.domain == "acmefire.com"
+    assert clearbit.domain == "acme.io"
+
+    apollo, clearbit = await lookup_company("Acme Fire", None, FakeApollo(), FailingClearbit())
+    assert apollo.domain == "acmefire.com"
+    assert clearbit is None
+    with pytest.raises(ClearbitError):
+        await lookup_company("Acme Fire", None, FakeApollo(), FailingClearbit(), raise_errors=True)
+
+
+def test_apollo_title_match_uses_lowercased_title_set():
+    known = apollo_client_module._DECISION_MAKER_TITLES_LC
+    assert "facilities manager" in known
+    assert all(title == title.lower() for title in known)
+    assert apollo_client_module._title_matches("chief engineer", known)
+    assert apollo_client_module._title_matches("senior facilities manager", known)
+    assert not apollo_client_module._title_matches("sales associate", known)
+
+
+@pytest.mark.asyncio
+async def test_apollo_breaker_backs_off_then_disables():
+    breaker = ApolloBreaker(min_concurrency=1.0, max_concurrency=4.0, disable_after=2)
+
+    async with breaker.acquire():
+        pass
+    assert breaker.concurrency == 4.0
+
+    for _ in range(3):
+        with pytest.raises(ApolloRateLimitError):
+            async with breaker.acquire():
+                raise ApolloRateLimitError("429")
+    assert breaker.concurrency == 1.0
+    assert not breaker.disabled
+
+    with pytest.raises(ApolloRateLimitError):
+        async with breaker.acquire():
+            raise ApolloRateLimitError("429")
+    assert breaker.disabled
+
+
+@pytest.mark.asyncio
+async def test_find_decision_maker_coalesces_duplicate_companies(monkeypatch):
+    calls = 0
+
+    async def fake_find(company, geocode_result, permit=None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return DecisionMaker(full_name="Alex Leader", email="alex@acmefire.com")
+
+    monkeypatch.setattr(company_enricher, "_find_decision_maker", fake_find)
+    monkeypatch.setattr(company_enricher, "_DECISION_MAKER_CACHE", ResultCache(ttl_s=3600))
+    company = Company(name="Acme Fire Systems", website="https://acmefire.com")
+
+    first, second = await asyncio.gather(
+        find_decision_maker(company, None), find_decision_maker(company, None)
+    )
+    third = await find_decision_maker(company, None)
+    assert calls == 1
+    assert first.email == second.email == third.email == "alex@acmefire.com"
+
+
+@pytest.mark.asyncio
+async def test_find_decision_maker_cache_is_bounded(monkeypatch):
+    seen: list[str] = []
+
+    async def fake_find(company, geocode_result, permit=None):
+        seen.append(company.name)
+        return None
+
+    monkeypatch.setattr(company_enricher, "_find_decision_maker", fake_find)
+    monkeypatch.setattr(
+        company_enricher, "_DECISION_MAKER_CACHE", ResultCache(ttl_s=3600, max_entries=2)
+    )
+    for name in ("Acme Fire", "Beta Sprinkler", "Gamma Alarm", "Acme Fire"):
+        await find_decision_maker(Company(name=name), None)
+    assert seen == ["Acme Fire", "Beta Sprinkler", "Gamma Alarm", "Acme Fire"]
+    assert len(company_enricher._DECISION_MAKER_CACHE._entries) == 2
+
+
+def test_persist_enrichment_metrics_appends_one_line_per_run(tmp_path):
+    path = tmp_path / "metrics" / "workflow_metrics.jsonl"
+    for label, emails in (("current", 5), ("historical", 3)):
+        company_enricher.persist_enrichment_metrics(
+            label=label,
+            permits_tested=10,
+            emails_found=emails,
+            metrics={"emails_accepted": emails},
+            output_path=str(path),
+        )
+    runs = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(run["label"], run["emails_found"]) for run in runs] == [
+        ("current", 5),
+        ("historical", 3),
+    ]
+    assert runs[0]["metrics"] == {"emails_accepted": 5}
+
+
+def test_lookup_cache_roundtrip_and_expiry(tmp_path):
+    cache = LookupCache(tmp_path / "lookups.sqlite3")
+    assert cache.get("clearbit_domain", "acme fire") is LookupCache.MISSING
+    cache.set("clearbit_domain", "acme fire", "acmefire.com")
+    cache.set("clearbit_domain", "gone", None, ttl_s=-1)
+    assert cache.get("clearbit_domain", "acme fire") == "acmefire.com"
+    assert cache.get("opencorporates_officers", "acme fire") is LookupCache.MISSING
+    assert cache.get("clearbit_domain", "gone") is LookupCache.MISSING
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_provider_slot_caps_concurrency():
+    in_flight = peak = 0
+
+    async def call():
+        nonlocal in_flight, peak
+        async with provider_slot("opencorporates"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == PROVIDER_CONCURRENCY["opencorporates"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate_per_s=50.0, capacity=2.0)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(2)))
+    assert time.monotonic() - start < 0.02  # The burst is admitted immediately.
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+    assert time.monotonic() - start >= 0.05
+
+
+def test_circuit_breaker_opens_then_probes(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(
+        "src.signal_engine.enrichment.provider_limits.time.monotonic", lambda: now
+    )
+    breaker = CircuitBreaker(failure_threshold=2, open_s=30)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now += 30
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()  # Only one probe at a time.
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_aimd_gate_adapts_concurrency():
+    gate = AIMDGate(initial=2, max_concurrency=4, latency_target_s=1.0)
+    in_flight = peak = 0
+
+    async def call():
+        nonlocal in_flight, peak
+        async with gate.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+
+    for _ in range(10):
+        gate.on_success(0.1)
+    assert gate.concurrency == 4
+    gate.on_overload()
+    gate.on_overload()
+    assert gate.concurrency == 1
+
+
+def test_aimd_gate_backs_off_once_per_slow_window():
+    gate = AIMDGate(initial=16, max_concurrency=16, latency_target_s=1.0, window=4)
+    for _ in range(3):
+        gate.on_success(5.0)
+    assert gate.concurrency == 16  # Not a full window yet.
+    for _ in range(5):
+        gate.on_success(5.0)
+    assert gate.concurrency == 4  # Two windows of slow responses: two halvings.
+    assert hunter_client_module._HUNTER_GATE.latency_target_s > 3.0
+
+
+@pytest.mark.asyncio
+async def test_hunter_find_email_caches_hits_and_misses():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["first_name"])
+        if request.url.params["first_name"] == "Nobody":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"data": {"email": "jane.doe@acme.com", "score": 95}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = HunterClient(api_key="real-key", http_client=http)
+        found, duplicate = await asyncio.gather(
+            client.find_email(first_name="Jane", last_name="Doe", domain="acme.com"),
+            client.find_email(full_name=" jane doe", domain="www.ACME.com"),
+        )
+        missing = await client.find_email(first_name="Nobody", domain="acme.com")
+        again = await client.find_email(first_name="Nobody", domain="acme.com")
+        await client.aclose()
+        assert not http.is_closed  # Injected clients belong to the caller.
+
+    assert found is duplicate and found.email == "jane.doe@acme.com"
+    assert missing is None and again is None
+    assert requests == ["Jane", "Nobody"]
+
+
+@pytest.mark.asyncio
+async def test_clearbit_client_stops_reading_oversized_responses(monkeypatch):
+    monkeypatch.setattr(clearbit_client_module, "_MAX_RESPONSE_BYTES", 64)
+    body = json.dumps([{"name": "Acme", "domain": "acme.com"}]).encode()
+    chunks_read = []
+
+    async def endless_body():
+        while True:
+            chunks_read.append(1)
+            yield b" " * 32
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        if query == "big":
+            return httpx.Response(200, content=b" " * 65)
+        if query == "chunked":
+            return httpx.Response(200, content=endless_body())
+        return httpx.Response(200, content=body)
+
+    client = ClearbitClient()
+    await client.aclose()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        assert (await client.suggest_company(query="acme")).domain == "acme.com"
+        for query in ("big", "chunked"):
+            with pytest.raises(ClearbitError, match="larger than 64 bytes"):
+                await client.suggest_company(query=query)
+        assert len(chunks_read) == 3
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_geocode_batch_dedupes_and_uses_cache(tmp_path):
+    requested: list[str] = []
+    sent_at: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        requested.append(query)
+        sent_at.append(time.monotonic())
+        if query == "nowhere":
+            return httpx.Response(200, json=[])
+        return httpx.Response(
+            200,
+            json=[{"lat": "1.5", "lon": "2.5", "display_name": query, "address": {"state": "TX"}}],
+        )
+
+    geocoder = Geocoder(cache_file=tmp_path / "geo.sqlite3")
+    geocoder._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await geocoder._ensure_cache()
+    geocoder._cache_put("cached st", GeocodeResult(0.0, 0.0, "cached st"))
+
+    results = await geocoder.geocode_batch(
+        ["1 Main St", " 1 main st. ", "Cached St", "nowhere", "1 MAIN ST"]
+    )
+    # Both the hit and the miss are cached now, so a repeat batch makes no requests.
+    repeat = await geocoder.geocode_batch(["1 Main St", "Nowhere"])
+    assert repeat[0].state == "TX" and repeat[1] is None
+    await geocoder.aclose()
+
+    assert sorted(requested) == ["1 Main St", "nowhere"]
+    assert sent_at[1] - sent_at[0] >= 0.9  # Nominatim's 1 req/s cap holds within a batch.
+    assert results[0] == results[1] == results[4]
+    assert results[0].state == "TX"
+    assert results[2].formatted_address == "cached st"
+    assert results[3] is None
+
+
+@pytest.mark.asyncio
+async def test_cached_lookup_company_coalesces_and_memoizes(monkeypatch):
+    calls = 0
+
+    async def fake_lookup(name, location, apollo, clearbit, *, raise_errors=False):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return ApolloCompany(name=name, domain="acmefire.com", website=None), None
+
+    monkeypatch.setattr(company_enricher, "lookup_company", fake_lookup)
+    first, concurrent = await asyncio.gather(
+        company_enricher._cached_lookup_company("Acme Fire, Inc.", "Austin, TX", "k"),
+        company_enricher._cached_lookup_company("acme fire inc", "Austin, TX", "k"),
+    )
+    second = await company_enricher._cached_lookup_company("ACME FIRE INC", "Austin, TX", "k")
+
+    assert calls == 1
+    assert first == concurrent == second
+    assert first[0].domain == "acmefire.com"
+
+
+@pytest.mark.asyncio
+async def test_cached_lookup_company_does_not_persist_failures(monkeypatch, tmp_path):
+    cache = LookupCache(tmp_path / "lookups.sqlite3")
+    monkeypatch.setattr(company_enricher, "_get_lookup_cache", lambda: cache)
+    outcomes = [httpx.ConnectError("down"), None]
+
+    class FakeApollo:
+        async def search_organization(self, *, company_name, location=None):
+            outcome = outcomes.pop(0)
+            if outcome is not None:
+                raise outcome
+            return None
+
+    class EmptyClearbit:
+        async def suggest_company(self, *, query):
+            return None
+
+    monkeypatch.setattr(company_enricher, "_get_apollo_client", lambda key: FakeApollo())
+    monkeypatch.setattr(company_enricher, "_get_clearbit_client", lambda: EmptyClearbit())
+    with pytest.raises(httpx.ConnectError):
+        await company_enricher._cached_lookup_company("Acme Fire", None, "k")
+    assert cache.get("company_match", "acme fire|") is LookupCache.MISSING
+
+    assert await company_enricher._cached_lookup_company("Acme Fire", None, "k") == (None, None)
+    assert cache.get("company_match", "acme fire|") is None  # A genuine "not found".
+    assert not outcomes
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_and_writes_lookup_cache_off_the_event_loop(monkeypatch, tmp_path):
+    cache = LookupCache(tmp_path / "lookups.sqlite3")
+    threads = []
+    get, set_ = cache.get, cache.set
+    monkeypatch.setattr(cache, "get", lambda *a: threads.append(threading.get_ident()) or get(*a))
+    monkeypatch.setattr(
+        cache, "set", lambda *a, **kw: threads.append(threading.get_ident()) or set_(*a, **kw)
+    )
+    monkeypatch.setattr(company_enricher, "_get_lookup_cache", lambda: cache)
+
+    async def fetch():
+        return "acmefire.com"
+
+    assert await company_enricher._cached("clearbit_domain", "acme fire", fetch) == "acmefire.com"
+    assert len(threads) == 2 and threading.get_ident() not in threads
+    assert cache.get("clearbit_domain", "acme fire") == "acmefire.com"
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_match_company_refines_with_location_only_on_a_miss(monkeypatch):
+    lookups = []
+
+    async def fake_lookup(company_name, location):
+        lookups.append(location)
+        if location == "Austin, TX":
+            return ApolloCompany(name="Acme Austin", website="https://acme-tx.com"), None
+        return None, None
+
+    monkeypatch.setattr(company_enricher, "_guarded_lookup_company", fake_lookup)
+    permit = PermitData(
+        source="test",
+        permit_id="P-1",
+        permit_type="Fire Alarm",
+        address="1 Main St",
+        status="Issued",
+        applicant_name="Acme Fire Systems",
+    )
+    name_match = (ApolloCompany(name="Acme Elsewhere", website="https://acme.com"), None)
+    austin = GeocodeResult(0.0, 0.0, "1 Main St", city="Austin", state="TX")
+    match = company_enricher.match_company
+
+    assert (await match(permit, austin, name_match=name_match)).name == "Acme Elsewhere"
+    assert (await match(permit, None, name_match=name_match)).name == "Acme Elsewhere"
+    assert lookups == []  # The name-only match is reused, not looked up again.
+
+    assert (await match(permit, austin, name_match=(None, None))).name == "Acme Austin"
+    assert (await match(permit, None, name_match=(None, None))).name == "Acme Fire Systems"
+    assert (await match(permit, austin)).name == "Acme Austin"
+    assert lookups == ["Austin, TX", "Austin, TX"]
+
+
+def test_canonical_company_name_collapses_variants():
+    canonical = company_enricher._canonical_company_name
+    assert (
+        canonical("ACME Electrical, Inc")
+        == canonical("Acme Electrical LLC")
+        == canonical("acme  electrical corp.")
+        == "acme electrical"
+    )
+    assert canonical("Acme Plumbing") != canonical("Acme Electrical")
+    assert canonical("Electrical Acme") != canonical("Acme Electrical")
+    assert canonical("Inc.") == "inc"
+
+
+def test_canonical_company_name_keeps_trade_words_distinct():
+    canonical = company_enricher._canonical_company_name
+    assert canonical("ABC Construction") != canonical("ABC Engineering")
+    assert canonical("Smith Architects") != canonical("Smith Builders LLC")
+    assert canonical("Acme Group") != canonical("Acme Partners")
+
+
+@pytest.mark.asyncio
+async def test_geocoder_sqlite_cache_persists_and_imports_legacy_json(tmp_path):
+    legacy = tmp_path / "geo.json"
+    legacy.write_text(
+        '{"9 Elm St": {"latitude": 1.0, "longitude": 2.0, '
+        '"formatted_address": "9 Elm St", "state": "TX"}}'
+    )
+    geocoder = Geocoder(cache_file=legacy)
+    assert geocoder.cache_file == tmp_path / "geo.sqlite3"
+    await geocoder._ensure_cache()
+    assert geocoder._cache_get("9 Elm St").state == "TX"
+    geocoder._cache_put("1 Oak Ave", GeocodeResult(3.0, 4.0, "1 Oak Ave", city="Austin"))
+    await geocoder.aclose()
+
+    reopened = Geocoder(cache_file=tmp_path / "geo.sqlite3")
+    await reopened._ensure_cache()
+    assert reopened._cache_get("1 Oak Ave").city == "Austin"
+    assert reopened._cache_get("missing") is None
+    await reopened.aclose()
+
+
+@pytest.mark.asyncio
+async def test_enrich_permits_to_leads_isolates_failures(monkeypatch):
+    async def fake_geocode_addresses(addresses):
+        return [None] * len(addresses)
+
+    async def fake_enrich(inputs, geocode_result):
+        if inputs.permit.permit_id == "BAD":
+            raise ValueError("boom")
+        return inputs.permit.permit_id
+
+    monkeypatch.setattr(company_enricher, "geocode_addresses", fake_geocode_addresses)
+    monkeypatch.setattr(company_enricher, "_enrich_geocoded_permit", fake_enrich)
+    inputs = [
+        EnrichmentInputs(
+            tenant_id="demo",
+            permit=PermitData(
+                source="test",
+                permit_id=permit_id,
+                permit_type="Fire Alarm",
+                address="123 Main St",
+                status="Issued",
+            ),
+        )
+        for permit_id in ("P-1", "BAD", "P-2")
+    ]
+
+    leads = await company_enricher.enrich_permits_to_leads(inputs, concurrency=2)
+    assert leads == ["P-1", None, "P-2"]
+
+
+@pytest.mark.asyncio
+async def test_enrich_permit_to_lead_overlaps_company_lookup_with_geocoding(monkeypatch):
+    geocode_done = asyncio.Event()
+    lookups = []
+
+    async def slow_geocode(address):
+        await asyncio.sleep(0.05)
+        geocode_done.set()
+        return GeocodeResult(latitude=0, longitude=0, formatted_address=address, state="TX")
+
+    async def fake_lookup(name, location, apollo_key):
+        lookups.append((location, geocode_done.is_set()))
+        if location is None:
+            return None, None
+        return ApolloCompany(name=name, domain="acmefire.com", website="https://acmefire.com"), None
+
+    async def no_decision_maker(company, geocode_result, permit):
+        return None
+
+    settings = company_enricher.get_settings()
+    monkeypatch.setattr(settings, "apollo_enabled", True)
+    monkeypatch.setattr(settings, "apollo_api_key", "k")
+    monkeypatch.setattr(company_enricher, "geocode_address", slow_geocode)
+    monkeypatch.setattr(company_enricher, "_cached_lookup_company", fake_lookup)
+    monkeypatch.setattr(company_enricher, "find_decision_maker", no_decision_maker)
+    permit = PermitData(
+        source="test",
+        permit_id="P-9",
+        permit_type="Fire Alarm",
+        address="9 Elm St",
+        status="Issued",
+        applicant_name="Acme Fire Systems",
+    )
+
+    lead = await enrich_permit_to_lead(EnrichmentInputs(tenant_id="demo", permit=permit))
+    # Name-only lookup ran while geocoding; the miss was refined with the location.
+    assert lookups == [(None, False), ("TX", True)]
+    assert lead.company.website == "https://acmefire.com"
+
+
+@pytest.mark.asyncio
+async def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(ttl_s=60, max_entries=2)
+    fetched = []
+
+    async def fetch(key):
+        fetched.append(key)
+        return key.upper()
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        assert await cache.get_or_fetch(key, lambda key=key: fetch(key)) == key.upper()
+    # "a" stayed hot, so adding "c" evicted "b", which had to be fetched again.
+    assert fetched == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_result_cache_uses_negative_ttl_for_empty_results():
+    cache = ResultCache(ttl_s=60, negative_ttl_s=0)
+    fetched = []
+
+    async def fetch(key):
+        fetched.append(key)
+        return "found" if key == "hit" else None
+
+    for key in ("hit", "miss", "hit", "miss"):
+        await cache.get_or_fetch(key, lambda key=key: fetch(key))
+    assert fetched == ["hit", "miss", "miss"]
+
+
+@pytest.mark.asyncio
+async def test_opencorporates_search_coalesces_concurrent_duplicates():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["q"])
+        await asyncio.sleep(0.01)
+        company = {"name": "ACME FIRE INC", "jurisdiction_code": "us_tx", "company_number": "42"}
+        return httpx.Response(200, json={"results": {"companies": [{"company": company}]}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = OpenCorporatesClient(http_client=http)
+        results = await asyncio.gather(
+            client.search_company(name="Acme Fire Inc"),
+            client.search_company(name="  acme  fire inc"),
+            client.search_company(name="ACME FIRE INC"),
+        )
+
+    assert len(requests) == 1
+    assert results[0] is results[1] is results[2]
+    assert results[0].company_number == "42"
+
+
+@pytest.mark.asyncio
+async def test_opencorporates_officers_only_memoizes_definitive_answers():
+    statuses = {"1": [429, 503, 200], "2": [404]}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = request.url.path.rsplit("/", 2)[-2]
+        requests.append(number)
+        status = statuses[number].pop(0)
+        officers = [{"officer": {"name": "Jane Doe"}}] if status == 200 else []
+        return httpx.Response(status, json={"results": {"officers": officers}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = OpenCorporatesClient(api_key="token", http_client=http)
+        lookup = dict(jurisdiction_code="us_tx")
+        for _ in range(2):
+            with pytest.raises(OpenCorporatesError, match="officers error"):
+                await client.get_officer_names(**lookup, company_number="1")
+        for _ in range(2):
+            assert await client.get_officer_names(**lookup, company_number="1") == ["Jane Doe"]
+            assert await client.get_officer_names(**lookup, company_number="2") == []
+
+    assert requests == ["1", "1", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_opencorporates_error_message_truncates_large_bodies():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, text="<html>" + "x" * 10_000 + "</html>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = OpenCorporatesClient(http_client=http)
+        with pytest.raises(OpenCorporatesError) as exc_info:
+            await client.search_company(name="Acme Fire Inc")
+
+    message = str(exc_info.value)
+    assert message.startswith("OpenCorporates error 403: <html>")
+    assert len(message) < 300
+
+
+@pytest.mark.asyncio
+async def test_hunter_persistent_cache_survives_a_new_client(tmp_path, monkeypatch):
+    requests = []
+    disk_threads = set()
+    get, set_ = LookupCache.get, LookupCache.set
+
+    def tracked(method):
+        def call(*args, **kwargs):
+            disk_threads.add(threading.get_ident())
+            return method(*args, **kwargs)
+
+        return call
+
+    monkeypatch.setattr(LookupCache, "get", tracked(get))
+    monkeypatch.setattr(LookupCache, "set", tracked(set_))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("domain-search"):
+            emails = [{"value": "ann@acme.com", "first_name": "Ann", "last_name": "Lee"}]
+            return httpx.Response(200, json={"data": {"pattern": "{first}", "emails": emails}})
+        if request.url.params["first_name"] == "Nobody":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"data": {"email": "jane@acme.com", "score": 90}})
+
+    cache_path = tmp_path / "hunter.sqlite3"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        runs = []
+        for _ in range(2):
+            client = HunterClient(api_key="real-key", http_client=http, cache_path=cache_path)
+            runs.append(
+                (
+                    await client.find_email(first_name="Jane", last_name="Doe", domain="acme.com"),
+                    await client.find_email(first_name="Nobody", domain="acme.com"),
+                    await client.domain_search(domain="acme.com"),
+                )
+            )
+            await client.aclose()
+
+    assert len(requests) == 3  # The second client answered everything from disk.
+    assert disk_threads and threading.get_ident() not in disk_threads
+    assert runs[0] == runs[1]
+    assert runs[1][2].emails[0].email == "ann@acme.com"
+
+
+@pytest.mark.asyncio
+async def test_hunter_find_email_rejects_dirty_input_without_a_request():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = HunterClient(api_key="real-key", http_client=http)
+        assert await client.find_email(first_name="Jane", domain="acme .com") is None
+        assert await client.find_email(first_name="Jane", domain="-acme.com") is None
+        assert await client.find_email(first_name="Jane", domain="localhost") is None
+        assert await client.find_email(full_name="ACME <LLC>", domain="acme.com") is None
+        assert await client.domain_search(domain="not a domain") is None
+    mock = MockHunterClient()
+    assert await mock.find_email(first_name="Jane", domain="acme.com/team") is None
+    assert (await mock.find_email(first_name="Jane", domain=" acme.com ")).domain == "acme.com"
+
+
+@pytest.mark.asyncio
+async def test_hunter_get_json_retries_with_jittered_backoff(monkeypatch):
+    statuses = iter([503, 200])
+    ceilings = []
+
+    def fake_uniform(low, high):
+        ceilings.append((low, high))
+        return 0.0
+
+    monkeypatch.setattr(hunter_client_module.random, "uniform", fake_uniform)
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+    async with httpx.AsyncClient(transport=transport) as http:
+        client = HunterClient(api_key="real-key", http_client=http)
+        resp = await client._get_json(
+            url="https://api.hunter.io/v2/email-finder", params={}, backoff_s=4, max_backoff_s=3
+        )
+
+    assert resp.status_code == 200
+    assert ceilings == [(0, 3)]  # Full jitter over min(4 * 2**0, max_backoff_s)
+
+
+def test_hunter_resolve_name_from_full_name():
+    assert _resolve_name(None, None, " Jane  van Doe ") == ("Jane", "van Doe")
+    assert _resolve_name(None, "Doe", "Jane") == ("Jane", "Doe")
+    assert _resolve_name("Ann", "Lee", "Jane Doe") == ("Ann", "Lee")
+    assert _resolve_name(None, None, "\uff2aane Doe") == ("Jane", "Doe")  # NFKC folds width
+    assert _resolve_name(None, None, "   ") == (None, None)
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert _parse_retry_after("3") == 3.0
+    assert _parse_retry_after("-1") == 0.0
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # Already past
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = _parse_retry_after(format_datetime(future, usegmt=True))
+    assert 25 <= delay <= 30
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_build_compliance_context_dedupes_in_order():
+    def update(update_id, title, codes, triggers):
+        return RegulatoryUpdate(
+            update_id=update_id,
+            source="nfpa",
+            source_name="NFPA",
+            title=title,
+            content="",
+            published_date=datetime(2024, 1, 1),
+            url="https://example.com",
+            applicable_codes=codes,
+            compliance_triggers=triggers,
+        )
+
+    context = build_compliance_context(
+        [
+            update("u1", "Alarm update", ["NFPA 72", "NFPA 13"], ["alarm retrofit"]),
+            update("u2", "Sprinkler update", ["NFPA 13", "NFPA 25"], []),
+            update("u3", "Alarm again", ["NFPA 72"], ["alarm retrofit", "inspection"]),
+        ],
+        None,
+    )
+    assert context.applicable_codes == ["NFPA 72", "NFPA 13", "NFPA 25"]
+    assert context.triggers == ["alarm retrofit", "Sprinkler update", "inspection"]
+
+
+def test_global_geocoder_is_recreated_for_a_new_event_loop(monkeypatch, tmp_path):
+    created: list[Geocoder] = []
+
+    def make(**kwargs):
+        geocoder = Geocoder(cache_file=tmp_path / f"geo{len(created)}.sqlite3")
+        created.append(geocoder)
+        return geocoder
+
+    async def current():
+        geocoder = geocoder_module._get_geocoder()
+        await geocoder._ensure_cache()
+        assert geocoder._db is not None
+        return geocoder
+
+    monkeypatch.setattr(geocoder_module, "_geocoder", None)
+    monkeypatch.setattr(geocoder_module, "_geocoder_loop", None)
+    monkeypatch.setattr(geocoder_module, "Geocoder", make)
+
+    first = asyncio.run(current())
+    second = asyncio.run(current())
+
+    assert first is created[0] and second is created[1]
+    assert first._db is None  # Cache of the stale geocoder was flushed and closed.
+
+
+@pytest.mark.asyncio
+async def test_find_decision_maker_skips_placeholder_applicants(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("provider cascade should not run")
+
+    monkeypatch.setattr(company_enricher, "_find_decision_maker", fail)
+    permit = PermitData(
+        source="test",
+        permit_id="P-9",
+        permit_type="Fire Alarm",
+        address="PO Box 12, Austin TX",
+        status="Issued",
+    )
+    assert await find_decision_maker(Company(name="Home Owner"), None) is None
+    assert await find_decision_maker(Company(name="N/A"), None) is None
+    assert await find_decision_maker(Company(name="Acme Fire"), None, permit) is None